@@ -1,14 +1,16 @@
 from View.View import ViewManager
 from Database.DatabaseManager import DatabaseManager
-from Utils.Translator import translate_to_heb, get_word_examples
+from Database.VocabularyStore import VocabularyStore
+from Utils.Translator import lookup_word
 from tkinter import filedialog
 from tkinter import simpledialog
 from Utils.SoundUtil import play_sound
 
 class AddWordController:
-    def __init__(self, model: DatabaseManager, view: ViewManager):
+    def __init__(self, model: DatabaseManager, view: ViewManager, store: VocabularyStore):
         self.model = model
         self.view = view
+        self.store = store
         self.page = self.view.pages["add_word_page"]
         self.bind()
 
@@ -26,31 +28,30 @@ class AddWordController:
 
     def translate(self):
         eng_word = self.page.word_entry.get()
-        heb_word = translate_to_heb(eng_word)
-        examples = get_word_examples(eng_word)
+        lookup = lookup_word(eng_word)
 
-        self.page.translate_word_label.config(text=f"{eng_word}\n{heb_word}", anchor="w")
-        self.page.translate_word_examples.config(text=examples, anchor="w")
+        self.page.translate_word_label.config(text=f"{eng_word}\n{lookup.translation}", anchor="w")
+        self.page.translate_word_examples.config(text=lookup.examples, anchor="w")
 
     def add_word(self):
         eng_word = self.page.word_entry.get()
         group_name = simpledialog.askstring("Input", "Enter the group name:")
        # group_name = f"The Will of The Many 2"
-        self.model.add_word(eng_word, group_name)
+        self.store.add_word(eng_word, group_name)
 
     def add_from_text_file(self):
         filepath = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
         if filepath:
            # group_name = simpledialog.askstring("Input", "Enter the group name:")
 
-            self.model.add_from_file(filepath)
+            self.store.add_from_file(filepath)
 
     def add_from_pdf(self):
         filepath = filedialog.askopenfilename(filetypes=[("PDF Files", "*.pdf")])
         if filepath:
             #group_name = simpledialog.askstring("Input", "Enter the group name:")
 
-            self.model.add_highlight_words_from_pdf(filepath)
+            self.store.add_highlight_words_from_pdf(filepath)
 
     def switch_to_quiz(self):
         self.view.show_page(self.view.pages["quiz_page"])
@@ -65,7 +66,7 @@ class AddWordController:
         self.view.show_page(self.view.pages["flashcards_page"])
 
     def switch_page(self):
-        words_list = self.model.get_full_data()
+        words_list = self.store.all_words()
         sorted_list = sorted(words_list, key=lambda x: x[0])
         self.view.pages["all_words_page"].show_words(sorted_list)
         self.view.show_page(self.view.pages["all_words_page"])
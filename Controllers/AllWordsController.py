@@ -5,18 +5,21 @@ from tkinter import messagebox
 try:
     from View.View import ViewManager
     from Database.DatabaseManager import DatabaseManager
+    from Database.VocabularyStore import VocabularyStore
+    from Database.VocabularyEvents import VocabularyEvent
     from Controllers.WordEditDialog import WordEditDialog  # New dialog
     from Utils.DiffucltyEnum import Difficulty
 except ImportError as e:
     print(f"Import warning: {e}")
     # Define fallback types for development
-    ViewManager = DatabaseManager = WordEditDialog = Difficulty = None
+    ViewManager = DatabaseManager = VocabularyStore = VocabularyEvent = WordEditDialog = Difficulty = None
 
 
 class AllWordsController:
-    def __init__(self, model: 'DatabaseManager', view: 'ViewManager') -> None:
+    def __init__(self, model: 'DatabaseManager', view: 'ViewManager', store: 'VocabularyStore') -> None:
         self.model = model
         self.view = view
+        self.store = store
         self.page = view.pages.get("all_words_page")
 
         if self.page is None:
@@ -24,6 +27,7 @@ class AllWordsController:
 
         # Bind events and initialize
         self._bind_events()
+        self._subscribe_to_store()
 
     def _bind_events(self) -> None:
         """Bind UI events to controller methods."""
@@ -38,12 +42,43 @@ class AllWordsController:
         if hasattr(self.page, 'tree'):
             self.page.tree.bind("<Double-Button-1>", self.on_word_double_click)
 
+    def _subscribe_to_store(self) -> None:
+        """Update only the affected rows when the vocabulary changes."""
+        events = self.store.events
+        events.subscribe(VocabularyEvent.WORD_ADDED, self._on_word_added)
+        events.subscribe(VocabularyEvent.WORD_DELETED, self._on_word_deleted)
+        events.subscribe(VocabularyEvent.DIFFICULTY_CHANGED, self._on_word_changed)
+        events.subscribe(VocabularyEvent.GROUP_CHANGED, self._on_word_changed)
+        events.subscribe(VocabularyEvent.GROUP_RENAMED, self._on_group_renamed)
+        events.subscribe(VocabularyEvent.RELOADED, self._on_reloaded)
+
+    # ==================== Store Events ====================
+
+    def _on_word_added(self, word: Tuple) -> None:
+        self.page.upsert_word(word)
+
+    def _on_word_changed(self, english: str, **changes) -> None:
+        record = self.store.get(english)
+        if record is not None:
+            self.page.upsert_word(record.as_tuple())
+
+    def _on_word_deleted(self, english: str) -> None:
+        self.page.remove_word(english)
+
+    def _on_group_renamed(self, old: str, new: str) -> None:
+        self.page.rename_group(old, new)
+
+    def _on_reloaded(self) -> None:
+        # Only repopulate if the table has been shown already
+        if self.page.all_words_cache:
+            self.refresh_words()
+
     # ==================== Data Loading ====================
 
     def show_words(self) -> None:
-        """Load and display all words from the database."""
+        """Load and display all words from the shared vocabulary store."""
         try:
-            words_list = self.model.get_full_data()
+            words_list = self.store.all_words()
 
             if words_list:
                 self.page.show_words(words_list)
@@ -89,11 +124,7 @@ class AllWordsController:
             # Restore selection
             if selected_values:
                 try:
-                    for item in self.page.tree.get_children():
-                        if self.page.tree.item(item, 'values') == selected_values:
-                            self.page.tree.selection_set(item)
-                            self.page.tree.see(item)
-                            break
+                    self.page.select_word(selected_values[0])
                 except Exception as e:
                     print(f"Could not restore selection: {e}")
         else:
@@ -149,9 +180,7 @@ class AllWordsController:
                 changes_made = self._update_word_properties(word_details, new_difficulty, new_group, new_examples)
 
                 if changes_made:
-                    # Refresh display
-                    self.refresh_words()
-
+                    # The table updates itself from store events
                     # Show success message
                     self._show_info(
                         "Success",
@@ -179,16 +208,16 @@ class AllWordsController:
         if difficulty_enum:
             try:
                 # Update difficulty
-                self.model.update_difficulty(hebrew_word, difficulty_enum)
+                self.store.update_difficulty(hebrew_word, difficulty_enum)
                 changes_made = True
             except Exception as e:
                 self._show_error("Error", f"Failed to update difficulty: {e}")
                 return False
 
         # Update group if method exists
-        if hasattr(self.model, 'update_group'):
+        if hasattr(self.store, 'update_group'):
             try:
-                self.model.update_group(hebrew_word, new_group)
+                self.store.update_group(hebrew_word, new_group)
                 changes_made = True
             except Exception as e:
                 self._show_error("Error", f"Failed to update group: {e}")
@@ -200,11 +229,7 @@ class AllWordsController:
             )
 
         if new_examples is not None:
-            self.model.cursor.execute(
-                "UPDATE vocabulary SET examples = ? WHERE engWord = ?",
-                (new_examples, word_details[1])
-            )
-            self.model.connection.commit()
+            self.store.update_examples(word_details[1], new_examples)
 
         return changes_made
 
@@ -239,7 +264,7 @@ class AllWordsController:
 
         # Delete from database
         try:
-            success = self.model.delete_word(english_word)
+            success = self.store.delete_word(english_word)
 
             if success:
                 messagebox.showinfo(
@@ -247,8 +272,6 @@ class AllWordsController:
                     f"Word '{english_word}' has been deleted.",
                     parent=self.page
                 )
-                # Refresh the display
-                self.show_words()
             else:
                 messagebox.showerror(
                     "Error",
@@ -264,20 +287,7 @@ class AllWordsController:
 
     def _get_available_groups(self) -> List[str]:
         try:
-            # Check if method exists
-            if hasattr(self.model, 'get_all_groups'):
-                groups = self.model.get_all_groups()
-                return sorted(set(groups)) if groups else []
-
-            # Fallback: extract groups from full data
-            words = self.model.get_full_data()
-            groups = set()
-
-            for word in words:
-                if len(word) >= 4 and word[3]:  # Has group
-                    groups.add(word[3])
-
-            return sorted(groups)
+            return sorted(group for group in self.store.group_names() if group)
 
         except Exception as e:
             print(f"Error getting groups: {e}")
@@ -288,13 +298,8 @@ class AllWordsController:
             # Fallback if enum not available
             return difficulty_str.upper()
 
-        difficulty_map = {
-            "Easy": Difficulty.EASY.name,
-            "Medium": Difficulty.MEDIUM.name,
-            "Hard": Difficulty.HARD.name
-        }
-
-        return difficulty_map.get(difficulty_str)
+        difficulty = Difficulty.from_name(difficulty_str)
+        return difficulty.name if difficulty else None
 
     # ==================== Navigation ====================
 
@@ -347,8 +352,8 @@ class AllWordsController:
 # ==================== Enhanced Controller (Optional) ====================
 
 class EnhancedAllWordsController(AllWordsController):
-    def __init__(self, model: 'DatabaseManager', view: 'ViewManager') -> None:
-        super().__init__(model, view)
+    def __init__(self, model: 'DatabaseManager', view: 'ViewManager', store: 'VocabularyStore') -> None:
+        super().__init__(model, view, store)
         self._setup_enhanced_features()
 
     def _setup_enhanced_features(self) -> None:
@@ -358,8 +363,8 @@ class EnhancedAllWordsController(AllWordsController):
 
     def create_new_group(self, group_name: str) -> bool:
         try:
-            if hasattr(self.model, 'create_group'):
-                self.model.create_group(group_name)
+            if hasattr(self.store, 'create_group'):
+                self.store.create_group(group_name)
                 return True
             return False
         except Exception as e:
@@ -368,9 +373,8 @@ class EnhancedAllWordsController(AllWordsController):
 
     def rename_group(self, old_name: str, new_name: str) -> bool:
         try:
-            if hasattr(self.model, 'rename_group'):
-                self.model.rename_group(old_name, new_name)
-                self.refresh_words()
+            if hasattr(self.store, 'rename_group'):
+                self.store.rename_group(old_name, new_name)
                 return True
             return False
         except Exception as e:
@@ -379,9 +383,8 @@ class EnhancedAllWordsController(AllWordsController):
 
     def delete_group(self, group_name: str, reassign_to: Optional[str] = None) -> bool:
         try:
-            if hasattr(self.model, 'delete_group'):
-                self.model.delete_group(group_name, reassign_to)
-                self.refresh_words()
+            if hasattr(self.store, 'delete_group'):
+                self.store.delete_group(group_name, reassign_to)
                 return True
             return False
         except Exception as e:
@@ -390,7 +393,7 @@ class EnhancedAllWordsController(AllWordsController):
 
     def export_words(self, filename: str) -> bool:
         try:
-            words = self.model.get_full_data()
+            words = self.store.all_words()
             # Implement export logic
             # Could support CSV, JSON, etc.
             return True
@@ -399,7 +402,7 @@ class EnhancedAllWordsController(AllWordsController):
             return False
 
     def get_statistics(self) -> dict:
-        words = self.model.get_full_data()
+        words = self.store.all_words()
 
         return {
             "total": len(words),
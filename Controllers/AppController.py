@@ -1,5 +1,6 @@
 from View.View import ViewManager
 from Database.DatabaseManager import DatabaseManager
+from Database.VocabularyStore import VocabularyStore
 from Controllers.AddWordController import AddWordController
 from Controllers.AllWordsController import AllWordsController
 from Controllers.QuizController import QuizController
@@ -7,16 +8,30 @@ from Controllers.FillBlankQuizController import FillBlankQuizController
 from Controllers.FlashcardsController import FlashcardsController
 from Controllers.GrammarCheckController import GrammarCheckController
 
+# How often buffered answers are checked for age (see ReviewLog.FLUSH_INTERVAL)
+REVIEW_FLUSH_CHECK_MS = 5000
+
 class AppController:
     def __init__(self, model: DatabaseManager, view: ViewManager):
         self.model = model
         self.view = view
-        self.add_word_controller = AddWordController(model, view)
-        self.all_words_controller = AllWordsController(model, view)
-        self.quiz_controller = QuizController(model, view)
-        self.fill_blank_controller = FillBlankQuizController(model, view)
-        self.flashcards_controller = FlashcardsController(model, view)
+
+        # One in-memory copy of the vocabulary, shared by all controllers
+        self.store = VocabularyStore(model)
+
+        self.add_word_controller = AddWordController(model, view, self.store)
+        self.all_words_controller = AllWordsController(model, view, self.store)
+        self.quiz_controller = QuizController(model, view, self.store)
+        self.fill_blank_controller = FillBlankQuizController(model, view, self.store)
+        self.flashcards_controller = FlashcardsController(model, view, self.store)
         self.grammar_check_controller = GrammarCheckController(model, view)
 
+        self.view.after(REVIEW_FLUSH_CHECK_MS, self._flush_due_reviews)
+
+    def _flush_due_reviews(self) -> None:
+        """Timer: write answers that have waited long enough, even if no new answer comes in."""
+        self.model.flush_due_reviews()
+        self.view.after(REVIEW_FLUSH_CHECK_MS, self._flush_due_reviews)
+
 
 
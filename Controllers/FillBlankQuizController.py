@@ -466,88 +466,25 @@
 
 
 import random
-import re
+import time
 from typing import Dict, Tuple, List, Optional
 from tkinter import messagebox
-
-
-# ==================== Improved Word Matcher ====================
-
-class WordMatcher:
-    """
-    Fuzzy word matching for finding examples with word variations.
-
-    Handles:
-    - Regular suffixes (jump → jumping, jumped, jumps)
-    - Double consonants (run → running, stop → stopping)
-    - Y to IES (baby → babies)
-    - E-dropping (make → making)
-    """
-
-    @staticmethod
-    def get_possible_forms(word: str) -> List[str]:
-        """Generate all possible forms of a word."""
-        word = word.lower()
-        forms = [word]  # Base form
-
-        # 1. Y → IES for plurals (baby → babies)
-        if word.endswith('y') and len(word) > 2:
-            forms.append(word[:-1] + 'ies')
-
-        # 2. Double consonant before ING/ED (run → running)
-        if len(word) >= 3:
-            last = word[-1]
-            second_last = word[-2]
-
-            if (last in 'bcdfghjklmnpqrstvwxyz' and
-                    second_last in 'aeiou'):
-                forms.extend([
-                    word + last + 'ing',  # running
-                    word + last + 'ed',  # stopped
-                    word + last + 'er',  # runner
-                ])
-
-        # 3. E-dropping (make → making)
-        if word.endswith('e') and len(word) > 2:
-            stem = word[:-1]
-            forms.append(stem + 'ing')
-
-        # 4. Regular forms
-        forms.extend([
-            word + 's', word + 'es', word + 'ing', word + 'ed',
-            word + 'd', word + 'er', word + 'est', word + 'ly', word + 'en'
-        ])
-
-        return list(set(forms))
-
-    @staticmethod
-    def create_pattern(word: str, fuzzy: bool = True) -> str:
-        """Create regex pattern matching all word forms."""
-        if not fuzzy:
-            return r'\b' + re.escape(word) + r'\b'
-
-        forms = WordMatcher.get_possible_forms(word)
-        forms.sort(key=len, reverse=True)  # Longest first
-        escaped = [re.escape(f) for f in forms]
-        return r'\b(?:' + '|'.join(escaped) + r')\b'
-
-    @staticmethod
-    def word_matches(word: str, text: str, fuzzy: bool = True) -> bool:
-        """Check if word (or any form) appears in text."""
-        pattern = WordMatcher.create_pattern(word, fuzzy=fuzzy)
-        return bool(re.search(pattern, text, re.IGNORECASE))
+from Database.VocabularyEvents import VocabularyEvent
+from Database.ReviewLog import MODE_FILL_BLANK
+from Utils.Scheduler import GRADE_AGAIN, grade_answer, elapsed_ms
+from Utils.WeightedSampler import SessionPicker, candidate_limit
 
 
 # ==================== Fill Blank Quiz Controller ====================
 
 class FillBlankQuizController:
-    def __init__(self, model, view):
+    def __init__(self, model, view, store):
         self.model = model
         self.view = view
+        self.store = store
         self.page = self.view.pages["fill_blank_quiz_page"]
 
-        # Word storage - (eng, heb, difficulty, examples)
-        self.words_with_examples: List[Tuple] = []
+        # Word storage
         self.all_words: List[str] = []  # All English words for wrong options
 
         # Quiz state
@@ -555,12 +492,16 @@ class FillBlankQuizController:
         self.current_hebrew: str = ""  # Hebrew translation
         self.current_sentence: str = ""
         self.current_difficulty: str = ""
-        self.filtered_words: List[Tuple] = []
+        self.filtered_words: List[Tuple] = []  # Words asked so far, in order
+        self.picker = SessionPicker([], {})
+        # Prepared sentences of the session's words - {lowercase word: [(sentence, start, end)]}
+        self.cloze_items: Dict[str, List[Tuple[str, int, int]]] = {}
         self.word_index: int = 0
         self.total_questions: int = 0
         self.new_quiz: bool = True
         self.answer_selected: bool = False
         self.difficulties: List[str] = []
+        self.question_shown_at: Optional[float] = None  # time.monotonic()
 
         # Statistics
         self.correct_count: int = 0
@@ -568,10 +509,12 @@ class FillBlankQuizController:
 
         # Quiz configuration
         self.max_questions: Optional[int] = None
+        self.selected_groups: Optional[List[str]] = None
 
         # Initialize
         self.init_words()
         self.bind()
+        self._subscribe_to_store()
 
         # Show welcome or start quiz
         self._show_welcome_message()
@@ -581,38 +524,66 @@ class FillBlankQuizController:
         self.quiz_configured = False
 
     def init_words(self):
-        """Load words with examples from database."""
+        """Load the words for wrong options from the shared vocabulary store."""
         try:
-            # Get all word details
-            query = "SELECT engWord, hebWord, difficulty, examples, group_name FROM vocabulary WHERE examples IS NOT NULL AND examples != ''"
-            self.model.cursor.execute(query)
-            results = self.model.cursor.fetchall()
+            self.all_words = self.store.english_words()
 
-            # Filter words that have examples
-            for eng, heb, diff, examples, group in results:
-                if examples and examples.strip():
-                    self.words_with_examples.append((eng, heb, diff, examples, group))
+        except Exception as e:
+            print(f"Error loading words: {e}")
 
-            # Get all words for generating wrong options
-            all_data = self.model.cursor.execute("SELECT engWord FROM vocabulary")
-            self.all_words = [row[0] for row in all_data.fetchall()]
+    def _subscribe_to_store(self):
+        """Keep the loaded word lists in sync with edits made elsewhere."""
+        events = self.store.events
+        events.subscribe(VocabularyEvent.WORD_ADDED, self._on_word_added)
+        events.subscribe(VocabularyEvent.WORD_DELETED, self._on_word_deleted)
+        events.subscribe(VocabularyEvent.DIFFICULTY_CHANGED, self._on_word_changed)
+        events.subscribe(VocabularyEvent.GROUP_CHANGED, self._on_word_changed)
+        events.subscribe(VocabularyEvent.EXAMPLES_CHANGED, self._on_examples_changed)
+        events.subscribe(VocabularyEvent.RELOADED, self.init_words)
+
+    def _on_word_added(self, word: Tuple):
+        self.all_words.append(word[0])
+
+    def _on_word_deleted(self, english: str):
+        if english in self.all_words:
+            self.all_words.remove(english)
+
+        # Only questions not yet asked can be dropped
+        self.picker.discard(english)
+        self.total_questions = min(self.total_questions, len(self.filtered_words) + len(self.picker))
+
+    def _on_examples_changed(self, english: str, examples: str):
+        """Reload the word's prepared sentences; drop it from the session if none are left."""
+        key = english.lower()
+        if key in self.cloze_items:
+            items = self.model.get_cloze_items([english]).get(key)
+            if items:
+                self.cloze_items[key] = items
+            else:
+                del self.cloze_items[key]
+                self.picker.discard(english)
+                self.total_questions = min(self.total_questions, len(self.filtered_words) + len(self.picker))
 
-            print(f"Loaded {len(self.words_with_examples)} words with examples")
+        self._on_word_changed(english)
 
-        except Exception as e:
-            print(f"Error loading words: {e}")
+    def _on_word_changed(self, english: str, **changes):
+        record = self.store.get(english)
+        if record is None:
+            return
+
+        updated = record.as_example_tuple()
+        for i, word in enumerate(self.filtered_words):
+            if word[0] == english:
+                self.filtered_words[i] = updated
 
     def bind(self):
         """Bind UI events."""
-        print("Binding Fill-in-Blank quiz events...")  # DEBUG
-
         self.page.back_btn.config(command=self.go_back)
         self.page.next_btn.config(command=self.next_question)
 
         # Answer buttons - bind each one explicitly
         for i, btn in enumerate(self.page.option_buttons):
             btn.config(command=lambda idx=i: self._on_button_click(idx))
-            print(f"Bound button {i}")  # DEBUG
 
         # Control buttons
         self.page.select_groups_btn.config(command=self.select_groups)
@@ -626,7 +597,6 @@ class FillBlankQuizController:
 
     def _on_button_click(self, button_index):
         """Handle button click."""
-        print(f"Button {button_index} clicked!")  # DEBUG
         btn = self.page.option_buttons[button_index]
         self.check_answer(button_index, btn)
 
@@ -661,8 +631,7 @@ class FillBlankQuizController:
             from View.QuizSetupDialog import QuizSetupDialog
 
             # Get available groups
-            groups_data = self.model.get_all_groups_names()
-            groups = [row[0] for row in groups_data] if groups_data else []
+            groups = self.store.group_names()
 
             # Show dialog
             dialog = QuizSetupDialog(self.view, groups, self.model)
@@ -719,6 +688,7 @@ class FillBlankQuizController:
     def go_back(self):
         """Go back to home page."""
         self.quiz_configured = False
+        self.model.flush_reviews()
         self.view.show_page(self.view.pages["add_word_page"])
 
     # ==================== Quiz Flow ====================
@@ -730,8 +700,13 @@ class FillBlankQuizController:
             self._initialize_quiz()
 
         # Check if words available
-        if not self.filtered_words:
-            self._show_no_words()
+        word_data = self._next_word()
+        if word_data is None:
+            if self.word_index:
+                # Words removed mid-session - nothing left to ask
+                self._show_quiz_complete()
+            else:
+                self._show_no_words()
             return
 
         # Reset state
@@ -741,26 +716,17 @@ class FillBlankQuizController:
         self.page.disable_next_button()
 
         # Get word and example
-        word_data = self.filtered_words[self.word_index]
         self.current_word = word_data[0]
         self.current_hebrew = word_data[1]  # Store Hebrew translation
         self.current_difficulty = word_data[2]
-        examples = word_data[3]
-
-        # Extract first sentence from examples (WITH FUZZY MATCHING)
-        self.current_sentence = self._extract_sentence(examples, self.current_word)
 
-        if not self.current_sentence:
-            # No valid sentence, skip to next
-            self.word_index += 1
-            if self.word_index < self.total_questions:
-                self.new_question()
-            else:
-                self._show_quiz_complete()
-            return
+        # A prepared sentence and the span of the word in it (see ClozeItems).
+        # Every word drawn has at least one - checked in _next_word().
+        cloze = random.choice(self.cloze_items[self.current_word.lower()])
 
         # Replace word with blank
-        blank_sentence = self._create_blank_sentence(self.current_sentence, self.current_word)
+        self.current_sentence, blank_start, blank_end = cloze
+        blank_sentence = self.current_sentence[:blank_start] + "_____" + self.current_sentence[blank_end:]
 
         # Generate options
         options = self._generate_options()
@@ -770,6 +736,7 @@ class FillBlankQuizController:
         self.page.show_options(options)
         self.page.update_progress(self.word_index + 1, self.total_questions)
         self.page.update_difficulty_badge(self.current_difficulty)
+        self.question_shown_at = time.monotonic()
 
     def next_question(self):
         """Move to next question."""
@@ -783,6 +750,12 @@ class FillBlankQuizController:
             # No answer selected, count as wrong
             self.wrong_count += 1
             self.page.update_stats(self.correct_count, self.wrong_count)
+            if self.current_word:
+                self.model.record_review(self.current_word, GRADE_AGAIN)
+                self.model.log_review(self.current_word, MODE_FILL_BLANK, False,
+                                      response_ms=elapsed_ms(self.question_shown_at))
+                self.picker.record_answer(self.current_word, False,
+                                          requeue=self.current_word.lower() in self.cloze_items)
 
         # Check if quiz complete
         if self.word_index >= self.total_questions:
@@ -795,79 +768,39 @@ class FillBlankQuizController:
         self.filter_difficulties()
         self.page.res_label.config(text="")
 
-        # Filter words by difficulty
-        self.filtered_words = [
-            word for word in self.words_with_examples
-            if word[2] in self.difficulties
-        ]
+        # Candidates: the most due words with a usable sentence, a few per question asked.
+        # The database only returns playable words, so total_questions is right.
+        candidates = []
+        if self.difficulties:
+            limit = candidate_limit(self.max_questions)
+            due_words = self.model.get_due_words(limit, self.selected_groups,
+                                                 self.difficulties, with_cloze=True)
+            candidates = [eng for eng, heb, difficulty, group in due_words]
 
-        # Apply question limit
-        if self.max_questions and len(self.filtered_words) > self.max_questions:
-            random.shuffle(self.filtered_words)
-            self.filtered_words = self.filtered_words[:self.max_questions]
-        else:
-            random.shuffle(self.filtered_words)
+        # Every candidate's sentences in one query, so each question is a dictionary lookup
+        self.cloze_items = self.model.get_cloze_items(candidates)
+
+        # Questions are drawn one at a time, weighted towards words often missed
+        self.picker = SessionPicker(candidates, self.model.get_review_summary())
+        self.filtered_words = []
 
         self.new_quiz = False
         self.word_index = 0
-        self.total_questions = len(self.filtered_words)
-
-    def _extract_sentence(self, examples: str, word: str) -> str:
-        """
-        Extract a sentence containing the word (or its variations) from examples.
-
-        🌟 WITH FUZZY MATCHING! 🌟
-
-        Matches:
-        - jump → jumping, jumped, jumps
-        - corridor → corridors
-        - baby → babies
-        - run → running, runner
-        """
-        if not examples:
-            return ""
-
-        # Split into sentences
-        sentences = re.split(r'[\n]+', examples)
-        matches = []
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 10:  # Too short
-                continue
-
-            # 🌟 FUZZY MATCHING - matches word variations! 🌟
-            if WordMatcher.word_matches(word, sentence, fuzzy=True):
-                matches.append(sentence)
-
-        # Return random match if any found
-        if matches:
-            return random.choice(matches)
-        else:
-            return ""
-
-    def _create_blank_sentence(self, sentence: str, word: str) -> str:
-        """
-        Replace the word (or its variation) with a blank.
-
-        🌟 WITH FUZZY MATCHING! 🌟
-
-        Examples:
-        - "He is jumping" → "He is _____" (word is "jump")
-        - "The corridors" → "The _____" (word is "corridor")
-        - "The babies" → "The _____" (word is "baby")
-        """
-        # Find the actual word in the sentence using fuzzy matching
-        pattern = WordMatcher.create_pattern(word, fuzzy=True)
-        match = re.search(pattern, sentence, re.IGNORECASE)
-
-        if match:
-            # Replace with blank
-            blank_sentence = sentence[:match.start()] + "_____" + sentence[match.end():]
-            return blank_sentence
-        else:
-            # Fallback: shouldn't happen
-            return sentence.replace(word, "_____")
+        self.total_questions = min(self.max_questions or len(candidates), len(candidates))
+
+    def _next_word(self) -> Optional[Tuple]:
+        """(eng, heb, difficulty, examples, group) for question word_index, drawing a new one if needed."""
+        # Skips words deleted mid-session - a loop, so any number of skips is safe
+        while self.word_index >= len(self.filtered_words):
+            word = self.picker.draw()
+            if word is None:
+                return None
+
+            record = self.store.get(word)
+            if record is not None:
+                self.filtered_words.append(record.as_example_tuple())
+
+        return self.filtered_words[self.word_index]
 
     def _generate_options(self) -> List[str]:
         """Generate 4 options including correct answer."""
@@ -900,6 +833,8 @@ class FillBlankQuizController:
 
     def _show_quiz_complete(self):
         """Show quiz complete dialog."""
+        self.model.flush_reviews()
+
         try:
             from View.QuizResultsDialog import QuizResultsDialog
 
@@ -923,14 +858,11 @@ class FillBlankQuizController:
         if self.answer_selected:
             return
 
-        print(f"Checking answer: button {button_index}")  # DEBUG
-
         self.answer_selected = True
+        response_ms = elapsed_ms(self.question_shown_at)
         selected = button.cget("text")
         is_correct = (selected.lower() == self.current_word.lower())
 
-        print(f"Selected: {selected}, Correct: {self.current_word}, Is Correct: {is_correct}")  # DEBUG
-
         # Update stats
         if is_correct:
             self.correct_count += 1
@@ -941,6 +873,11 @@ class FillBlankQuizController:
                 self.mistakes = []
             self.mistakes.append((self.current_word, selected, self.current_word))
 
+        self.model.record_review(self.current_word, grade_answer(is_correct, response_ms))
+        self.model.log_review(self.current_word, MODE_FILL_BLANK, is_correct, selected, response_ms)
+        self.picker.record_answer(self.current_word, is_correct,
+                                  requeue=self.current_word.lower() in self.cloze_items)
+
         self.page.update_stats(self.correct_count, self.wrong_count)
 
         # Visual feedback - highlight the clicked button
@@ -970,8 +907,6 @@ class FillBlankQuizController:
             self.current_hebrew  # Pass Hebrew translation
         )
 
-        print("Answer checked and result shown")  # DEBUG
-
     # ==================== Difficulty ====================
 
     def filter_difficulties(self):
@@ -994,8 +929,7 @@ class FillBlankQuizController:
         try:
             from View.QuizPage import GroupSelectionDialog
 
-            groups_data = self.model.get_all_groups_names()
-            groups = [row[0] for row in groups_data]
+            groups = self.store.group_names()
 
             if not groups:
                 self.page.res_label.config(text="No groups available", fg="#666")
@@ -1016,11 +950,7 @@ class FillBlankQuizController:
     def _filter_by_groups(self, selected_groups: List[str]):
         """Filter words by groups."""
         try:
-            # Filter words_with_examples by groups
-            self.words_with_examples = [
-                word for word in self.words_with_examples
-                if word[4] in selected_groups  # group is index 4
-            ]
+            self.selected_groups = list(selected_groups)
 
             self.new_quiz = True
 
@@ -1,19 +1,29 @@
 
 import random
+import time
 from typing import List, Tuple, Optional
 from tkinter import messagebox
+from Database.VocabularyEvents import VocabularyEvent
+from Database.ReviewLog import MODE_FLASHCARDS
+from Utils.DiffucltyEnum import Difficulty
+from Utils.Scheduler import GRADE_AGAIN, GRADE_HARD, GRADE_EASY, elapsed_ms
 
 
 class FlashcardsController:
-    def __init__(self, model, view):
+    # Cards per session when no words are given
+    SESSION_SIZE = 50
+
+    def __init__(self, model, view, store):
         self.model = model
         self.view = view
+        self.store = store
         self.page = self.view.pages["flashcards_page"]
         
         # Session data
         self.words: List[Tuple] = []  # (english, hebrew, difficulty, group)
         self.current_index: int = 0
         self.total_words: int = 0
+        self.card_shown_at: Optional[float] = None  # time.monotonic()
         
         # Statistics
         self.know_count: int = 0
@@ -25,6 +35,9 @@ class FlashcardsController:
         
         # Bind events
         self.bind()
+        self.store.events.subscribe(VocabularyEvent.WORD_DELETED, self._on_word_deleted)
+        self.store.events.subscribe(VocabularyEvent.DIFFICULTY_CHANGED, self._on_word_changed)
+        self.store.events.subscribe(VocabularyEvent.GROUP_CHANGED, self._on_word_changed)
         
         # Auto-start session when page becomes visible
         self.page.bind("<Visibility>", self._on_page_visible)
@@ -41,6 +54,23 @@ class FlashcardsController:
         self.page.bind("<Left>", lambda e: self.rate_word("dont_know"))
         self.page.bind("<Right>", lambda e: self.rate_word("dont_know"))
 
+    # ==================== Store Events ====================
+
+    def _on_word_deleted(self, english: str):
+        """Drop a deleted word from the cards still to come."""
+        upcoming = [w for w in self.words[self.current_index + 1:] if w[0] != english]
+        self.words[self.current_index + 1:] = upcoming
+        self.total_words = len(self.words)
+
+    def _on_word_changed(self, english: str, **changes):
+        record = self.store.get(english)
+        if record is None:
+            return
+
+        for i, word in enumerate(self.words):
+            if word[0] == english:
+                self.words[i] = record.as_tuple()
+
     # ==================== Session Management ====================
     
     def start_session(self, words: Optional[List[Tuple]] = None):
@@ -49,11 +79,11 @@ class FlashcardsController:
         
         Args:
             words: Optional list of words to study.
-                   If None, loads all words from database.
+                   If None, uses the SESSION_SIZE words most due for review.
         """
         # Load words
         if words is None:
-            words = self.model.get_full_data()
+            words = self.model.get_due_words(self.SESSION_SIZE)
         
         if not words:
             self.page.show_welcome_message()
@@ -97,6 +127,7 @@ class FlashcardsController:
         # Display card
         self.page.show_word(english, hebrew, difficulty)
         self.page.update_progress(self.current_index + 1, self.total_words)
+        self.card_shown_at = time.monotonic()
     
     def next_card(self):
         """Move to the next card."""
@@ -110,6 +141,7 @@ class FlashcardsController:
     def end_session(self):
         """End the flashcard session and show results."""
         self.page.disable_buttons()
+        self.model.flush_reviews()
         
         # Calculate accuracy
         total_rated = self.know_count + self.guess_count + self.dont_know_count
@@ -158,16 +190,26 @@ class FlashcardsController:
         
         # Map rating to difficulty
         difficulty_map = {
-            "know": "EASY",
-            "guess": "MEDIUM",
-            "dont_know": "HARD"
+            "know": Difficulty.EASY,
+            "guess": Difficulty.MEDIUM,
+            "dont_know": Difficulty.HARD
         }
         
-        new_difficulty = difficulty_map.get(rating, "MEDIUM")
+        new_difficulty = difficulty_map.get(rating, Difficulty.MEDIUM).name
         
-        # Update difficulty in database
+        grade_map = {
+            "know": GRADE_EASY,
+            "guess": GRADE_HARD,
+            "dont_know": GRADE_AGAIN
+        }
+
+        # Update difficulty and review schedule in database
         try:
-            self.model.update_difficulty(english, new_difficulty)
+            self.store.update_difficulty(english, new_difficulty)
+            self.model.record_review(english, grade_map.get(rating, GRADE_HARD))
+            # The rating is the user's own grade, so the time is only recorded
+            self.model.log_review(english, MODE_FLASHCARDS, rating == "know", rating,
+                                  elapsed_ms(self.card_shown_at))
         except Exception as e:
             print(f"Error updating difficulty: {e}")
         
@@ -198,6 +240,7 @@ class FlashcardsController:
             if not result:
                 return
         
+        self.model.flush_reviews()
         self.view.show_page(self.view.pages["add_word_page"])
     
     # ==================== Advanced Features ====================
@@ -213,30 +256,11 @@ class FlashcardsController:
             groups: List of groups to include
             max_cards: Maximum number of cards (None = all)
         """
-        # Get all words
-        all_words = list(self.model.get_full_data())
-        
-        # Filter by difficulty
-        if difficulties:
-            all_words = [
-                word for word in all_words
-                if len(word) > 2 and word[2] in difficulties
-            ]
-        
-        # Filter by groups
-        if groups:
-            all_words = [
-                word for word in all_words
-                if len(word) > 3 and word[3] in groups
-            ]
-        
-        # Limit number of cards
-        if max_cards and len(all_words) > max_cards:
-            random.shuffle(all_words)
-            all_words = all_words[:max_cards]
+        # Most due words first, filtered and limited in the database
+        due_words = self.model.get_due_words(max_cards, groups, difficulties)
         
         # Start session with filtered words
-        self.start_session(all_words)
+        self.start_session(due_words)
     
     def _on_page_visible(self, event):
         """Start session when page becomes visible."""
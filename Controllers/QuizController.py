@@ -2,11 +2,18 @@
 Quiz Controller
 """
 import random
-from typing import Dict, Tuple, List, Optional
+import time
+from typing import Tuple, List, Optional
 from tkinter import messagebox
 from View.View import ViewManager
 from Database.DatabaseManager import DatabaseManager
+from Database.VocabularyStore import VocabularyStore
+from Database.VocabularyEvents import VocabularyEvent
+from Database.ReviewLog import MODE_QUIZ
 from Utils.DiffucltyEnum import Difficulty
+from Utils.DistractorPool import DistractorPool
+from Utils.Scheduler import GRADE_AGAIN, grade_answer, elapsed_ms
+from Utils.WeightedSampler import SessionPicker, candidate_limit
 from View.QuizPage import DifficultyDialog, GroupSelectionDialog
 from View.QuizSetupDialog import QuizSetupDialog
 from View.QuizResultsDialog import QuizResultsDialog
@@ -16,26 +23,27 @@ class QuizController:
     """
     Controller for Quiz page.
     """
-
-    def __init__(self, model: DatabaseManager, view: ViewManager):
+    def __init__(self, model: DatabaseManager, view: ViewManager, store: VocabularyStore):
         self.model = model
         self.view = view
+        self.store = store
         self.page = self.view.pages["quiz_page"]
 
-        # Word storage
-        self.words_dict: Dict[str, Tuple[str, str]] = {}
-        self.all_words_dict: Dict[str, Tuple[str, str]] = {}
+        # Group filter (None = all groups) - words come from the shared store
+        self.selected_groups: Optional[List[str]] = None
 
         # Quiz state
         self.curr_ans: str = ""
         self.curr_eng_word: str = ""
-        self.filtered_words: List[str] = []
+        self.filtered_words: List[str] = []  # Words asked so far, in order
+        self.picker = SessionPicker([], {})
         self.word_index: int = 0
         self.total_questions: int = 0
         self.new_quiz: bool = True
         self.answer_selected: bool = False
         self.difficulties: List[str] = []
         self.quiz_configured: bool = False  # Track if quiz has been configured
+        self.question_shown_at: Optional[float] = None  # time.monotonic()
 
         # Statistics
         self.correct_count: int = 0
@@ -47,9 +55,15 @@ class QuizController:
         # Quiz configuration
         self.max_questions: Optional[int] = None
 
+        # Wrong answers to choose from - kept in sync with the store
+        self.distractors = DistractorPool(self.store.all_words())
+
         # Initialize
-        self.init_words_dict()
         self.bind()
+        self.store.events.subscribe(VocabularyEvent.WORD_ADDED, self._on_word_added)
+        self.store.events.subscribe(VocabularyEvent.WORD_DELETED, self._on_word_deleted)
+        self.store.events.subscribe(VocabularyEvent.GROUP_RENAMED, self._on_group_renamed)
+        self.store.events.subscribe(VocabularyEvent.RELOADED, self._on_reloaded)
 
         # Show welcome message
         self._show_welcome_message()
@@ -118,22 +132,11 @@ class QuizController:
 
     # ==================== Initialization ====================
 
-    def init_words_dict(self):
-        """Load words from database."""
-        try:
-            words_list = self.model.get_full_data()
-            for eng_word, heb_word, difficulty, group_name in words_list:
-                self.words_dict[eng_word] = (heb_word, difficulty)
-                self.all_words_dict[eng_word] = (heb_word, difficulty)
-        except Exception as e:
-            print(f"Error loading words: {e}")
-
     def show_setup_dialog(self):
         """Show quiz setup dialog."""
         try:
             # Get available groups
-            groups_data = self.model.get_all_groups_names()
-            groups = [row[0] for row in groups_data] if groups_data else []
+            groups = self.store.group_names()
 
             # Show setup dialog
             dialog = QuizSetupDialog(self.view, groups, self.model)
@@ -202,8 +205,28 @@ class QuizController:
     def go_back(self):
         """Go back to home page."""
         self.quiz_configured = False  # Reset for next time
+        self.model.flush_reviews()
         self.view.show_page(self.view.pages["add_word_page"])
 
+    # ==================== Store Events ====================
+
+    def _on_word_added(self, word: Tuple) -> None:
+        self.distractors.add(word[0], word[1])
+
+    def _on_reloaded(self) -> None:
+        self.distractors.rebuild(self.store.all_words())
+
+    def _on_word_deleted(self, english: str) -> None:
+        """Drop a deleted word from the questions that haven't been asked yet."""
+        self.distractors.remove(english)
+        self.picker.discard(english)
+        self.total_questions = min(self.total_questions, len(self.filtered_words) + len(self.picker))
+
+    def _on_group_renamed(self, old: str, new: str) -> None:
+        """Keep the group filter pointing at the renamed group."""
+        if self.selected_groups and old in self.selected_groups:
+            self.selected_groups = [new if group == old else group for group in self.selected_groups]
+
     # ==================== Quiz Flow ====================
 
     def new_word_quiz(self):
@@ -213,7 +236,8 @@ class QuizController:
             self._initialize_quiz()
 
         # Check if words available
-        if not self.filtered_words:
+        word = self._next_word()
+        if word is None:
             self._show_no_words()
             return
 
@@ -223,9 +247,10 @@ class QuizController:
         self.answer_selected = False
 
         # Get word
-        self.curr_eng_word = self.filtered_words[self.word_index]
-        self.curr_ans = self.words_dict[self.curr_eng_word][0]
-        difficulty = self.words_dict[self.curr_eng_word][1]
+        self.curr_eng_word = word
+        record = self.store.get(self.curr_eng_word)
+        self.curr_ans = record.hebrew
+        difficulty = record.difficulty
 
         # Update UI
         self.page.update_difficulty_badge(difficulty)
@@ -234,6 +259,7 @@ class QuizController:
         self.page.update_progress(self.word_index, self.total_questions)
         self.page.show_options(self.curr_eng_word, self.curr_ans, options)
         play_sound(self.curr_eng_word)
+        self.question_shown_at = time.monotonic()
         self.page.next_btn.config(state="enabled")
 
     def next_question(self):
@@ -241,6 +267,12 @@ class QuizController:
         if not self.answer_selected:
             self.wrong_count += 1
             self.page.update_stats(self.correct_count, self.wrong_count)
+            # A skipped word counts as a failed review
+            if self.curr_eng_word:
+                self.model.record_review(self.curr_eng_word, GRADE_AGAIN)
+                self.model.log_review(self.curr_eng_word, MODE_QUIZ, False,
+                                      response_ms=elapsed_ms(self.question_shown_at))
+                self.picker.record_answer(self.curr_eng_word, False)
 
         self.new_word_quiz()
 
@@ -249,37 +281,39 @@ class QuizController:
         self.filter_difficulties()
         self.page.res_label.config(text="")
 
-        # Filter words
-        self.filtered_words = [
-            word for word in self.words_dict.keys()
-            if self.words_dict[word][1] in self.difficulties
-        ]
+        # Candidates: the most due words, a few per question asked
+        candidates = []
+        if self.difficulties:
+            limit = candidate_limit(self.max_questions)
+            due_words = self.model.get_due_words(limit, self.selected_groups, self.difficulties)
+            candidates = [eng for eng, heb, difficulty, group in due_words]
 
-        # Apply question limit if set
-        if self.max_questions and len(self.filtered_words) > self.max_questions:
-            random.shuffle(self.filtered_words)
-            self.filtered_words = self.filtered_words[:self.max_questions]
-        else:
-            random.shuffle(self.filtered_words)
+        # Questions are drawn one at a time, weighted towards words often missed
+        self.picker = SessionPicker(candidates, self.model.get_review_summary())
+        self.filtered_words = []
 
         self.new_quiz = False
         self.word_index = 0
-        self.total_questions = len(self.filtered_words)
+        self.total_questions = min(self.max_questions or len(candidates), len(candidates))
+
+    def _next_word(self) -> Optional[str]:
+        """The word for question word_index, drawing a new one if needed."""
+        if self.word_index >= len(self.filtered_words):
+            word = self.picker.draw()
+            if word is None:
+                return None
+            self.filtered_words.append(word)
+
+        return self.filtered_words[self.word_index]
 
     def _generate_options(self) -> List[str]:
         """Generate 4 answer options."""
-        attempts = 0
-        while attempts < 10:
-            others = random.sample(list(self.all_words_dict.values()), 3)
-            options = [v[0] for v in others]
-            options.append(self.curr_ans)
-
-            if len(set(options)) == 4:
-                random.shuffle(options)
-                return options
-            attempts += 1
-
-        options = [self.curr_ans, "---", "---", "---"]
+        # 3 distinct translations, none equal to the answer
+        options = self.distractors.sample(3, exclude=self.curr_ans)
+        options.append(self.curr_ans)
+
+        # Tiny vocabularies: pad with placeholders
+        options += ["---"] * (4 - len(options))
         random.shuffle(options)
         return options
 
@@ -299,6 +333,7 @@ class QuizController:
             return
 
         self.answer_selected = True
+        response_ms = elapsed_ms(self.question_shown_at)
         selected = button.cget("text")
         is_correct = (selected == self.curr_ans)
 
@@ -310,6 +345,10 @@ class QuizController:
             # Track mistake: (english_word, user_answer, correct_answer)
             self.mistakes.append((self.curr_eng_word, selected, self.curr_ans))
 
+        self.model.record_review(self.curr_eng_word, grade_answer(is_correct, response_ms))
+        self.model.log_review(self.curr_eng_word, MODE_QUIZ, is_correct, selected, response_ms)
+        self.picker.record_answer(self.curr_eng_word, is_correct)
+
         self.page.update_stats(self.correct_count, self.wrong_count)
 
         # Visual feedback
@@ -358,19 +397,10 @@ class QuizController:
         if not dialog.result:
             return
 
-        difficulty_map = {
-            "Easy": Difficulty.EASY.name,
-            "Medium": Difficulty.MEDIUM.name,
-            "Hard": Difficulty.HARD.name
-        }
-
-        new_diff = difficulty_map.get(dialog.result)
+        new_diff = Difficulty.from_name(dialog.result)
         if new_diff:
             try:
-                self.model.update_difficulty(self.curr_eng_word, new_diff)
-                heb = self.words_dict[self.curr_eng_word][0]
-                self.words_dict[self.curr_eng_word] = (heb, new_diff)
-                self.all_words_dict[self.curr_eng_word] = (heb, new_diff)
+                self.store.update_difficulty(self.curr_eng_word, new_diff.name)
                 self.page.res_label.config(text=f"Updated to {dialog.result}!", fg="#28a745")
             except Exception as e:
                 print(f"Error: {e}")
@@ -381,8 +411,7 @@ class QuizController:
     def select_groups(self):
         """Select groups for filtering."""
         try:
-            groups_data = self.model.get_all_groups_names()
-            groups = [row[0] for row in groups_data]
+            groups = self.store.group_names()
 
             if not groups:
                 self.page.res_label.config(text="No groups available", fg="#666")
@@ -404,12 +433,7 @@ class QuizController:
     def _filter_by_groups(self, selected_groups: List[str]):
         """Filter words by groups."""
         try:
-            words_data = self.model.get_words_by_groups(selected_groups)
-            self.words_dict = {}
-
-            for eng, heb, diff, grp in words_data:
-                self.words_dict[eng] = (heb, diff)
-
+            self.selected_groups = list(selected_groups)
             self.new_quiz = True
 
             group_names = ", ".join(selected_groups[:3])
@@ -426,6 +450,8 @@ class QuizController:
 
     def _show_results_dialog(self):
         """Show quiz results dialog at end of quiz."""
+        self.model.flush_reviews()
+
         try:
             # Show results dialog
             dialog = QuizResultsDialog(
@@ -0,0 +1,108 @@
+"""
+Cloze Items
+
+Prepared sentences for the fill-in-the-blank quiz, in the cloze_items table
+(see Migrations.py).
+
+Every example sentence that contains the word (or one of its forms, see
+WordMatcher) is stored once with the span to blank out. The quiz then
+just picks a row. Words with no usable sentence have no rows, so they can
+be left out of a session before it starts.
+
+Words marked cloze_built = 0 (new words, changed examples) are built in
+batches by build_pending().
+"""
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from Utils.WordMatcher import WordMatcher
+
+BATCH_SIZE = 500
+MIN_SENTENCE_LENGTH = 10
+
+
+def cloze_sentences(word: str, examples: Optional[str]) -> List[Tuple[str, int, int]]:
+    """(sentence, blank_start, blank_end) for every example sentence containing the word."""
+    if not examples:
+        return []
+
+    items = []
+    for sentence in re.split(r'[\n]+', examples):
+        sentence = sentence.strip()
+        if len(sentence) < MIN_SENTENCE_LENGTH:  # Too short
+            continue
+
+        match = WordMatcher.find(word, sentence, fuzzy=True)
+        if match:
+            items.append((sentence, match.start(), match.end()))
+    return items
+
+
+class ClozeItems:
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def build_pending(self, batch_size: int = BATCH_SIZE) -> int:
+        """
+        Build the rows of every word marked cloze_built = 0.
+
+        Each batch is one transaction. Returns the number of words built.
+        """
+        built = 0
+        while True:
+            rows = self.connection.execute(
+                "SELECT id, engWord, examples FROM vocabulary WHERE cloze_built = 0 LIMIT ?",
+                (batch_size,)
+            ).fetchall()
+            if not rows or not self._build(rows):
+                return built
+
+            built += len(rows)
+
+    def _build(self, rows: List[Tuple[int, str, Optional[str]]]) -> bool:
+        items = [(word_id, sentence, start, end)
+                 for word_id, word, examples in rows
+                 for sentence, start, end in cloze_sentences(word, examples)]
+
+        try:
+            with self.connection:
+                self.connection.executemany("DELETE FROM cloze_items WHERE word_id = ?",
+                                            [(word_id,) for word_id, _, _ in rows])
+                self.connection.executemany(
+                    "INSERT INTO cloze_items (word_id, sentence, blank_start, blank_end) VALUES (?, ?, ?, ?)",
+                    items
+                )
+                self.connection.executemany("UPDATE vocabulary SET cloze_built = 1 WHERE id = ?",
+                                            [(word_id,) for word_id, _, _ in rows])
+            return True
+
+        except sqlite3.Error as e:
+            print(f"Error building cloze items: {e}")
+            return False
+
+    def get_for_words(self, eng_words: Iterable[str]) -> Dict[str, List[Tuple[str, int, int]]]:
+        """
+        Prepared sentences of many words at once.
+
+        Returns:
+            {lowercase engWord: [(sentence, blank_start, blank_end), ...]} -
+            words without a usable sentence are left out
+        """
+        words = list({word.lower() for word in eng_words})
+        items: Dict[str, List[Tuple[str, int, int]]] = {}
+
+        # Stay well under SQLite's limit on bound parameters
+        for i in range(0, len(words), BATCH_SIZE):
+            chunk = words[i:i + BATCH_SIZE]
+            rows = self.connection.execute(f"""
+                SELECT lower(v.engWord), c.sentence, c.blank_start, c.blank_end
+                FROM vocabulary v
+                JOIN cloze_items c ON c.word_id = v.id
+                WHERE lower(v.engWord) IN ({','.join('?' for _ in chunk)})
+            """, chunk).fetchall()
+
+            for word, sentence, start, end in rows:
+                items.setdefault(word, []).append((sentence, start, end))
+
+        return items
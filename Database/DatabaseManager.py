@@ -1,37 +1,74 @@
+import re
 import sqlite3
+import time
+from Database.Migrations import run_migrations
+from Database.GroupStatistics import GroupStatistics
+from Database.ReviewLog import ReviewLog
+from Database.ClozeItems import ClozeItems
+from Database.WriteBehind import WriteBehindQueue
 from Utils.DiffucltyEnum import Difficulty
-from Utils.Translator import translate_to_heb, get_word_examples
+from Utils.Translator import lookup_word
 from Utils.FileHandler import read_words_from_file, extract_highlight_words_from_pdf
+from Utils.LookupPipeline import LookupPipeline
+from Utils.Scheduler import ReviewState, schedule
 
 
 class DatabaseManager:
-    def __init__(self):
-        self.connection = sqlite3.connect('Database\\vocabulary.db')
+    # Columns search() can look in, with their bm25 weights (English matches rank highest)
+    SEARCH_FIELDS = {"engWord": 10.0, "hebWord": 5.0, "examples": 1.0}
+    # The trigram tokenizer can't match anything shorter
+    MIN_FTS_QUERY = 3
+
+    # Words joined to their group name ('' for no group)
+    WORDS_FROM = "vocabulary v LEFT JOIN groups g ON g.id = v.group_id"
+    GROUP_NAME = "coalesce(g.name, '')"
+    # "<book> <chapter number>", e.g. "Project Hail Mary 3"
+    BOOK_CHAPTER_PATTERN = re.compile(r'^(.+?)\s+(\d+|[IVX]+)$')
+    # Difficulty is stored as the enum's integer value; queries return its name
+    DIFFICULTY_NAME = "CASE v.difficulty {} END".format(
+        " ".join(f"WHEN {difficulty.value} THEN '{difficulty.name}'" for difficulty in Difficulty)
+    )
+
+    def __init__(self, db_path='Database\\vocabulary.db'):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
         self.cursor = self.connection.cursor()
         self.table_name = "vocabulary"
 
+        # Per-group counts, cached until the next write
+        self.group_stats = GroupStatistics(self.connection)
+
+        # Prepared fill-in-the-blank sentences
+        self.cloze_items = ClozeItems(self.connection)
+
+        # Answers, written to the reviews table in batches
+        self.review_log = ReviewLog(self.connection)
+
+        # Difficulty and schedule updates, written on a background thread.
+        # Reads that must see them call _sync_writes() first.
+        self.write_behind = WriteBehindQueue(db_path)
+
+        # Concurrent, rate-limited translation lookups for bulk imports
+        self.lookup_pipeline = LookupPipeline(self._lookup_word)
+
+        # Bring the schema up to date (indexes, new tables...) on startup
+        run_migrations(self.connection)
+        self.has_full_text_search = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'vocabulary_fts'"
+        ).fetchone() is not None
+
     def create_db(self):
-        self.cursor.execute('''CREATE TABLE IF NOT EXISTS vocabulary
-                       (id INTEGER PRIMARY KEY,
-                        engWord TEXT,
-                        hebWord TEXT,
-                        examples TEXT,
-                        difficulty TEXT,
-                        group_name TEXT)''')
-
-        raw_data1 = (1, "remorse", translate_to_heb("remorse"), get_word_examples("remorse"), Difficulty.EASY.name, "The_Silent_Patient_1")
-        raw_data2 = (2, "chore", translate_to_heb("chore"), get_word_examples("chore"), Difficulty.EASY.name, "The_Silent_Patient_1")
-        raw_data3 = (3, "more", translate_to_heb("more"), get_word_examples("more"), Difficulty.EASY.name, "The_Silent_Patient_1")
-        raw_data4 = (4, "vigour", translate_to_heb("vigour"), get_word_examples("vigour"), Difficulty.EASY.name, "The_Silent_Patient_1")
-
-        self.cursor.execute("INSERT INTO vocabulary (id, engWord, hebWord, examples, difficulty, group_name)"
-                         " VALUES (?, ?, ?, ?, ?, ?)", raw_data1)
-        self.cursor.execute("INSERT INTO vocabulary (id, engWord, hebWord, examples, difficulty, group_name)"
-                         " VALUES (?, ?, ?, ?, ?, ?)", raw_data2)
-        self.cursor.execute("INSERT INTO vocabulary (id, engWord, hebWord, examples, difficulty, group_name)"
-                         " VALUES (?, ?, ?, ?, ?, ?)", raw_data3)
-        self.cursor.execute("INSERT INTO vocabulary (id, engWord, hebWord, examples, difficulty, group_name)"
-                         " VALUES (?, ?, ?, ?, ?, ?)", raw_data4)
+        # The tables themselves are created by the migrations in __init__
+        sample_words = ["remorse", "chore", "more", "vigour"]
+        group_id = self._get_group_id("The_Silent_Patient_1")
+        raw_data = []
+        for word_id, word in enumerate(sample_words, start=1):
+            lookup = lookup_word(word)
+            raw_data.append((word_id, word, lookup.translation, lookup.examples,
+                             Difficulty.EASY.value, group_id))
+
+        self.cursor.executemany("INSERT INTO vocabulary (id, engWord, hebWord, examples, difficulty, group_id)"
+                                " VALUES (?, ?, ?, ?, ?, ?)", raw_data)
         self.connection.commit()
 
     def print_db_data(self):
@@ -44,7 +81,8 @@ class DatabaseManager:
         return self.cursor.execute(f"SELECT engWord, hebWord FROM {self.table_name}")
 
     def get_full_data(self):
-        return self.cursor.execute(f"SELECT engWord, hebWord, difficulty, group_name FROM {self.table_name}")
+        self._sync_writes()
+        return self.cursor.execute(f"SELECT v.engWord, v.hebWord, {self.DIFFICULTY_NAME}, {self.GROUP_NAME} FROM {self.WORDS_FROM}")
 
     def add_word(self, eng_word, group_name="New_Words"):
         """Add a new word to the database."""
@@ -52,54 +90,172 @@ class DatabaseManager:
             print(f"{eng_word} is already exists. Abort adding")
             return False
 
-        heb_word = translate_to_heb(eng_word)
-        if heb_word is None:
+        lookup = lookup_word(eng_word)
+        if lookup.translation is None:
             print(f"{eng_word} is not a valid word. Abort adding")
             return False
 
-        examples = get_word_examples(eng_word)
+        heb_word, examples = lookup.translation, lookup.examples
 
         # Let SQLite auto-generate the ID - don't specify it
-        word_data = (eng_word.lower(), heb_word, examples, Difficulty.NEW_WORD.name, group_name)
+        word_data = (eng_word.lower(), heb_word, examples, Difficulty.NEW_WORD.value,
+                     self._get_group_id(group_name))
 
         self.cursor.execute(
             f"INSERT INTO {self.table_name} "
-            f"(engWord, hebWord, examples, difficulty, group_name) "
+            f"(engWord, hebWord, examples, difficulty, group_id) "
             f"VALUES (?, ?, ?, ?, ?)",
             word_data
         )
 
         self.connection.commit()
+        self.build_cloze_items()
         print(f"{eng_word} was added!")
         return True
 
-    def add_from_file(self, filepath):
-        words_to_add = read_words_from_file(filepath)
+    def add_words_bulk(self, words, group_prefix, first_pack=1, pack_size=40):
+        """
+        Add many words in a single transaction.
 
-        pack_size = 40
-        curr_pack = 2
+        Added words are packed into groups of pack_size named
+        "<group_prefix> <n>", starting at first_pack. Duplicates and failed
+        lookups don't count towards a pack.
+
+        Args:
+            words: Iterable of English words
+            group_prefix: Group name prefix, e.g. "Project Hail Mary"
+            first_pack: Number of the first group to fill
+            pack_size: Words per group
+
+        Returns:
+            Dict mapping each input word to "added", "duplicate" or "failed"
+        """
+        words = list(words)
+        report = {}
+        existing = self._get_existing_words(word.lower() for word in words)
+
+        to_lookup = []
+        for word in words:
+            if word in report:
+                continue
+
+            eng_word = word.lower()
+            if not eng_word:
+                report[word] = "failed"
+            elif eng_word in existing:
+                report[word] = "duplicate"
+            else:
+                to_lookup.append(word)
+                existing.add(eng_word)
+                report[word] = "pending"
+
+        # Lookups run concurrently; results come back in input order. Nothing
+        # is written until they're all done, so no transaction stays open
+        # (and locks the database) while waiting on the network.
+        looked_up = []
+        curr_pack = first_pack
         curr_pack_num = 0
-        for word in words_to_add:
-            group_name = f"The Will of The Many {curr_pack}"
-            if self.add_word(word, group_name) is True:
-                curr_pack_num += 1
+        for word, result in self.lookup_pipeline.run(to_lookup):
+            if result is None:
+                print(f"{word} is not a valid word. Skipping")
+                report[word] = "failed"
+                continue
+
+            heb_word, examples = result
+            looked_up.append((word, heb_word, examples, curr_pack))
+            report[word] = "added"
+
+            curr_pack_num += 1
             if curr_pack_num == pack_size:
                 curr_pack += 1
                 curr_pack_num = 0
 
+        try:
+            # Groups and words in one short transaction
+            group_ids = {pack: self._get_group_id(f"{group_prefix} {pack}")
+                         for pack in dict.fromkeys(pack for *_, pack in looked_up)}
+            rows = [(word.lower(), heb_word, examples, Difficulty.NEW_WORD.value, group_ids[pack])
+                    for word, heb_word, examples, pack in looked_up]
+            self.cursor.executemany(
+                f"INSERT INTO {self.table_name} "
+                f"(engWord, hebWord, examples, difficulty, group_id) "
+                f"VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self.connection.commit()
+            self.build_cloze_items()
+        except Exception as e:
+            print(f"Error importing words: {e}")
+            self.connection.rollback()
+            for word, status in report.items():
+                if status == "added":
+                    report[word] = "failed"
+
+        statuses = list(report.values())
+        print(f"Import finished: {statuses.count('added')} added, "
+              f"{statuses.count('duplicate')} duplicates, {statuses.count('failed')} failed")
+        return report
+
+    @staticmethod
+    def _lookup_word(eng_word):
+        """Translation and examples for an import; None if the word is invalid."""
+        lookup = lookup_word(eng_word)
+        if lookup.status == "error":
+            # Raising lets the lookup pipeline retry with backoff
+            raise ConnectionError(f"morfix lookup failed for '{eng_word}'")
+        if lookup.translation is None:
+            return None
+
+        return lookup.translation, lookup.examples
+
+    def _get_existing_words(self, eng_words):
+        """Return the subset of (lowercase) words already in the table."""
+        eng_words = list(set(eng_words))
+        existing = set()
+
+        # Stay well below SQLite's bound-parameter limit
+        chunk_size = 500
+        for start in range(0, len(eng_words), chunk_size):
+            chunk = eng_words[start:start + chunk_size]
+            self.cursor.execute(
+                f"SELECT lower(engWord) FROM {self.table_name} "
+                f"WHERE lower(engWord) IN ({','.join('?' for _ in chunk)})",
+                chunk
+            )
+            existing.update(row[0] for row in self.cursor.fetchall())
+
+        return existing
+
+    def add_from_file(self, filepath):
+        words_to_add = read_words_from_file(filepath)
+        return self.add_words_bulk(words_to_add, "The Will of The Many", first_pack=2)
+
     def update_difficulty(self, eng_word, difficulty):
-        self.cursor.execute(f"UPDATE {self.table_name}"
-                         f" SET difficulty = ? WHERE engWord = ?", (difficulty, eng_word))
+        """Queue a difficulty change (written in the background, see WriteBehindQueue)."""
+        self.write_behind.update(eng_word, difficulty=self._difficulty_value(difficulty))
 
-        self.connection.commit()
+    def _sync_writes(self):
+        """Wait until queued background writes are committed, so reads see them. False if the write failed."""
+        return self.write_behind.flush()
+
+    @staticmethod
+    def _difficulty_value(difficulty):
+        """Difficulty enum or name ("HARD", "Hard"...) -> the integer stored in the database."""
+        if isinstance(difficulty, Difficulty):
+            return difficulty.value
+
+        level = Difficulty.from_name(difficulty)
+        if level is None:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        return level.value
 
     def delete_word(self, eng_word):
-        self.cursor.execute(f"DELETE FROM {self.table_name} WHERE engWord = ?", (eng_word.lower(),))
+        self.cursor.execute(f"DELETE FROM {self.table_name} WHERE lower(engWord) = ?", (eng_word.lower(),))
 
         self.connection.commit()
 
     def is_word_exists(self, eng_word):
-        data = self.cursor.execute(f"SELECT engWord FROM {self.table_name} WHERE engWord = ?", (eng_word.lower(),))
+        data = self.cursor.execute(f"SELECT engWord FROM {self.table_name} WHERE lower(engWord) = ?", (eng_word.lower(),))
         res = data.fetchone()
 
         return res is not None
@@ -108,10 +264,11 @@ class DatabaseManager:
         """Update examples for a word."""
         try:
             self.cursor.execute(
-                "UPDATE vocabulary SET examples = ? WHERE engWord = ?",
-                (examples, eng_word)
+                "UPDATE vocabulary SET examples = ? WHERE lower(engWord) = ?",
+                (examples, eng_word.lower())
             )
             self.connection.commit()
+            self.build_cloze_items()
             return True
         except Exception as e:
             print(f"Error updating examples: {e}")
@@ -119,47 +276,267 @@ class DatabaseManager:
 
     def add_highlight_words_from_pdf(self, filepath):
         words_to_add = extract_highlight_words_from_pdf(filepath)
-
-        pack_size = 40
-        curr_pack = 1
-        curr_pack_num = 0
-        for word in words_to_add:
-            group_name = f"Project Hail Mary {curr_pack}"
-            if self.add_word(word, group_name) is True:
-                curr_pack_num += 1
-            if curr_pack_num == pack_size:
-                curr_pack += 1
-                curr_pack_num = 0
+        return self.add_words_bulk(words_to_add, "Project Hail Mary")
 
     def get_table_size(self):
         self.cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
         return self.cursor.fetchone()[0]
 
     def get_word_details(self, eng_word):
-        data = self.cursor.execute(f"SELECT * FROM {self.table_name} WHERE engWord = ?", (eng_word.lower(),))
+        """(id, engWord, hebWord, examples, difficulty, group_name) or None."""
+        self._sync_writes()
+        data = self.cursor.execute(
+            f"SELECT v.id, v.engWord, v.hebWord, v.examples, {self.DIFFICULTY_NAME}, {self.GROUP_NAME} "
+            f"FROM {self.WORDS_FROM} WHERE lower(v.engWord) = ?",
+            (eng_word.lower(),)
+        )
 
         for item in data:
             return item
 
     def get_words_by_groups(self, selected_groups):
-        query = f"SELECT engWord, hebWord, difficulty, group_name FROM vocabulary WHERE group_name IN ({','.join('?' for _ in selected_groups)})"
+        self._sync_writes()
+        # Join on the integer group id; the name lookup hits groups' unique index
+        query = (f"SELECT v.engWord, v.hebWord, {self.DIFFICULTY_NAME}, g.name "
+                 f"FROM groups g JOIN vocabulary v ON v.group_id = g.id "
+                 f"WHERE g.name IN ({','.join('?' for _ in selected_groups)})")
         self.cursor.execute(query, selected_groups)
         return self.cursor.fetchall()
 
     def get_all_groups_names(self):
-        self.cursor.execute("SELECT DISTINCT group_name FROM vocabulary")
+        self.cursor.execute(f"SELECT DISTINCT {self.GROUP_NAME} FROM {self.WORDS_FROM}")
         return self.cursor.fetchall()
 
     def get_words_with_examples(self):
-        query = """
-            SELECT engWord, hebWord, difficulty, examples, group_name 
-            FROM vocabulary 
-            WHERE examples IS NOT NULL AND examples != ''
+        self._sync_writes()
+        query = f"""
+            SELECT v.engWord, v.hebWord, {self.DIFFICULTY_NAME}, v.examples, {self.GROUP_NAME}
+            FROM {self.WORDS_FROM}
+            WHERE v.examples IS NOT NULL AND v.examples != ''
         """
         self.cursor.execute(query)
         return self.cursor.fetchall()
 
+    def get_all_word_details(self):
+        """Every word as (engWord, hebWord, difficulty, group_name, examples)."""
+        self._sync_writes()
+        self.cursor.execute(f"SELECT v.engWord, v.hebWord, {self.DIFFICULTY_NAME}, {self.GROUP_NAME}, v.examples "
+                            f"FROM {self.WORDS_FROM}")
+        return self.cursor.fetchall()
+
+    def search(self, query: str, fields=None, limit: int = 50) -> list:
+        """
+        Find words whose English, Hebrew or examples contain `query`.
+
+        Args:
+            query: Text to look for (case-insensitive substring)
+            fields: Columns to search, any of SEARCH_FIELDS (default: all)
+            limit: Maximum number of results
+
+        Returns:
+            List of (engWord, hebWord, difficulty, group_name, examples), best match first
+        """
+        query = query.strip()
+        fields = list(fields) if fields else list(self.SEARCH_FIELDS)
+        unknown = [field for field in fields if field not in self.SEARCH_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown search fields: {unknown}")
+        if not query:
+            return []
+        self._sync_writes()
+
+        if self.has_full_text_search and len(query) >= self.MIN_FTS_QUERY:
+            # {cols} : "phrase" - quotes inside the phrase are doubled
+            match = "{%s} : \"%s\"" % (" ".join(fields), query.replace('"', '""'))
+            weights = ", ".join(str(weight) for weight in self.SEARCH_FIELDS.values())
+            # Exact and prefix English matches first, then by relevance
+            self.cursor.execute(f"""
+                SELECT v.engWord, v.hebWord, {self.DIFFICULTY_NAME}, {self.GROUP_NAME}, v.examples
+                FROM vocabulary_fts f
+                JOIN vocabulary v ON v.id = f.rowid
+                LEFT JOIN groups g ON g.id = v.group_id
+                WHERE vocabulary_fts MATCH ?
+                ORDER BY lower(v.engWord) = lower(?) DESC,
+                         substr(lower(v.engWord), 1, length(?)) = lower(?) DESC,
+                         bm25(vocabulary_fts, {weights})
+                LIMIT ?
+            """, (match, query, query, query, limit))
+            return self.cursor.fetchall()
+
+        # Short query (or no FTS5): plain LIKE scan, exact and prefix English matches first
+        pattern = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        conditions = " OR ".join(f"v.{field} LIKE ? ESCAPE '\\'" for field in fields)
+        self.cursor.execute(f"""
+            SELECT v.engWord, v.hebWord, {self.DIFFICULTY_NAME}, {self.GROUP_NAME}, v.examples
+            FROM {self.WORDS_FROM}
+            WHERE {conditions}
+            ORDER BY lower(v.engWord) = lower(?) DESC, v.engWord LIKE ? ESCAPE '\\' DESC, v.engWord
+            LIMIT ?
+        """, [f"%{pattern}%"] * len(fields) + [query, f"{pattern}%", limit])
+        return self.cursor.fetchall()
+
+    # ==================== Spaced Repetition ====================
+
+    def get_due_words(self, limit=None, groups=None, difficulties=None, with_examples=False,
+                      with_cloze=False, now=None) -> list:
+        """
+        Words to review next, in order.
+
+        Overdue words come first (most overdue first), then words that
+        have never been reviewed (oldest first). If that's fewer than
+        `limit`, the rest are the words due soonest, so a group can always
+        be practised again.
+
+        Args:
+            limit: Maximum number of words (None = every matching word)
+            groups: Only these group names ('' = words without a group)
+            difficulties: Only these difficulty names
+            with_examples: Only words that have example sentences
+            with_cloze: Only words with a prepared fill-in-the-blank sentence
+            now: Reference time (Unix seconds, default: now)
+
+        Returns:
+            List of (engWord, hebWord, difficulty, group_name)
+        """
+        now = time.time() if now is None else now
+        self._sync_writes()
+
+        conditions, params = [], []
+        if groups:
+            names = [group for group in groups if group]
+            group_condition = f"v.group_id IN (SELECT id FROM groups WHERE name IN ({','.join('?' for _ in names)}))"
+            if len(names) < len(groups):
+                group_condition = f"({group_condition} OR v.group_id IS NULL)"
+            conditions.append(group_condition)
+            params.extend(names)
+        if difficulties:
+            conditions.append(f"v.difficulty IN ({','.join('?' for _ in difficulties)})")
+            params.extend(self._difficulty_value(difficulty) for difficulty in difficulties)
+        if with_examples:
+            conditions.append("v.examples IS NOT NULL AND v.examples != ''")
+        if with_cloze:
+            self.build_cloze_items()
+            conditions.append("EXISTS (SELECT 1 FROM cloze_items c WHERE c.word_id = v.id)")
+        filters = "".join(f" AND {condition}" for condition in conditions)
+
+        select = (f"SELECT v.engWord, v.hebWord, {self.DIFFICULTY_NAME}, {self.GROUP_NAME} "
+                  f"FROM {self.WORDS_FROM}")
+
+        # LIMIT -1 = no limit
+        self.cursor.execute(f"{select} WHERE v.due_at <= ?{filters} ORDER BY v.due_at LIMIT ?",
+                            [now, *params, -1 if limit is None else limit])
+        words = self.cursor.fetchall()
+
+        if limit is None or len(words) < limit:
+            remaining = -1 if limit is None else limit - len(words)
+            self.cursor.execute(f"{select} WHERE v.due_at IS NULL{filters} ORDER BY v.id LIMIT ?",
+                                [*params, remaining])
+            words += self.cursor.fetchall()
+
+        if limit is None or len(words) < limit:
+            remaining = -1 if limit is None else limit - len(words)
+            self.cursor.execute(f"{select} WHERE v.due_at > ?{filters} ORDER BY v.due_at LIMIT ?",
+                                [now, *params, remaining])
+            words += self.cursor.fetchall()
+
+        return words
+
+    def get_review_state(self, eng_word):
+        """The word's ReviewState (including queued and in-flight changes), or None if the word doesn't exist."""
+        self.cursor.execute(
+            f"SELECT ease, interval_days, repetitions, due_at FROM {self.table_name} WHERE lower(engWord) = ?",
+            (eng_word.lower(),)
+        )
+        row = self.cursor.fetchone()
+        if not row:
+            return None
+
+        return ReviewState(*row)._replace(**{
+            field: value for field, value in self.write_behind.pending(eng_word).items()
+            if field in ReviewState._fields
+        })
+
+    def record_review(self, eng_word, grade, now=None):
+        """
+        Reschedule a word after a review.
+
+        Args:
+            eng_word: The reviewed word
+            grade: 0-5, see Utils.Scheduler (GRADE_AGAIN ... GRADE_EASY)
+            now: Review time (Unix seconds, default: now)
+
+        Returns:
+            The new ReviewState, or None if the word doesn't exist
+        """
+        state = self.get_review_state(eng_word)
+        if state is None:
+            return None
+
+        new_state = schedule(state, grade, now)
+        # Queued like difficulty changes - no commit on the Tk thread
+        self.write_behind.update(eng_word, **new_state._asdict())
+        return new_state
+
+    # ==================== Cloze Sentences ====================
+
+    def build_cloze_items(self):
+        """Build fill-in-the-blank sentences for new and edited words. Returns the number of words built."""
+        return self.cloze_items.build_pending()
+
+    def get_cloze_items(self, eng_words):
+        """{lowercase engWord: [(sentence, blank_start, blank_end), ...]} for words with a usable sentence."""
+        self.build_cloze_items()
+        return self.cloze_items.get_for_words(eng_words)
+
+    # ==================== Review History ====================
+
+    def log_review(self, eng_word, mode, correct, answer=None, response_ms=None):
+        """
+        Record one answer in the review history (buffered, see ReviewLog).
+
+        Args:
+            eng_word: The word that was asked
+            mode: ReviewLog.MODE_QUIZ, MODE_FILL_BLANK or MODE_FLASHCARDS
+            correct: Whether the answer was right
+            answer: What the user answered
+            response_ms: Time taken to answer, in milliseconds
+        """
+        self.review_log.add(eng_word, mode, correct, answer, response_ms)
+
+    def flush_reviews(self):
+        """Write buffered answers now (end of a session)."""
+        return self.review_log.flush()
+
+    def flush_due_reviews(self):
+        """Write buffered answers if the oldest has waited ReviewLog.FLUSH_INTERVAL (timer tick)."""
+        return self.review_log.flush_if_due()
+
+    def get_review_summary(self) -> dict:
+        """
+        Answer history per word, for every word answered at least once.
+
+        Returns:
+            {lowercase engWord: (attempts, mistakes, last_reviewed_at)}
+        """
+        self.review_log.flush()
+        self.cursor.execute("""
+            SELECT lower(v.engWord), count(*), count(*) - sum(r.correct), max(r.reviewed_at)
+            FROM reviews r
+            JOIN vocabulary v ON v.id = r.word_id
+            GROUP BY r.word_id
+        """)
+        return {word: (attempts, mistakes, last_at) for word, attempts, mistakes, last_at in self.cursor.fetchall()}
+
     def close_db_connection(self):
+        self.review_log.flush()
+        # Blocks until every queued update is committed
+        try:
+            self.write_behind.close()
+        except sqlite3.Error as e:
+            # Never drop them - try this connection, and fail loudly if that doesn't work either
+            print(f"Error closing the write-behind queue: {e}. Writing the updates directly.")
+            if not WriteBehindQueue.write(self.connection, self.write_behind.drain()):
+                raise
         self.cursor.close()
         self.connection.close()
 
@@ -174,17 +551,15 @@ class DatabaseManager:
 
     def update_group(self, engWord: str, new_group: str) -> bool:
         try:
-            # Example SQL implementation
-            # Adjust based on your table structure
             cursor = self.connection.cursor()
 
             query = """
                 UPDATE vocabulary 
-                SET group_name = ? 
-                WHERE engWord = ?
+                SET group_id = ? 
+                WHERE lower(engWord) = ?
             """
 
-            cursor.execute(query, (new_group, engWord))
+            cursor.execute(query, (self._get_group_id(new_group), engWord.lower()))
             self.connection.commit()
 
             return cursor.rowcount > 0
@@ -195,20 +570,11 @@ class DatabaseManager:
             return False
 
     def get_all_groups(self) -> list:
+        """Names of all groups, including ones with no words yet."""
         try:
             cursor = self.connection.cursor()
-
-            query = """
-                SELECT DISTINCT group_name 
-                FROM vocabulary 
-                WHERE group_name IS NOT NULL AND group_name != ''
-                ORDER BY group_name
-            """
-
-            cursor.execute(query)
-            results = cursor.fetchall()
-
-            return [row[0] for row in results]
+            cursor.execute("SELECT name FROM groups ORDER BY name")
+            return [row[0] for row in cursor.fetchall()]
 
         except Exception as e:
             print(f"Error getting groups: {e}")
@@ -216,15 +582,11 @@ class DatabaseManager:
 
     def create_group(self, group_name: str) -> bool:
         try:
-            # If you have a separate groups table
-            cursor = self.connection.cursor()
-
-            query = """
-                INSERT INTO groups (name) 
-                VALUES (?)
-            """
+            if not group_name or self._get_group_id(group_name, create=False) is not None:
+                print(f"Group '{group_name}' already exists or is empty")
+                return False
 
-            cursor.execute(query, (group_name,))
+            self._get_group_id(group_name)
             self.connection.commit()
 
             return True
@@ -235,19 +597,30 @@ class DatabaseManager:
             return False
 
     def rename_group(self, old_name: str, new_name: str) -> bool:
+        """Rename a group - a single row update, or a merge if new_name already exists."""
+        if not new_name:
+            return self.delete_group(old_name)
+
         try:
             cursor = self.connection.cursor()
 
-            query = """
-                UPDATE vocabulary 
-                SET group_name = ? 
-                WHERE group_name = ?
-            """
+            old_id = self._get_group_id(old_name, create=False)
+            if old_id is None:
+                return False
+
+            new_id = self._get_group_id(new_name, create=False)
+            if new_id is None:
+                book_id, chapter = self._get_book_and_chapter(new_name)
+                cursor.execute("UPDATE groups SET name = ?, book_id = ?, chapter = ? WHERE id = ?",
+                               (new_name, book_id, chapter, old_id))
+            elif new_id != old_id:
+                cursor.execute("UPDATE vocabulary SET group_id = ? WHERE group_id = ?", (new_id, old_id))
+                cursor.execute("DELETE FROM groups WHERE id = ?", (old_id,))
 
-            cursor.execute(query, (new_name, old_name))
+            self._delete_empty_books()
             self.connection.commit()
 
-            return cursor.rowcount > 0
+            return True
 
         except Exception as e:
             print(f"Error renaming group: {e}")
@@ -258,17 +631,19 @@ class DatabaseManager:
         try:
             cursor = self.connection.cursor()
 
-            query = """
-                UPDATE vocabulary 
-                SET group_name = ? 
-                WHERE group_name = ?
-            """
+            group_id = self._get_group_id(group_name, create=False)
+            if group_id is None:
+                return False
 
-            new_value = reassign_to if reassign_to else ""
-            cursor.execute(query, (new_value, group_name))
+            # Words move to reassign_to, or are left without a group
+            cursor.execute("UPDATE vocabulary SET group_id = ? WHERE group_id = ?",
+                           (self._get_group_id(reassign_to), group_id))
+            cursor.execute("DELETE FROM groups WHERE id = ?", (group_id,))
+
+            self._delete_empty_books()
             self.connection.commit()
 
-            return cursor.rowcount > 0
+            return True
 
         except Exception as e:
             print(f"Error deleting group: {e}")
@@ -277,13 +652,15 @@ class DatabaseManager:
 
     def get_words_by_group(self, group_name: str) -> list:
         try:
+            self._sync_writes()
             cursor = self.connection.cursor()
 
-            query = """
-                SELECT engWord, hebWord, difficulty, group_name
-                FROM vocabulary 
-                WHERE group_name = ?
-                ORDER BY engWord
+            query = f"""
+                SELECT v.engWord, v.hebWord, {self.DIFFICULTY_NAME}, g.name
+                FROM groups g
+                JOIN vocabulary v ON v.group_id = g.id
+                WHERE g.name = ?
+                ORDER BY v.engWord
             """
 
             cursor.execute(query, (group_name,))
@@ -293,22 +670,72 @@ class DatabaseManager:
             print(f"Error getting words by group: {e}")
             return []
 
-    def get_group_statistics(self) -> dict:
-        try:
-            cursor = self.connection.cursor()
+    def get_group_hierarchy(self, group_names=None) -> dict:
+        """
+        Groups organized by book.
 
-            query = """
-                SELECT group_name, COUNT(*) as count
-                FROM vocabulary
-                WHERE group_name IS NOT NULL AND group_name != ''
-                GROUP BY group_name
-                ORDER BY count DESC
-            """
+        Args:
+            group_names: Only include these groups (default: all groups)
 
-            cursor.execute(query)
-            results = cursor.fetchall()
+        Returns:
+            Dict mapping book name to its group names. Groups that aren't
+            part of a book map to themselves.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT g.name, b.name
+            FROM groups g
+            LEFT JOIN books b ON b.id = g.book_id
+        """)
+
+        wanted = set(group_names) if group_names is not None else None
+        hierarchy = {}
+        for group_name, book_name in cursor.fetchall():
+            if wanted is None or group_name in wanted:
+                hierarchy.setdefault(book_name or group_name, []).append(group_name)
+        return hierarchy
+
+    def _get_group_id(self, group_name, create=True):
+        """
+        Id of the named group, creating it (and its book) on first use.
+
+        Returns None for an empty name (no group), or if create is False
+        and the group doesn't exist. Doesn't commit.
+        """
+        if not group_name:
+            return None
 
-            return {row[0]: row[1] for row in results}
+        cursor = self.connection.cursor()
+        row = cursor.execute("SELECT id FROM groups WHERE name = ?", (group_name,)).fetchone()
+        if row is not None or not create:
+            return row[0] if row else None
+
+        book_id, chapter = self._get_book_and_chapter(group_name)
+        cursor.execute("INSERT INTO groups (name, book_id, chapter) VALUES (?, ?, ?)",
+                       (group_name, book_id, chapter))
+        return cursor.lastrowid
+
+    def _get_book_and_chapter(self, group_name):
+        """(book id, chapter) for a "<book> <chapter>" group name, else (None, None)."""
+        match = self.BOOK_CHAPTER_PATTERN.match(group_name)
+        if not match:
+            return None, None
+
+        book_name, chapter = match.groups()
+        cursor = self.connection.cursor()
+        cursor.execute("INSERT OR IGNORE INTO books (name) VALUES (?)", (book_name,))
+        cursor.execute("SELECT id FROM books WHERE name = ?", (book_name,))
+        return cursor.fetchone()[0], chapter
+
+    def _delete_empty_books(self):
+        self.connection.execute(
+            "DELETE FROM books WHERE id NOT IN (SELECT book_id FROM groups WHERE book_id IS NOT NULL)"
+        )
+
+    def get_group_statistics(self) -> dict:
+        try:
+            self._sync_writes()
+            return self.group_stats.word_counts()
 
         except Exception as e:
             print(f"Error getting group statistics: {e}")
@@ -322,15 +749,7 @@ class DatabaseManager:
 
     def print_group_statistics(self):
         try:
-            query = """
-                SELECT group_name, COUNT(*) as word_count
-                FROM vocabulary
-                WHERE group_name IS NOT NULL AND group_name != ''
-                GROUP BY group_name
-                ORDER BY word_count DESC
-            """
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
+            results = list(self.get_group_statistics().items())
 
             if not results:
                 print("No groups found in database.")
@@ -369,39 +788,33 @@ class DatabaseManager:
 
     def get_group_word_counts(self):
         try:
-            query = """
-                SELECT group_name, COUNT(*) as word_count
-                FROM vocabulary
-                WHERE group_name IS NOT NULL AND group_name != ''
-                GROUP BY group_name
-                ORDER BY word_count DESC
-            """
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-
-            return {group: count for group, count in results}
+            self._sync_writes()
+            return self.group_stats.word_counts()
 
         except Exception as e:
             print(f"Error getting group word counts: {e}")
             return {}
 
+    def get_all_group_stats(self) -> dict:
+        """{group name: stats} for every group, see GroupStatistics.get_all."""
+        try:
+            self._sync_writes()
+            return self.group_stats.get_all()
+
+        except Exception as e:
+            print(f"Error getting group statistics: {e}")
+            return {}
+
     def print_group_statistics_with_difficulty(self):
         try:
-            query = """
-                SELECT 
-                    group_name,
-                    COUNT(*) as total,
-                    SUM(CASE WHEN difficulty = 'NEW_WORD' THEN 1 ELSE 0 END) as new_word,
-                    SUM(CASE WHEN difficulty = 'EASY' THEN 1 ELSE 0 END) as easy,
-                    SUM(CASE WHEN difficulty = 'MEDIUM' THEN 1 ELSE 0 END) as medium,
-                    SUM(CASE WHEN difficulty = 'HARD' THEN 1 ELSE 0 END) as hard
-                FROM vocabulary
-                WHERE group_name IS NOT NULL AND group_name != ''
-                GROUP BY group_name
-                ORDER BY total DESC
-            """
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
+            all_stats = self.get_all_group_stats()
+            results = [
+                (group_name, stats['total_words'],
+                 *(stats['difficulty_breakdown'].get(d, 0) for d in ('NEW_WORD', 'EASY', 'MEDIUM', 'HARD')))
+                for group_name, stats in all_stats.items()
+                if group_name
+            ]
+            results.sort(key=lambda row: row[1], reverse=True)
 
             if not results:
                 print("No groups found.")
@@ -445,41 +858,9 @@ class DatabaseManager:
 
     def get_group_info(self, group_name):
         try:
-            # Total words
-            query_total = """
-                SELECT COUNT(*) FROM vocabulary 
-                WHERE group_name = ?
-            """
-            self.cursor.execute(query_total, (group_name,))
-            total_words = self.cursor.fetchone()[0]
-
-            # Difficulty breakdown
-            query_diff = """
-                SELECT difficulty, COUNT(*) 
-                FROM vocabulary 
-                WHERE group_name = ?
-                GROUP BY difficulty
-            """
-            self.cursor.execute(query_diff, (group_name,))
-            difficulty_breakdown = dict(self.cursor.fetchall())
-
-            # With/without examples
-            query_examples = """
-                SELECT 
-                    COUNT(CASE WHEN examples IS NOT NULL AND examples != '' THEN 1 END) as with_examples,
-                    COUNT(CASE WHEN examples IS NULL OR examples = '' THEN 1 END) as without_examples
-                FROM vocabulary
-                WHERE group_name = ?
-            """
-            self.cursor.execute(query_examples, (group_name,))
-            result = self.cursor.fetchone()
-
-            return {
-                'total_words': total_words,
-                'difficulty_breakdown': difficulty_breakdown,
-                'with_examples': result[0] if result else 0,
-                'without_examples': result[1] if result else 0
-            }
+            self._sync_writes()
+            # total_words, difficulty_breakdown, with_examples, without_examples
+            return self.group_stats.get(group_name)
 
         except Exception as e:
             print(f"Error getting group info: {e}")
@@ -487,8 +868,8 @@ class DatabaseManager:
 
     def delete_word(self, english_word: str) -> bool:
         try:
-            query = "DELETE FROM vocabulary WHERE engWord = ?"
-            self.cursor.execute(query, (english_word,))
+            query = "DELETE FROM vocabulary WHERE lower(engWord) = ?"
+            self.cursor.execute(query, (english_word.lower(),))
             self.connection.commit()
 
             if self.cursor.rowcount > 0:
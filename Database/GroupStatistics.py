@@ -0,0 +1,75 @@
+"""
+Group Statistics
+
+Per-group word counts for every group, read from the group_stats table
+(one row per group and difficulty, maintained by triggers - see
+Migrations.py), so the cost depends on the number of groups, not words.
+
+The result is cached and reused until the database changes - through this
+connection (sqlite3.Connection.total_changes) or another one, such as
+the write-behind thread (PRAGMA data_version).
+"""
+import sqlite3
+from typing import Dict, Optional
+
+from Utils.DiffucltyEnum import Difficulty
+
+
+class GroupStatistics:
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self._cache: Optional[Dict[str, dict]] = None
+        self._cached_at_changes: tuple = ()
+
+    def get_all(self) -> Dict[str, dict]:
+        """
+        Statistics for every group.
+
+        Returns:
+            {group_name: {'total_words', 'difficulty_breakdown', 'with_examples', 'without_examples'}}
+        """
+        data_version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        changes = (self.connection.total_changes, data_version)
+        if self._cache is None or changes != self._cached_at_changes:
+            self._cache = self._load()
+            self._cached_at_changes = changes
+        return self._cache
+
+    def get(self, group_name: str) -> dict:
+        """Statistics for one group (all zeros if it has no words)."""
+        stats = self.get_all().get(group_name)
+        if stats is None:
+            return {'total_words': 0, 'difficulty_breakdown': {}, 'with_examples': 0, 'without_examples': 0}
+
+        return {**stats, 'difficulty_breakdown': dict(stats['difficulty_breakdown'])}
+
+    def _load(self) -> Dict[str, dict]:
+        cursor = self.connection.cursor()
+        try:
+            # group_id 0 = words without a group, reported under ''
+            cursor.execute("""
+                SELECT coalesce(g.name, ''), s.difficulty, s.word_count, s.with_examples
+                FROM group_stats s
+                LEFT JOIN groups g ON g.id = s.group_id
+            """)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        stats: Dict[str, dict] = {}
+        for group_name, difficulty, count, with_examples in rows:
+            group = stats.setdefault(group_name, {
+                'total_words': 0, 'difficulty_breakdown': {}, 'with_examples': 0, 'without_examples': 0
+            })
+            group['total_words'] += count
+            # Stored as Difficulty.value; reported by name
+            group['difficulty_breakdown'][Difficulty(difficulty).name] = count
+            group['with_examples'] += with_examples
+            group['without_examples'] += count - with_examples
+
+        return stats
+
+    def word_counts(self) -> Dict[str, int]:
+        """{group_name: word count} for named groups, largest first."""
+        counts = {group: stats['total_words'] for group, stats in self.get_all().items() if group}
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
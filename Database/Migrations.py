@@ -0,0 +1,483 @@
+"""
+Schema Migrations
+
+Versioned, ordered schema changes for the vocabulary database.
+
+Every migration runs once, inside its own transaction, and is recorded in
+the schema_version table. New migrations are appended to MIGRATIONS with
+the next version number - never edit a migration that has already shipped.
+"""
+import re
+import sqlite3
+import time
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+
+# ==================== Migration Steps ====================
+
+def _create_vocabulary_table(cursor: sqlite3.Cursor) -> None:
+    """Base schema (matches the table created by DatabaseManager.create_db)."""
+    cursor.execute('''CREATE TABLE IF NOT EXISTS vocabulary
+                   (id INTEGER PRIMARY KEY,
+                    engWord TEXT,
+                    hebWord TEXT,
+                    examples TEXT,
+                    difficulty TEXT,
+                    group_name TEXT)''')
+
+
+def _merge_case_duplicates(cursor: sqlite3.Cursor) -> None:
+    """
+    Merge words that differ only in case into the oldest row, so the
+    unique index can be built on existing databases.
+
+    Nothing is lost: differing translations and examples are joined,
+    and an empty difficulty or group is taken from a duplicate. Every
+    merge is printed.
+    """
+    cursor.execute("""
+        SELECT id, engWord, hebWord, examples, difficulty, group_name
+        FROM vocabulary
+        WHERE lower(engWord) IN (SELECT lower(engWord) FROM vocabulary
+                                 GROUP BY lower(engWord) HAVING COUNT(*) > 1)
+        ORDER BY lower(engWord), id
+    """)
+    duplicates = {}
+    for row in cursor.fetchall():
+        duplicates.setdefault(row[1].lower(), []).append(row)
+
+    for rows in duplicates.values():
+        (keep_id, keep_word, *_), merged = rows[0], rows[1:]
+        _, _, heb_words, examples, difficulties, group_names = zip(*rows)
+
+        cursor.execute(
+            "UPDATE vocabulary SET hebWord = ?, examples = ?, difficulty = ?, group_name = ? WHERE id = ?",
+            (", ".join(dict.fromkeys(filter(None, heb_words))) or None,
+             "\n".join(dict.fromkeys(filter(None, examples))) or None,
+             next(filter(None, difficulties), None),
+             next(filter(None, group_names), None),
+             keep_id)
+        )
+        cursor.executemany("DELETE FROM vocabulary WHERE id = ?", [(row[0],) for row in merged])
+        print(f"Merged duplicate words {', '.join(repr(row[1]) for row in merged)} "
+              f"into '{keep_word}' (id {keep_id})")
+
+
+def _index_vocabulary_lookups(cursor: sqlite3.Cursor) -> None:
+    """Unique case-insensitive word index plus group/difficulty indexes."""
+    _merge_case_duplicates(cursor)
+
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_vocabulary_eng_word "
+                   "ON vocabulary (lower(engWord))")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_group "
+                   "ON vocabulary (group_name)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_group_difficulty "
+                   "ON vocabulary (group_name, difficulty)")
+
+
+def _create_full_text_index(cursor: sqlite3.Cursor) -> None:
+    """
+    FTS5 index over words, translations and examples, kept in sync by triggers.
+
+    Uses the trigram tokenizer so substring matches work for Hebrew as well
+    as English. Skipped (with a warning) if SQLite was built without FTS5;
+    DatabaseManager.search then falls back to LIKE.
+    """
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS vocabulary_fts USING fts5(
+                engWord, hebWord, examples,
+                content='vocabulary', content_rowid='id', tokenize='trigram'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        print(f"Full-text search unavailable ({e}); search will use LIKE")
+        return
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS vocabulary_fts_insert AFTER INSERT ON vocabulary BEGIN
+            INSERT INTO vocabulary_fts (rowid, engWord, hebWord, examples)
+            VALUES (new.id, new.engWord, new.hebWord, new.examples);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS vocabulary_fts_delete AFTER DELETE ON vocabulary BEGIN
+            INSERT INTO vocabulary_fts (vocabulary_fts, rowid, engWord, hebWord, examples)
+            VALUES ('delete', old.id, old.engWord, old.hebWord, old.examples);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS vocabulary_fts_update
+        AFTER UPDATE OF engWord, hebWord, examples ON vocabulary BEGIN
+            INSERT INTO vocabulary_fts (vocabulary_fts, rowid, engWord, hebWord, examples)
+            VALUES ('delete', old.id, old.engWord, old.hebWord, old.examples);
+            INSERT INTO vocabulary_fts (rowid, engWord, hebWord, examples)
+            VALUES (new.id, new.engWord, new.hebWord, new.examples);
+        END
+    """)
+
+    # Index the rows that are already there
+    cursor.execute("INSERT INTO vocabulary_fts (vocabulary_fts) VALUES ('rebuild')")
+
+
+def _drop_group_stats_triggers(cursor: sqlite3.Cursor) -> None:
+    for trigger in ("group_stats_insert", "group_stats_delete", "group_stats_update"):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+
+def _create_group_stats_triggers(cursor: sqlite3.Cursor, group_column: str,
+                                 no_group: str, no_difficulty: Optional[str] = None) -> None:
+    """
+    Triggers keeping group_stats in step with every vocabulary insert,
+    delete and update, then the counters seeded from the existing rows.
+
+    Args:
+        group_column: The vocabulary column group_stats is keyed by
+        no_group: SQL literal a NULL group is counted under ('' or 0)
+        no_difficulty: SQL literal a NULL difficulty is counted under
+            (None if difficulty can't be NULL)
+    """
+    def key(row: str) -> Tuple[str, str]:
+        group = f"coalesce({row}{group_column}, {no_group})"
+        difficulty = f"coalesce({row}difficulty, {no_difficulty})" if no_difficulty else f"{row}difficulty"
+        return group, difficulty
+
+    new_group, new_difficulty = key("new.")
+    old_group, old_difficulty = key("old.")
+
+    add_row = f"""
+        INSERT INTO group_stats ({group_column}, difficulty, word_count, with_examples)
+        VALUES ({new_group}, {new_difficulty}, 1,
+                new.examples IS NOT NULL AND new.examples != '')
+        ON CONFLICT ({group_column}, difficulty) DO UPDATE SET
+            word_count = word_count + 1,
+            with_examples = with_examples + excluded.with_examples;
+    """
+    remove_row = f"""
+        UPDATE group_stats SET
+            word_count = word_count - 1,
+            with_examples = with_examples - (old.examples IS NOT NULL AND old.examples != '')
+        WHERE {group_column} = {old_group} AND difficulty = {old_difficulty};
+        DELETE FROM group_stats WHERE word_count <= 0;
+    """
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS group_stats_insert AFTER INSERT ON vocabulary BEGIN
+            {add_row}
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS group_stats_delete AFTER DELETE ON vocabulary BEGIN
+            {remove_row}
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS group_stats_update
+        AFTER UPDATE OF {group_column}, difficulty, examples ON vocabulary BEGIN
+            {remove_row}
+            {add_row}
+        END
+    """)
+
+    # Seed the counters from the existing rows
+    group, difficulty = key("")
+    cursor.execute("DELETE FROM group_stats")
+    cursor.execute(f"""
+        INSERT INTO group_stats ({group_column}, difficulty, word_count, with_examples)
+        SELECT {group}, {difficulty}, COUNT(*),
+               SUM(examples IS NOT NULL AND examples != '')
+        FROM vocabulary
+        GROUP BY 1, 2
+    """)
+
+
+def _create_group_stats(cursor: sqlite3.Cursor) -> None:
+    """
+    Per (group, difficulty) word counters, kept up to date by triggers.
+
+    Statistics read these few rows instead of aggregating the whole
+    vocabulary table.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS group_stats
+        (group_name TEXT NOT NULL,
+         difficulty TEXT NOT NULL,
+         word_count INTEGER NOT NULL DEFAULT 0,
+         with_examples INTEGER NOT NULL DEFAULT 0,
+         PRIMARY KEY (group_name, difficulty))
+    """)
+
+    # NULL group/difficulty are counted under '' so they still fit the key
+    _create_group_stats_triggers(cursor, "group_name", no_group="''", no_difficulty="''")
+
+
+def _normalize_groups(cursor: sqlite3.Cursor) -> None:
+    """
+    Move free-text group names into books/groups tables.
+
+    vocabulary.group_name is replaced by an integer group_id (NULL = no
+    group). Groups named "<book> <number>" get a books row and a chapter,
+    so the book/chapter hierarchy is stored instead of re-derived.
+    group_stats is rebuilt keyed by group_id (0 = no group).
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS books
+        (id INTEGER PRIMARY KEY,
+         name TEXT NOT NULL UNIQUE)
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS groups
+        (id INTEGER PRIMARY KEY,
+         name TEXT NOT NULL UNIQUE,
+         book_id INTEGER REFERENCES books(id),
+         chapter TEXT)
+    """)
+
+    # One groups row per distinct name (plus its book, if the name has a chapter number)
+    cursor.execute("SELECT DISTINCT group_name FROM vocabulary WHERE group_name IS NOT NULL AND group_name != ''")
+    for (group_name,) in cursor.fetchall():
+        match = re.match(r'^(.+?)\s+(\d+|[IVX]+)$', group_name)
+        book_id, chapter = None, None
+        if match:
+            cursor.execute("INSERT OR IGNORE INTO books (name) VALUES (?)", (match.group(1),))
+            cursor.execute("SELECT id FROM books WHERE name = ?", (match.group(1),))
+            book_id, chapter = cursor.fetchone()[0], match.group(2)
+        cursor.execute("INSERT OR IGNORE INTO groups (name, book_id, chapter) VALUES (?, ?, ?)",
+                       (group_name, book_id, chapter))
+
+    cursor.execute("ALTER TABLE vocabulary ADD COLUMN group_id INTEGER REFERENCES groups(id)")
+    cursor.execute("UPDATE vocabulary SET group_id = (SELECT id FROM groups WHERE name = vocabulary.group_name)")
+
+    # Nothing may still reference group_name when it is dropped
+    _drop_group_stats_triggers(cursor)
+    cursor.execute("DROP INDEX IF EXISTS idx_vocabulary_group")
+    cursor.execute("DROP INDEX IF EXISTS idx_vocabulary_group_difficulty")
+    cursor.execute("ALTER TABLE vocabulary DROP COLUMN group_name")
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_group_id ON vocabulary (group_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_group_difficulty "
+                   "ON vocabulary (group_id, difficulty)")
+
+    # group_stats, now keyed by group_id
+    cursor.execute("DROP TABLE IF EXISTS group_stats")
+    cursor.execute("""
+        CREATE TABLE group_stats
+        (group_id INTEGER NOT NULL,
+         difficulty TEXT NOT NULL,
+         word_count INTEGER NOT NULL DEFAULT 0,
+         with_examples INTEGER NOT NULL DEFAULT 0,
+         PRIMARY KEY (group_id, difficulty))
+    """)
+
+    _create_group_stats_triggers(cursor, "group_id", no_group="0", no_difficulty="''")
+
+
+def _integer_difficulty(cursor: sqlite3.Cursor) -> None:
+    """
+    Store difficulty as the Difficulty enum's integer value, with an index.
+
+    Unknown names become NEW_WORD (0). group_stats is rebuilt with an
+    integer difficulty too.
+    """
+    cursor.execute("ALTER TABLE vocabulary ADD COLUMN difficulty_level INTEGER NOT NULL DEFAULT 0")
+    cursor.execute("""
+        UPDATE vocabulary SET difficulty_level = CASE upper(difficulty)
+            WHEN 'EASY' THEN 1
+            WHEN 'MEDIUM' THEN 2
+            WHEN 'HARD' THEN 3
+            ELSE 0
+        END
+    """)
+
+    # Nothing may still reference the old column when it is dropped
+    _drop_group_stats_triggers(cursor)
+    cursor.execute("DROP INDEX IF EXISTS idx_vocabulary_group_difficulty")
+    cursor.execute("ALTER TABLE vocabulary DROP COLUMN difficulty")
+    cursor.execute("ALTER TABLE vocabulary RENAME COLUMN difficulty_level TO difficulty")
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_difficulty ON vocabulary (difficulty)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_group_difficulty "
+                   "ON vocabulary (group_id, difficulty)")
+
+    cursor.execute("DROP TABLE IF EXISTS group_stats")
+    cursor.execute("""
+        CREATE TABLE group_stats
+        (group_id INTEGER NOT NULL,
+         difficulty INTEGER NOT NULL,
+         word_count INTEGER NOT NULL DEFAULT 0,
+         with_examples INTEGER NOT NULL DEFAULT 0,
+         PRIMARY KEY (group_id, difficulty))
+    """)
+
+    _create_group_stats_triggers(cursor, "group_id", no_group="0")
+
+
+def _add_review_schedule(cursor: sqlite3.Cursor) -> None:
+    """
+    Spaced-repetition state per word, plus an index on the due time.
+
+    Words never reviewed have due_at NULL. Words the user has already
+    rated get a starting schedule from their difficulty: HARD words are
+    due now and start over, MEDIUM words are due in a day and EASY words
+    in three days.
+    """
+    cursor.execute("ALTER TABLE vocabulary ADD COLUMN ease REAL NOT NULL DEFAULT 2.5")
+    cursor.execute("ALTER TABLE vocabulary ADD COLUMN interval_days REAL NOT NULL DEFAULT 0")
+    cursor.execute("ALTER TABLE vocabulary ADD COLUMN repetitions INTEGER NOT NULL DEFAULT 0")
+    cursor.execute("ALTER TABLE vocabulary ADD COLUMN due_at REAL")
+
+    cursor.execute("""
+        UPDATE vocabulary SET
+            repetitions = CASE difficulty WHEN 3 THEN 0 ELSE 1 END,
+            ease = CASE difficulty WHEN 3 THEN 1.8 WHEN 2 THEN 2.2 ELSE 2.5 END,
+            interval_days = CASE difficulty WHEN 3 THEN 0 WHEN 2 THEN 1 ELSE 3 END,
+            due_at = ? + CASE difficulty WHEN 3 THEN 0 WHEN 2 THEN 1 ELSE 3 END * 86400
+        WHERE difficulty > 0
+    """, (time.time(),))
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_due_at ON vocabulary (due_at)")
+
+
+def _create_reviews(cursor: sqlite3.Cursor) -> None:
+    """
+    Append-only history of every answer.
+
+    Reviews of a deleted word go with it, so a reused word id never
+    inherits someone else's history.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS reviews (
+            id INTEGER PRIMARY KEY,
+            word_id INTEGER NOT NULL,
+            mode TEXT NOT NULL,
+            correct INTEGER NOT NULL,
+            answer TEXT,
+            response_ms INTEGER,
+            reviewed_at REAL NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_word_time ON reviews (word_id, reviewed_at)")
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS reviews_word_delete AFTER DELETE ON vocabulary BEGIN
+            DELETE FROM reviews WHERE word_id = old.id;
+        END
+    """)
+
+
+def _create_cloze_items(cursor: sqlite3.Cursor) -> None:
+    """
+    Prepared fill-in-the-blank sentences: one row per usable example
+    sentence, with the character span of the word to blank out.
+
+    The rows are built in Python (ClozeItems.build_pending), not here.
+    cloze_built = 0 marks a word whose rows still need (re)building -
+    every word after this migration, new words, and words whose examples
+    (or spelling) change.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS cloze_items (
+            id INTEGER PRIMARY KEY,
+            word_id INTEGER NOT NULL,
+            sentence TEXT NOT NULL,
+            blank_start INTEGER NOT NULL,
+            blank_end INTEGER NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_cloze_items_word_id ON cloze_items (word_id)")
+
+    cursor.execute("ALTER TABLE vocabulary ADD COLUMN cloze_built INTEGER NOT NULL DEFAULT 0")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_cloze_pending ON vocabulary (id) WHERE cloze_built = 0")
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS cloze_items_word_delete AFTER DELETE ON vocabulary BEGIN
+            DELETE FROM cloze_items WHERE word_id = old.id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS cloze_items_examples_update AFTER UPDATE OF engWord, examples ON vocabulary
+        WHEN old.examples IS NOT new.examples OR old.engWord IS NOT new.engWord BEGIN
+            DELETE FROM cloze_items WHERE word_id = old.id;
+            UPDATE vocabulary SET cloze_built = 0 WHERE id = old.id;
+        END
+    """)
+
+
+def _rebuild_cloze_items(cursor: sqlite3.Cursor) -> None:
+    """
+    WordMatcher's forms changed, so sentences built before may be missing
+    or blank the wrong word. Mark every word for a rebuild; the existing
+    rows stay until each word is rebuilt.
+
+    10: irregular forms are matched (ran, went, mice)
+    11: a word that is itself an irregular form (bore, wound) no longer
+        matches its lemma's family (bear, wind)
+    """
+    cursor.execute("UPDATE vocabulary SET cloze_built = 0")
+
+
+# (version, description, step) - keep sorted by version
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, "create vocabulary table", _create_vocabulary_table),
+    (2, "index vocabulary lookups", _index_vocabulary_lookups),
+    (3, "full-text search index", _create_full_text_index),
+    (4, "trigger-maintained group counters", _create_group_stats),
+    (5, "normalize books and groups", _normalize_groups),
+    (6, "integer difficulty column", _integer_difficulty),
+    (7, "spaced repetition schedule", _add_review_schedule),
+    (8, "review history", _create_reviews),
+    (9, "prepared cloze sentences", _create_cloze_items),
+    (10, "rebuild cloze sentences with irregular forms", _rebuild_cloze_items),
+    (11, "rebuild cloze sentences without lemma families", _rebuild_cloze_items),
+]
+
+
+# ==================== Runner ====================
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """Return the highest applied migration version (0 for a fresh database)."""
+    connection.execute('''CREATE TABLE IF NOT EXISTS schema_version
+                       (version INTEGER PRIMARY KEY,
+                        description TEXT,
+                        applied_at TEXT)''')
+    row = connection.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def run_migrations(connection: sqlite3.Connection) -> int:
+    """
+    Apply all pending migrations in order.
+
+    Args:
+        connection: Open connection to the vocabulary database
+
+    Returns:
+        The schema version after migrating
+    """
+    current_version = get_schema_version(connection)
+    connection.commit()
+
+    for version, description, step in MIGRATIONS:
+        if version <= current_version:
+            continue
+
+        cursor = connection.cursor()
+        try:
+            cursor.execute("BEGIN")
+            step(cursor)
+            cursor.execute(
+                "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                (version, description, datetime.now().isoformat(timespec="seconds"))
+            )
+            connection.commit()
+            print(f"Applied migration {version}: {description}")
+            current_version = version
+        except Exception as e:
+            connection.rollback()
+            print(f"Migration {version} ({description}) failed: {e}")
+            raise
+        finally:
+            cursor.close()
+
+    return current_version
@@ -0,0 +1,81 @@
+"""
+Review Log
+
+Buffered writer for the append-only reviews table (see Migrations.py).
+
+Answers are kept in memory and inserted in one batch - when BATCH_SIZE
+answers are waiting, when the oldest one has waited FLUSH_INTERVAL
+seconds, or when flush() is called (session end, shutdown). Recording an
+answer therefore costs no commit on the click that produced it.
+
+The age check runs on each add() and on flush_if_due(), which the app
+calls from a Tk timer (AppController) so a session left idle still gets
+written.
+"""
+import sqlite3
+import time
+from typing import List, Optional, Tuple
+
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 30.0  # seconds
+
+# Modes, as stored in reviews.mode
+MODE_QUIZ = "quiz"
+MODE_FILL_BLANK = "fill_blank"
+MODE_FLASHCARDS = "flashcards"
+
+
+class ReviewLog:
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        # (eng_word_lower, mode, correct, answer, response_ms, reviewed_at)
+        self._pending: List[Tuple] = []
+        self._oldest_at: Optional[float] = None  # time.monotonic() of _pending[0]
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, eng_word: str, mode: str, correct: bool,
+            answer: Optional[str] = None, response_ms: Optional[int] = None) -> None:
+        """Buffer one answer; flushes if the batch is full or old enough."""
+        if not self._pending:
+            self._oldest_at = time.monotonic()
+
+        self._pending.append((eng_word.lower(), mode, int(bool(correct)), answer, response_ms, time.time()))
+
+        if len(self._pending) >= BATCH_SIZE:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush_if_due(self) -> int:
+        """Flush if the oldest buffered answer has waited FLUSH_INTERVAL. Returns the number written."""
+        if self._oldest_at is None or time.monotonic() - self._oldest_at < FLUSH_INTERVAL:
+            return 0
+        return self.flush()
+
+    def flush(self) -> int:
+        """Write every buffered answer in one transaction. Returns the number written."""
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, []
+        self._oldest_at = None
+
+        try:
+            # Words deleted since the answer was given are skipped by the join
+            self.connection.executemany("""
+                INSERT INTO reviews (word_id, mode, correct, answer, response_ms, reviewed_at)
+                SELECT id, ?, ?, ?, ?, ? FROM vocabulary WHERE lower(engWord) = ?
+            """, [(mode, correct, answer, response_ms, reviewed_at, word)
+                  for word, mode, correct, answer, response_ms, reviewed_at in batch])
+            self.connection.commit()
+            return len(batch)
+
+        except sqlite3.Error as e:
+            print(f"Error writing reviews: {e}")
+            self.connection.rollback()
+            # Keep the answers for the next attempt
+            self._pending = batch + self._pending
+            self._oldest_at = time.monotonic()
+            return 0
@@ -0,0 +1,49 @@
+"""
+Vocabulary Events
+
+Small observer/event bus used by VocabularyStore to tell the views and
+controllers exactly what changed, so they can update the affected rows
+instead of reloading everything.
+
+Payloads (keyword arguments passed to subscribers):
+    WORD_ADDED          word: Tuple (english, hebrew, difficulty, group)
+    WORD_DELETED        english: str
+    DIFFICULTY_CHANGED  english: str, old: str, new: str
+    GROUP_CHANGED       english: str, old: str, new: str
+    GROUP_RENAMED       old: str, new: str
+    EXAMPLES_CHANGED    english: str, examples: str
+    RELOADED            (no payload - everything may have changed)
+"""
+from enum import Enum
+from typing import Callable, Dict, List
+
+
+class VocabularyEvent(Enum):
+    WORD_ADDED = "word_added"
+    WORD_DELETED = "word_deleted"
+    DIFFICULTY_CHANGED = "difficulty_changed"
+    GROUP_CHANGED = "group_changed"
+    GROUP_RENAMED = "group_renamed"
+    EXAMPLES_CHANGED = "examples_changed"
+    RELOADED = "reloaded"
+
+
+class EventBus:
+    def __init__(self):
+        self._subscribers: Dict[VocabularyEvent, List[Callable]] = {}
+
+    def subscribe(self, event: VocabularyEvent, callback: Callable) -> None:
+        self._subscribers.setdefault(event, []).append(callback)
+
+    def unsubscribe(self, event: VocabularyEvent, callback: Callable) -> None:
+        callbacks = self._subscribers.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def publish(self, event: VocabularyEvent, **payload) -> None:
+        """Call every subscriber of `event`; one failing subscriber doesn't stop the rest."""
+        for callback in list(self._subscribers.get(event, [])):
+            try:
+                callback(**payload)
+            except Exception as e:
+                print(f"Error handling {event.value}: {e}")
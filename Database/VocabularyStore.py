@@ -0,0 +1,244 @@
+"""
+Vocabulary Store
+
+Single in-memory copy of the vocabulary shared by all controllers.
+
+The table is loaded once at startup and indexed by word, group and
+difficulty. Reads never touch SQLite; writes go through to the
+DatabaseManager first, then update the in-memory indexes and publish a
+VocabularyEvent on `store.events` describing the change.
+"""
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from Database.DatabaseManager import DatabaseManager
+from Database.VocabularyEvents import EventBus, VocabularyEvent
+
+
+class WordRecord:
+    """One vocabulary row, kept small with __slots__."""
+    __slots__ = ("english", "hebrew", "difficulty", "group", "examples")
+
+    def __init__(self, english: str, hebrew: str, difficulty: str, group: str, examples: Optional[str]):
+        self.english = english
+        self.hebrew = hebrew
+        # Only a handful of distinct values - share one string object each
+        self.difficulty = sys.intern(difficulty) if difficulty else difficulty
+        self.group = sys.intern(group) if group else group
+        self.examples = examples
+
+    def as_tuple(self) -> Tuple[str, str, str, str]:
+        """(english, hebrew, difficulty, group) - same shape as get_full_data()."""
+        return self.english, self.hebrew, self.difficulty, self.group
+
+    def as_example_tuple(self) -> Tuple[str, str, str, str, str]:
+        """(english, hebrew, difficulty, examples, group) - same shape as get_words_with_examples()."""
+        return self.english, self.hebrew, self.difficulty, self.examples, self.group
+
+
+class VocabularyStore:
+    def __init__(self, model: DatabaseManager):
+        self.model = model
+        self.events = EventBus()
+
+        # Primary index: lowercase English word -> record
+        self._words: Dict[str, WordRecord] = {}
+        # Secondary indexes: value -> {lowercase word: record}
+        self._by_group: Dict[str, Dict[str, WordRecord]] = {}
+        self._by_difficulty: Dict[str, Dict[str, WordRecord]] = {}
+
+        self.reload()
+
+    # ==================== Loading ====================
+
+    def reload(self) -> None:
+        """(Re)load the whole vocabulary with a single query."""
+        self._words.clear()
+        self._by_group.clear()
+        self._by_difficulty.clear()
+
+        for english, hebrew, difficulty, group, examples in self.model.get_all_word_details():
+            self._index(WordRecord(english, hebrew, difficulty, group, examples))
+
+        self.events.publish(VocabularyEvent.RELOADED)
+
+    def _index(self, record: WordRecord) -> None:
+        key = record.english.lower()
+        self._words[key] = record
+        self._by_group.setdefault(record.group, {})[key] = record
+        self._by_difficulty.setdefault(record.difficulty, {})[key] = record
+
+    def _unindex(self, record: WordRecord) -> None:
+        key = record.english.lower()
+        self._words.pop(key, None)
+
+        for index, value in ((self._by_group, record.group), (self._by_difficulty, record.difficulty)):
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del index[value]
+
+    def _load_word(self, eng_word: str) -> Optional[WordRecord]:
+        """Read one word back from the database into the indexes."""
+        details = self.model.get_word_details(eng_word)
+        if not details:
+            return None
+
+        # SELECT * -> (id, engWord, hebWord, examples, difficulty, group_name)
+        record = WordRecord(details[1], details[2], details[4], details[5], details[3])
+        self._index(record)
+        self.events.publish(VocabularyEvent.WORD_ADDED, word=record.as_tuple())
+        return record
+
+    # ==================== Queries ====================
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, eng_word: str) -> bool:
+        return eng_word.lower() in self._words
+
+    def get(self, eng_word: str) -> Optional[WordRecord]:
+        return self._words.get(eng_word.lower())
+
+    def all_words(self) -> List[Tuple]:
+        """All words as (english, hebrew, difficulty, group)."""
+        return [record.as_tuple() for record in self._words.values()]
+
+    def english_words(self) -> List[str]:
+        return [record.english for record in self._words.values()]
+
+    def words_by_groups(self, groups: Iterable[str]) -> List[Tuple]:
+        """Words in any of the groups, as (english, hebrew, difficulty, group)."""
+        return [record.as_tuple()
+                for group in groups
+                for record in self._by_group.get(group, {}).values()]
+
+    def words_by_difficulties(self, difficulties: Iterable[str]) -> List[Tuple]:
+        """Words with any of the difficulties, as (english, hebrew, difficulty, group)."""
+        return [record.as_tuple()
+                for difficulty in difficulties
+                for record in self._by_difficulty.get(difficulty, {}).values()]
+
+    def words_with_examples(self, groups: Optional[Iterable[str]] = None) -> List[Tuple]:
+        """Words that have examples, as (english, hebrew, difficulty, examples, group)."""
+        if groups is None:
+            records = self._words.values()
+        else:
+            records = [record for group in groups for record in self._by_group.get(group, {}).values()]
+
+        return [record.as_example_tuple() for record in records
+                if record.examples and record.examples.strip()]
+
+    def group_names(self) -> List[str]:
+        """Names of all groups that have words (including an empty name, if used)."""
+        return list(self._by_group.keys())
+
+    def difficulty_counts(self) -> Dict[str, int]:
+        return {difficulty: len(bucket) for difficulty, bucket in self._by_difficulty.items()}
+
+    # ==================== Write-through Updates ====================
+
+    def add_word(self, eng_word: str, group_name: str = "New_Words") -> bool:
+        if not self.model.add_word(eng_word, group_name):
+            return False
+
+        self._load_word(eng_word)
+        return True
+
+    def add_from_file(self, filepath: str) -> Dict[str, str]:
+        report = self.model.add_from_file(filepath)
+        self._load_added(report)
+        return report
+
+    def add_highlight_words_from_pdf(self, filepath: str) -> Dict[str, str]:
+        report = self.model.add_highlight_words_from_pdf(filepath)
+        self._load_added(report)
+        return report
+
+    def _load_added(self, report: Dict[str, str]) -> None:
+        added = [word for word, status in report.items() if status == "added"]
+
+        # Large imports: one full reload beats many single-row queries
+        if len(added) > 50:
+            self.reload()
+        else:
+            for word in added:
+                self._load_word(word)
+
+    def update_difficulty(self, eng_word: str, difficulty: str) -> None:
+        self.model.update_difficulty(eng_word, difficulty)
+
+        record = self.get(eng_word)
+        if record is not None and record.difficulty != difficulty:
+            old_difficulty = record.difficulty
+            self._unindex(record)
+            record.difficulty = sys.intern(difficulty)
+            self._index(record)
+            self.events.publish(VocabularyEvent.DIFFICULTY_CHANGED,
+                                english=record.english, old=old_difficulty, new=record.difficulty)
+
+    def update_group(self, eng_word: str, new_group: str) -> bool:
+        if not self.model.update_group(eng_word, new_group):
+            return False
+
+        record = self.get(eng_word)
+        if record is not None and record.group != new_group:
+            old_group = record.group
+            self._unindex(record)
+            record.group = sys.intern(new_group) if new_group else new_group
+            self._index(record)
+            self.events.publish(VocabularyEvent.GROUP_CHANGED,
+                                english=record.english, old=old_group, new=record.group)
+        return True
+
+    def update_examples(self, eng_word: str, examples: str) -> bool:
+        if not self.model.update_examples(eng_word, examples):
+            return False
+
+        record = self.get(eng_word)
+        if record is not None and record.examples != examples:
+            record.examples = examples
+            self.events.publish(VocabularyEvent.EXAMPLES_CHANGED, english=record.english, examples=examples)
+        return True
+
+    def delete_word(self, eng_word: str) -> bool:
+        if not self.model.delete_word(eng_word):
+            return False
+
+        record = self.get(eng_word)
+        if record is not None:
+            self._unindex(record)
+            self.events.publish(VocabularyEvent.WORD_DELETED, english=record.english)
+        return True
+
+    def rename_group(self, old_name: str, new_name: str) -> bool:
+        if not self.model.rename_group(old_name, new_name):
+            return False
+
+        self._move_group(old_name, new_name)
+        return True
+
+    def delete_group(self, group_name: str, reassign_to: Optional[str] = None) -> bool:
+        if not self.model.delete_group(group_name, reassign_to):
+            return False
+
+        self._move_group(group_name, reassign_to if reassign_to else "")
+        return True
+
+    def _move_group(self, old_name: str, new_name: str) -> None:
+        for record in list(self._by_group.get(old_name, {}).values()):
+            self._unindex(record)
+            record.group = sys.intern(new_name) if new_name else new_name
+            self._index(record)
+
+        self.events.publish(VocabularyEvent.GROUP_RENAMED, old=old_name, new=new_name)
+
+    def create_group(self, group_name: str) -> bool:
+        if not self.model.create_group(group_name):
+            return False
+
+        # List the new (still empty) group until it gets words
+        self._by_group.setdefault(group_name, {})
+        return True
@@ -0,0 +1,179 @@
+"""
+Write-Behind Queue
+
+Per-word column updates (difficulty, review schedule) made during a
+session are queued in memory instead of being committed on the Tk thread.
+
+- Updates are coalesced per word: rating the same card three times
+  writes it once, with the last values
+- A background thread writes everything queued in one transaction every
+  FLUSH_INTERVAL seconds, using its own SQLite connection
+- A batch that fails to commit is put back in the queue and retried with
+  the next one; it only counts as written once a commit succeeds
+- flush() blocks until everything queued so far is committed (or the
+  attempt failed); close() does a final write, retried a few times, and
+  raises if updates are still left rather than dropping them
+"""
+import sqlite3
+import threading
+import time
+from typing import Any, Dict
+
+FLUSH_INTERVAL = 2.0  # seconds
+# Final write on close: attempts, and the wait between them (seconds)
+CLOSE_RETRIES = 3
+CLOSE_RETRY_DELAY = 0.5
+
+
+class WriteBehindQueue:
+    def __init__(self, db_path: str, flush_interval: float = FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+
+        # lowercase English word -> {column: value}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # The batch the writer has taken but not committed yet
+        self._in_flight: Dict[str, Dict[str, Any]] = {}
+        self._condition = threading.Condition()
+        self._flush_now = False
+        self._stopping = False
+        # Batches are numbered as the writer takes them. A failed batch goes back
+        # into the queue, so committing batch n means every batch up to n is written.
+        self._taken = 0
+        self._committed = 0
+        self._failed = 0
+
+        self._thread = threading.Thread(target=self._run, name="WriteBehindQueue", daemon=True)
+        self._thread.start()
+
+    # ==================== Queueing ====================
+
+    def update(self, eng_word: str, **columns) -> None:
+        """Queue `UPDATE vocabulary SET <columns> WHERE lower(engWord) = eng_word`."""
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("WriteBehindQueue is closed")
+            self._pending.setdefault(eng_word.lower(), {}).update(columns)
+
+    def pending(self, eng_word: str) -> Dict[str, Any]:
+        """Values for a word that aren't committed yet - queued or being written (empty if none)."""
+        eng_word = eng_word.lower()
+        with self._condition:
+            return {**self._in_flight.get(eng_word, {}), **self._pending.get(eng_word, {})}
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._pending.keys() | self._in_flight.keys())
+
+    def flush(self) -> bool:
+        """
+        Write everything queued so far, and wait until it's committed.
+
+        Returns False if the write failed - the updates stay queued and
+        are retried with the next batch.
+        """
+        with self._condition:
+            target = self._taken + (1 if self._pending else 0)
+            if target == self._committed:
+                return True  # Nothing queued or being written
+
+            self._flush_now = True
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._committed >= target or self._failed >= target
+                                     or not self._thread.is_alive())
+            return self._committed >= target
+
+    def close(self) -> None:
+        """
+        Write what's left and stop the background thread.
+
+        Raises:
+            sqlite3.OperationalError: if updates are still unwritten after
+                the final attempts. They stay available through drain().
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join()
+
+        if self._pending:
+            raise sqlite3.OperationalError(f"{len(self._pending)} queued updates could not be written")
+
+    def drain(self) -> Dict[str, Dict[str, Any]]:
+        """Take the unwritten updates out of a closed queue, e.g. to write them another way."""
+        with self._condition:
+            if self._thread.is_alive():
+                raise RuntimeError("WriteBehindQueue is still running")
+            batch, self._pending = self._pending, {}
+            return batch
+
+    # ==================== Background Writer ====================
+
+    def _run(self) -> None:
+        connection = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._flush_now or self._stopping,
+                                             timeout=self.flush_interval)
+                    self._flush_now = False
+                    stopping = self._stopping
+                    batch, self._pending = self._pending, {}
+                    self._in_flight = batch
+                    if batch:
+                        self._taken += 1
+                        number = self._taken
+
+                written = not batch or self.write(connection, batch)
+                if stopping:
+                    for _ in range(CLOSE_RETRIES - 1):
+                        if written:
+                            break
+                        time.sleep(CLOSE_RETRY_DELAY)
+                        written = self.write(connection, batch)
+
+                with self._condition:
+                    if not written:
+                        self._requeue(batch)
+                    self._in_flight = {}
+                    if batch:
+                        if written:
+                            self._committed = number
+                        else:
+                            self._failed = number
+                    self._condition.notify_all()
+
+                if stopping:
+                    break
+        finally:
+            connection.close()
+            # Wake up anyone still waiting in flush()
+            with self._condition:
+                self._condition.notify_all()
+
+    @staticmethod
+    def write(connection: sqlite3.Connection, batch: Dict[str, Dict[str, Any]]) -> bool:
+        """Write a batch of updates in one transaction. Returns False if it failed."""
+        # One executemany per distinct set of columns
+        by_columns: Dict[tuple, list] = {}
+        for word, columns in batch.items():
+            names = tuple(sorted(columns))
+            by_columns.setdefault(names, []).append((*(columns[name] for name in names), word))
+
+        try:
+            with connection:
+                for names, rows in by_columns.items():
+                    assignments = ", ".join(f"{name} = ?" for name in names)
+                    connection.executemany(
+                        f"UPDATE vocabulary SET {assignments} WHERE lower(engWord) = ?", rows
+                    )
+            return True
+
+        except sqlite3.Error as e:
+            print(f"Error writing queued updates: {e}")
+            return False
+
+    def _requeue(self, batch: Dict[str, Dict[str, Any]]) -> None:
+        """Put a failed batch back, without overwriting anything queued since (caller holds the lock)."""
+        for word, columns in batch.items():
+            self._pending[word] = {**columns, **self._pending.get(word, {})}
@@ -0,0 +1,112 @@
+"""
+Micro-benchmark for the fill-in-the-blank word matching.
+
+Times the per-question work (find the sentences containing the word, then
+blank it out) for every word with examples, using:
+- before: patterns rebuilt and matched through re.search on every sentence
+- after:  WordMatcher's cached form table (first pass cold, then warm)
+
+The legacy forms are regular only, so questions where an irregular form
+(ran, went, mice) is matched first are counted rather than compared.
+
+Usage: python Scripts/benchmark_word_matcher.py [path/to/vocabulary.db]
+"""
+import os
+import re
+import sqlite3
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Utils.WordMatcher import WordMatcher, compiled_pattern, _forms, _token_forms
+
+
+# ==================== Before (uncached) ====================
+
+def legacy_forms(word):
+    word = word.lower()
+    forms = [word]
+    if word.endswith('y') and len(word) > 2:
+        forms.append(word[:-1] + 'ies')
+    if len(word) >= 3 and word[-1] in 'bcdfghjklmnpqrstvwxyz' and word[-2] in 'aeiou':
+        forms.extend([word + word[-1] + 'ing', word + word[-1] + 'ed', word + word[-1] + 'er'])
+    if word.endswith('e') and len(word) > 2:
+        forms.append(word[:-1] + 'ing')
+    forms.extend([word + 's', word + 'es', word + 'ing', word + 'ed',
+                  word + 'd', word + 'er', word + 'est', word + 'ly', word + 'en'])
+    return list(set(forms))
+
+
+def legacy_pattern(word):
+    forms = legacy_forms(word)
+    forms.sort(key=len, reverse=True)
+    return r'\b(?:' + '|'.join(re.escape(f) for f in forms) + r')\b'
+
+
+def legacy_question(word, examples):
+    matches = [s.strip() for s in re.split(r'[\n]+', examples)
+               if len(s.strip()) >= 10 and re.search(legacy_pattern(word), s.strip(), re.IGNORECASE)]
+    if not matches:
+        return None
+    match = re.search(legacy_pattern(word), matches[0], re.IGNORECASE)
+    return matches[0][:match.start()] + "_____" + matches[0][match.end():]
+
+
+# ==================== After (cached) ====================
+
+def cached_question(word, examples):
+    matches = [s.strip() for s in re.split(r'[\n]+', examples)
+               if len(s.strip()) >= 10 and WordMatcher.word_matches(word, s.strip())]
+    if not matches:
+        return None
+    match = WordMatcher.find(word, matches[0])
+    return matches[0][:match.start()] + "_____" + matches[0][match.end():]
+
+
+# ==================== Benchmark ====================
+
+def run(question, words, label):
+    start = time.perf_counter()
+    results = [question(word, examples) for word, examples in words]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<14} {elapsed * 1000:>9.1f} ms total  {elapsed / len(words) * 1e6:>8.1f} us/question")
+    return results
+
+
+def main():
+    db_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, "Database", "vocabulary.db")
+    connection = sqlite3.connect(db_path)
+    words = connection.execute(
+        "SELECT engWord, examples FROM vocabulary WHERE examples IS NOT NULL AND examples != ''"
+    ).fetchall()
+    connection.close()
+
+    if not words:
+        print("No words with examples.")
+        return
+
+    print(f"{len(words)} words with examples\n")
+
+    re.purge()
+    before = run(legacy_question, words, "before")
+
+    compiled_pattern.cache_clear()
+    _forms.cache_clear()
+    _token_forms.cache_clear()
+    after_cold = run(cached_question, words, "after (cold)")
+    after_warm = run(cached_question, words, "after (warm)")
+
+    assert after_cold == after_warm, "Cold and warm results differ"
+
+    # Irregular forms (ran, went, mice) only match since the Lemmatizer
+    changed = sum(b != a for b, a in zip(before, after_cold))
+    print(f"\n{len(words) - changed} of {len(words)} questions unchanged, "
+          f"{changed} differ by an irregular form")
+    print(f"Playable: {sum(r is not None for r in before)} before, "
+          f"{sum(r is not None for r in after_cold)} after")
+
+
+if __name__ == '__main__':
+    main()
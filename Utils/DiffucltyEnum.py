@@ -7,3 +7,11 @@ class Difficulty(Enum):
     MEDIUM = 2
     HARD = 3
 
+    @classmethod
+    def from_name(cls, name):
+        """Difficulty for a name in any case ("HARD", "Hard"...), or None."""
+        try:
+            return cls[str(name).upper()]
+        except KeyError:
+            return None
+
@@ -0,0 +1,83 @@
+"""
+Distractor Pool
+
+Wrong answers for the multiple-choice quiz, kept as an array of distinct
+Hebrew translations.
+
+sample() draws k distinct positions with random.sample over a range, and
+skips the correct answer by shifting positions past it. There are no
+retries and no list copies, so each question costs O(k) whatever the
+vocabulary size. Adding and removing words is O(1) (swap with the last
+entry).
+"""
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class DistractorPool:
+    def __init__(self, words: Iterable[Tuple] = ()):
+        self._translations: List[str] = []       # Distinct Hebrew translations
+        self._positions: Dict[str, int] = {}     # translation -> index in _translations
+        self._counts: Dict[str, int] = {}        # translation -> number of words using it
+        self._hebrew_of: Dict[str, str] = {}     # lowercase English word -> translation
+
+        self.rebuild(words)
+
+    def __len__(self) -> int:
+        return len(self._translations)
+
+    # ==================== Building ====================
+
+    def rebuild(self, words: Iterable[Tuple]) -> None:
+        """Replace the pool with (english, hebrew, ...) rows."""
+        self._translations.clear()
+        self._positions.clear()
+        self._counts.clear()
+        self._hebrew_of.clear()
+
+        for word in words:
+            self.add(word[0], word[1])
+
+    def add(self, english: str, hebrew: str) -> None:
+        key = english.lower()
+        if key in self._hebrew_of:
+            self.remove(english)
+        if not hebrew:
+            return
+
+        self._hebrew_of[key] = hebrew
+        self._counts[hebrew] = self._counts.get(hebrew, 0) + 1
+        if hebrew not in self._positions:
+            self._positions[hebrew] = len(self._translations)
+            self._translations.append(hebrew)
+
+    def remove(self, english: str) -> None:
+        hebrew = self._hebrew_of.pop(english.lower(), None)
+        if hebrew is None:
+            return
+
+        self._counts[hebrew] -= 1
+        if self._counts[hebrew]:
+            return
+
+        # Last word with this translation - swap the last entry into its slot
+        del self._counts[hebrew]
+        position = self._positions.pop(hebrew)
+        last = self._translations.pop()
+        if last != hebrew:
+            self._translations[position] = last
+            self._positions[last] = position
+
+    # ==================== Sampling ====================
+
+    def sample(self, k: int, exclude: Optional[str] = None) -> List[str]:
+        """Up to k distinct translations, never `exclude`."""
+        excluded = self._positions.get(exclude) if exclude is not None else None
+        size = len(self._translations) - (excluded is not None)
+
+        picks = random.sample(range(size), min(k, size))
+        if excluded is not None:
+            # Positions at or past the excluded one shift up by one
+            picks = [pick + 1 if pick >= excluded else pick for pick in picks]
+
+        return [self._translations[pick] for pick in picks]
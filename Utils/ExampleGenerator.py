@@ -56,108 +56,129 @@ Only 2 methods (both FREE):
 """
 import re
 from typing import Optional
+from Utils.LookupCache import cached_lookup
 
 
 # ==================== Dictionary.com Scraper ====================
 
+def dictionary_com_url(word: str) -> str:
+    return f"https://www.dictionary.com/browse/{word.lower()}"
+
+
 def scrape_dictionary_com_examples(word: str) -> Optional[str]:
     try:
-        import requests
-        from bs4 import BeautifulSoup
+        return _fetch_dictionary_com_examples(word)
 
-        url = f"https://www.dictionary.com/browse/{word.lower()}"
+    except ImportError:
+        print("Error: beautifulsoup4 not installed")
+        print("Install: pip install beautifulsoup4 --break-system-packages")
+        return None
+    except Exception as e:
+        print(f"Error scraping dictionary.com: {e}")
+        return None
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
 
-        print(f"Fetching from dictionary.com: {word}")
-        response = requests.get(url, headers=headers, timeout=10)
+@cached_lookup("dictionary.com")
+def _fetch_dictionary_com_examples(word: str) -> Optional[str]:
+    """
+    Examples from dictionary.com, None if the word has none (cached).
 
-        if response.status_code != 200:
-            print(f"Failed to fetch: {response.status_code}")
-            return None
+    Raises on network errors and unexpected status codes, so those aren't cached.
+    """
+    from Utils.PageStore import fetch_page
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
 
-        examples = []
+    print(f"Fetching from dictionary.com: {word}")
+    status_code, html = fetch_page(dictionary_com_url(word), headers)
 
-        # Find the "Example Sentences" section
-        # Look for heading that says "Example Sentences"
-        example_heading = soup.find(['h2', 'h3', 'h4'], string=re.compile(r'Example Sentences?', re.IGNORECASE))
+    if status_code == 404:
+        print(f"Failed to fetch: {status_code}")
+        return None
+    if status_code != 200:
+        raise ConnectionError(f"dictionary.com returned status {status_code}")
 
-        if example_heading:
-            print("✓ Found 'Example Sentences' section")
+    return parse_dictionary_com_page(html, word)
 
-            # Get the container after the heading
-            container = example_heading.find_parent()
 
-            if container:
-                # Find all example sentence blocks
-                # They are usually in <p> or <div> tags after the heading
+def parse_dictionary_com_page(html: str, word: str) -> Optional[str]:
+    """Extract example sentences containing `word` from a dictionary.com page."""
+    from bs4 import BeautifulSoup
 
-                # Method 1: Look for siblings after the heading
-                for sibling in example_heading.find_next_siblings():
-                    # Look for text in paragraphs or divs
-                    text_elements = sibling.find_all(['p', 'div', 'span'])
+    soup = BeautifulSoup(html, 'html.parser')
 
-                    for elem in text_elements:
-                        text = elem.get_text().strip()
+    examples = []
 
-                        # Filter: should be a sentence (10-300 chars, contains the word)
-                        if text and 10 < len(text) < 300:
-                            # Remove extra whitespace
-                            text = re.sub(r'\s+', ' ', text)
+    # Find the "Example Sentences" section
+    # Look for heading that says "Example Sentences"
+    example_heading = soup.find(['h2', 'h3', 'h4'], string=re.compile(r'Example Sentences?', re.IGNORECASE))
 
-                            # Check if it contains the word (case-insensitive)
-                            if re.search(r'\b' + re.escape(word) + r'\b', text, re.IGNORECASE):
-                                # Remove source labels like "From BBC" at the end
-                                text = re.sub(r'\s*From\s+\w+.*$', '', text)
+    if example_heading:
+        print("✓ Found 'Example Sentences' section")
 
-                                if text and text not in examples:
-                                    examples.append(text)
+        # Get the container after the heading
+        container = example_heading.find_parent()
 
-                                    if len(examples) >= 7:
-                                        break
+        if container:
+            # Find all example sentence blocks
+            # They are usually in <p> or <div> tags after the heading
 
-                    if len(examples) >= 7:
-                        break
+            # Method 1: Look for siblings after the heading
+            for sibling in example_heading.find_next_siblings():
+                # Look for text in paragraphs or divs
+                text_elements = sibling.find_all(['p', 'div', 'span'])
 
-        # Method 2: If section not found, look for any examples on the page
-        if not examples:
-            print("Trying alternative method...")
+                for elem in text_elements:
+                    text = elem.get_text().strip()
 
-            # Look for common example containers
-            example_containers = soup.find_all(['div', 'p'], class_=re.compile(r'example|sentence', re.IGNORECASE))
+                    # Filter: should be a sentence (10-300 chars, contains the word)
+                    if text and 10 < len(text) < 300:
+                        # Remove extra whitespace
+                        text = re.sub(r'\s+', ' ', text)
 
-            for container in example_containers:
-                text = container.get_text().strip()
+                        # Check if it contains the word (case-insensitive)
+                        if re.search(r'\b' + re.escape(word) + r'\b', text, re.IGNORECASE):
+                            # Remove source labels like "From BBC" at the end
+                            text = re.sub(r'\s*From\s+\w+.*$', '', text)
 
-                if text and 10 < len(text) < 300:
-                    text = re.sub(r'\s+', ' ', text)
+                            if text and text not in examples:
+                                examples.append(text)
 
-                    if re.search(r'\b' + re.escape(word) + r'\b', text, re.IGNORECASE):
-                        text = re.sub(r'\s*From\s+\w+.*$', '', text)
+                                if len(examples) >= 7:
+                                    break
 
-                        if text and text not in examples:
-                            examples.append(text)
+                if len(examples) >= 7:
+                    break
 
-                            if len(examples) >= 7:
-                                break
+    # Method 2: If section not found, look for any examples on the page
+    if not examples:
+        print("Trying alternative method...")
 
-        if examples:
-            print(f"✓ Found {len(examples)} examples")
-            return "\n".join(examples)
-        else:
-            print("✗ No examples found")
-            return None
+        # Look for common example containers
+        example_containers = soup.find_all(['div', 'p'], class_=re.compile(r'example|sentence', re.IGNORECASE))
 
-    except ImportError:
-        print("Error: beautifulsoup4 not installed")
-        print("Install: pip install beautifulsoup4 --break-system-packages")
-        return None
-    except Exception as e:
-        print(f"Error scraping dictionary.com: {e}")
+        for container in example_containers:
+            text = container.get_text().strip()
+
+            if text and 10 < len(text) < 300:
+                text = re.sub(r'\s+', ' ', text)
+
+                if re.search(r'\b' + re.escape(word) + r'\b', text, re.IGNORECASE):
+                    text = re.sub(r'\s*From\s+\w+.*$', '', text)
+
+                    if text and text not in examples:
+                        examples.append(text)
+
+                        if len(examples) >= 7:
+                            break
+
+    if examples:
+        print(f"✓ Found {len(examples)} examples")
+        return "\n".join(examples)
+    else:
+        print("✗ No examples found")
         return None
 
 
@@ -235,36 +256,47 @@ def scrape_free_dictionary_api(word: str) -> Optional[str]:
         pip install requests --break-system-packages
     """
     try:
-        import requests
+        return _fetch_free_dictionary_examples(word)
 
-        url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+    except ImportError:
+        print("Error: requests not installed")
+        print("Install: pip install requests --break-system-packages")
+        return None
+    except Exception as e:
+        print(f"API error: {e}")
+        return None
 
-        response = requests.get(url, timeout=5)
 
-        if response.status_code != 200:
-            return None
+@cached_lookup("free_dictionary")
+def _fetch_free_dictionary_examples(word: str) -> Optional[str]:
+    """
+    Examples from the free dictionary API, None if the word has none (cached).
 
-        data = response.json()
-        examples = []
+    Raises on network errors and unexpected status codes, so those aren't cached.
+    """
+    import requests
 
-        for entry in data:
-            for meaning in entry.get('meanings', []):
-                for definition in meaning.get('definitions', []):
-                    example = definition.get('example')
-                    if example:
-                        examples.append(example)
+    url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
 
-        if examples:
-            return "\n".join(examples[:3])
-        else:
-            return None
+    response = requests.get(url, timeout=5)
 
-    except ImportError:
-        print("Error: requests not installed")
-        print("Install: pip install requests --break-system-packages")
+    if response.status_code == 404:  # Unknown word
         return None
-    except Exception as e:
-        print(f"API error: {e}")
+    response.raise_for_status()
+
+    data = response.json()
+    examples = []
+
+    for entry in data:
+        for meaning in entry.get('meanings', []):
+            for definition in meaning.get('definitions', []):
+                example = definition.get('example')
+                if example:
+                    examples.append(example)
+
+    if examples:
+        return "\n".join(examples[:3])
+    else:
         return None
 
 
@@ -0,0 +1,120 @@
+"""
+Lemmatizer
+
+Offline inflection table shared by the fill-in-the-blank matching
+(WordMatcher) and the word-family tool (find_word_families.py).
+
+Regular inflections (jump → jumps, jumping, jumped) are generated by
+rules. Irregular ones (run → ran, go → went, mouse → mice) can't be, so
+they come from the bundled Data/irregular_forms.txt. The file is read
+once, on first use, into two dicts:
+- lemma → its irregular forms
+- form → the lemma(s) it belongs to
+
+so every lookup is a single dict access.
+"""
+import os
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Data", "irregular_forms.txt")
+
+CONSONANTS = 'bcdfghjklmnpqrstvwxyz'
+VOWELS = 'aeiou'
+
+
+# ==================== Irregular Table ====================
+
+@lru_cache(maxsize=None)
+def _table() -> Tuple[Dict[str, FrozenSet[str]], Dict[str, Tuple[str, ...]]]:
+    """(lemma → irregular forms, form → lemmas), loaded once from DATA_FILE."""
+    forms_of: Dict[str, FrozenSet[str]] = {}
+    lemmas_of: Dict[str, Tuple[str, ...]] = {}
+
+    try:
+        with open(DATA_FILE, encoding="utf-8") as file:
+            for line in file:
+                words = line.split('#', 1)[0].lower().split()
+                if not words:
+                    continue
+
+                lemma, forms = words[0], frozenset(words[1:])
+                forms_of[lemma] = forms_of.get(lemma, frozenset()) | forms
+                for form in forms:
+                    if lemma not in lemmas_of.get(form, ()):
+                        lemmas_of[form] = lemmas_of.get(form, ()) + (lemma,)
+
+    except OSError as e:
+        print(f"Error loading irregular forms: {e}")
+
+    return forms_of, lemmas_of
+
+
+def irregular_forms(word: str) -> FrozenSet[str]:
+    """Irregular forms of a lowercase lemma (empty if it has none)."""
+    return _table()[0].get(word, frozenset())
+
+
+def lemmas(word: str) -> Tuple[str, ...]:
+    """
+    Lemmas of a lowercase word.
+
+    A listed irregular form gives its lemma(s) (ran → run, better → good, well).
+    Anything else - lemmas themselves and regular forms - gives the word.
+    A word that is a lemma in its own right stays itself (lay, not lie).
+    """
+    forms_of, lemmas_of = _table()
+    if word in forms_of or word not in lemmas_of:
+        return (word,)
+    return lemmas_of[word]
+
+
+def lemma(word: str) -> str:
+    """Main lemma of a word (see lemmas())."""
+    return lemmas(word.lower())[0]
+
+
+# ==================== Inflections ====================
+
+def regular_forms(word: str) -> FrozenSet[str]:
+    """Rule-based forms of a lowercase word, the word included."""
+    forms = {word}  # Base form
+
+    # 1. Y → IES for plurals (baby → babies)
+    if word.endswith('y') and len(word) > 2:
+        forms.add(word[:-1] + 'ies')
+
+    # 2. Double consonant before ING/ED (stop → stopping)
+    if len(word) >= 3 and word[-1] in CONSONANTS and word[-2] in VOWELS:
+        last = word[-1]
+        forms.update([
+            word + last + 'ing',  # stopping
+            word + last + 'ed',  # stopped
+            word + last + 'er',  # stopper
+        ])
+
+    # 3. E-dropping (make → making)
+    if word.endswith('e') and len(word) > 2:
+        forms.add(word[:-1] + 'ing')
+
+    # 4. Regular forms
+    forms.update([
+        word + 's', word + 'es', word + 'ing', word + 'ed',
+        word + 'd', word + 'er', word + 'est', word + 'ly', word + 'en'
+    ])
+
+    return frozenset(forms)
+
+
+def inflections(word: str) -> FrozenSet[str]:
+    """
+    Every form of a lowercase word: its regular and irregular forms
+    (run → runs, running, ran).
+
+    A word that is itself an irregular form only gets its own regular
+    forms, not its lemma's family - "bore" must not match "bear", nor
+    "wound" match "wind".
+    """
+    if lemmas(word) != (word,):
+        return regular_forms(word)
+    return regular_forms(word) | irregular_forms(word)
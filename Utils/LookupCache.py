@@ -0,0 +1,214 @@
+"""
+Lookup Cache
+
+Persistent SQLite cache for translation and example lookups.
+
+- Keyed by (source, normalized word)
+- Entries expire after a TTL; "not found" results are cached too, with a
+  shorter TTL so they get retried eventually
+- The cache is size bounded - the oldest entries are evicted first
+- Errors are never cached: a lookup that raises is retried next time
+- A broken cache file never breaks a lookup - it's just a cache miss
+"""
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.path.join('Database', 'lookup_cache.db')
+
+DAY = 24 * 60 * 60
+
+
+def normalize_word(word: str) -> str:
+    """Cache key for a word."""
+    return " ".join(word.lower().split())
+
+
+class LookupCache:
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH,
+                 ttl: float = 90 * DAY,
+                 negative_ttl: float = 3 * DAY,
+                 max_entries: int = 50000):
+        """
+        Args:
+            db_path: SQLite file holding the cache
+            ttl: Lifetime of a found result, in seconds
+            negative_ttl: Lifetime of a "not found" result, in seconds
+            max_entries: Entries kept before the oldest are evicted
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._puts_since_evict = 0
+
+        # Lookups run on the import pipeline's worker threads
+        self.lock = threading.Lock()
+        try:
+            self.connection = self._open(db_path)
+        except sqlite3.Error as e:
+            # Unreadable cache file - keep working with a cache for this run only
+            print(f"Lookup cache error: {e}. Using an in-memory cache.")
+            self.connection = self._open(":memory:")
+
+    @staticmethod
+    def _open(db_path: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(db_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute('''CREATE TABLE IF NOT EXISTS lookup_cache
+                           (source TEXT NOT NULL,
+                            word TEXT NOT NULL,
+                            value TEXT,
+                            is_negative INTEGER NOT NULL DEFAULT 0,
+                            created_at REAL NOT NULL,
+                            PRIMARY KEY (source, word))''')
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_lookup_cache_created "
+                           "ON lookup_cache (created_at)")
+        connection.commit()
+        return connection
+
+    def get(self, source: str, word: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        Returns:
+            (hit, value) - value is only meaningful when hit is True
+        """
+        try:
+            with self.lock:
+                row = self.connection.execute(
+                    "SELECT value, is_negative, created_at FROM lookup_cache WHERE source = ? AND word = ?",
+                    (source, normalize_word(word))
+                ).fetchone()
+
+            if row is None:
+                return False, None
+
+            value, is_negative, created_at = row
+            ttl = self.negative_ttl if is_negative else self.ttl
+            if time.time() - created_at > ttl:
+                return False, None
+
+            return True, json.loads(value)
+
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Lookup cache error: {e}")
+            return False, None
+
+    def put(self, source: str, word: str, value: Any, negative: bool = False) -> None:
+        """Store a (JSON serializable) value."""
+        with self.lock:
+            try:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO lookup_cache (source, word, value, is_negative, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (source, normalize_word(word), json.dumps(value), int(negative), time.time())
+                )
+                self.connection.commit()
+
+                self._puts_since_evict += 1
+                if self._puts_since_evict >= 100:
+                    self._evict()
+                    self._puts_since_evict = 0
+            except sqlite3.Error as e:
+                print(f"Lookup cache error: {e}")
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones beyond max_entries."""
+        now = time.time()
+        self.connection.execute(
+            "DELETE FROM lookup_cache WHERE created_at < ? OR (is_negative = 1 AND created_at < ?)",
+            (now - self.ttl, now - self.negative_ttl)
+        )
+
+        count = self.connection.execute("SELECT COUNT(*) FROM lookup_cache").fetchone()[0]
+        if count > self.max_entries:
+            self.connection.execute(
+                "DELETE FROM lookup_cache WHERE rowid IN "
+                "(SELECT rowid FROM lookup_cache ORDER BY created_at LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+        self.connection.commit()
+
+    def delete(self, source: str, words: Iterable[str]) -> None:
+        """Remove the entries of these words, e.g. after their pages were re-parsed."""
+        with self.lock:
+            try:
+                self.connection.executemany(
+                    "DELETE FROM lookup_cache WHERE source = ? AND word = ?",
+                    [(source, normalize_word(word)) for word in words]
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Lookup cache error: {e}")
+
+    def clear(self, source: Optional[str] = None) -> None:
+        """Remove all entries (of one source, if given)."""
+        with self.lock:
+            try:
+                if source is None:
+                    self.connection.execute("DELETE FROM lookup_cache")
+                else:
+                    self.connection.execute("DELETE FROM lookup_cache WHERE source = ?", (source,))
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Lookup cache error: {e}")
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+# ==================== Shared Instance ====================
+
+_shared_cache: Optional[LookupCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_lookup_cache() -> LookupCache:
+    """The process-wide cache, opened on first use."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LookupCache()
+        return _shared_cache
+
+
+def cached_lookup(source: str,
+                  is_negative: Callable[[Any], bool] = lambda result: result is None,
+                  is_cacheable: Callable[[Any], bool] = lambda result: True,
+                  decode: Callable[[Any], Any] = lambda value: value):
+    """
+    Decorator caching a `func(word)` lookup in the shared LookupCache.
+
+    If func raises (a timeout, a 5xx...), nothing is cached and the
+    exception propagates.
+
+    Args:
+        source: Cache namespace, e.g. "morfix"
+        is_negative: Whether a result means "not found" (short TTL)
+        is_cacheable: Whether a result may be cached at all (e.g. not errors)
+        decode: Rebuilds the result from its JSON form
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(word, *args, **kwargs):
+            cache = get_lookup_cache()
+
+            hit, value = cache.get(source, word)
+            if hit:
+                return decode(value)
+
+            result = func(word, *args, **kwargs)
+            if is_cacheable(result):
+                cache.put(source, word, result, negative=is_negative(result))
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,100 @@
+"""
+Lookup Pipeline
+
+Runs network lookups for word imports on a bounded thread pool.
+
+- Token-bucket rate limiting shared by all workers
+- Retry with exponential backoff when a lookup raises
+- Results are yielded in input order, so a single consumer (the DB writer)
+  can keep its group packing deterministic
+"""
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+
+# ==================== Rate Limiter ====================
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+# ==================== Pipeline ====================
+
+class LookupPipeline:
+    def __init__(self, lookup: Callable[[str], Any],
+                 max_workers: int = 4,
+                 requests_per_second: float = 2.0,
+                 burst: int = 4,
+                 max_retries: int = 3,
+                 backoff: float = 0.5):
+        """
+        Args:
+            lookup: Function doing the lookup for one word. It should raise
+                    on transient failures (network errors, throttling)
+            max_workers: Number of concurrent lookups
+            requests_per_second: Sustained lookup rate across all workers
+            burst: How many lookups may start back to back
+            max_retries: Retries per word before giving up
+            backoff: Delay before the first retry, doubled on each retry
+        """
+        self.lookup = lookup
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.rate_limiter = TokenBucket(requests_per_second, burst)
+
+    def run(self, words: Iterable[str]) -> Iterator[Tuple[str, Optional[Any]]]:
+        """
+        Look up all words concurrently.
+
+        Yields:
+            (word, result) in input order. result is None when every attempt
+            failed.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(word, executor.submit(self._lookup_with_retry, word)) for word in words]
+
+            for word, future in futures:
+                yield word, future.result()
+
+    def _lookup_with_retry(self, word: str) -> Optional[Any]:
+        """Run one lookup, retrying with exponential backoff and jitter."""
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                return self.lookup(word)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    print(f"Lookup failed for '{word}' after {attempt + 1} attempts: {e}")
+                    return None
+
+                delay = self.backoff * (2 ** attempt)
+                time.sleep(delay + random.uniform(0, delay / 2))
+
+        return None
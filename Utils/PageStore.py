@@ -0,0 +1,101 @@
+"""
+Page Store
+
+Compressed on-disk archive of raw HTML pages fetched by the scrapers,
+keyed by URL. Lets us re-run the parsers over everything we've already
+downloaded (see reparse_pages.py) when a site's markup changes.
+"""
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+
+import requests
+
+DEFAULT_STORE_PATH = os.path.join('Database', 'page_store.db')
+
+
+class PageStore:
+    def __init__(self, db_path: str = DEFAULT_STORE_PATH):
+        # Pages are fetched from the import pipeline's worker threads
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute('''CREATE TABLE IF NOT EXISTS pages
+                                (url TEXT PRIMARY KEY,
+                                 status_code INTEGER,
+                                 body BLOB,
+                                 fetched_at REAL)''')
+        self.connection.commit()
+
+    def put(self, url: str, status_code: int, html: str) -> None:
+        """Store (or replace) the raw page for a URL."""
+        body = zlib.compress(html.encode('utf-8'), 6)
+        with self.lock:
+            try:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO pages (url, status_code, body, fetched_at) VALUES (?, ?, ?, ?)",
+                    (url, status_code, body, time.time())
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                print(f"Page store error: {e}")
+
+    def get(self, url: str) -> Optional[str]:
+        """Raw HTML stored for a URL, or None."""
+        with self.lock:
+            row = self.connection.execute("SELECT body FROM pages WHERE url = ?", (url,)).fetchone()
+
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def iter_pages(self, url_prefix: str = "") -> Iterator[Tuple[str, str]]:
+        """Yield (url, html) for every stored page whose URL starts with url_prefix."""
+        with self.lock:
+            urls = [row[0] for row in self.connection.execute(
+                "SELECT url FROM pages WHERE substr(url, 1, ?) = ? ORDER BY url",
+                (len(url_prefix), url_prefix)
+            )]
+
+        for url in urls:
+            html = self.get(url)
+            if html is not None:
+                yield url, html
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+# ==================== Shared Instance ====================
+
+_shared_store: Optional[PageStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_page_store() -> PageStore:
+    """The process-wide page store, opened on first use."""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = PageStore()
+        return _shared_store
+
+
+def fetch_page(url: str, headers: Dict[str, str], timeout: float = 10) -> Tuple[int, str]:
+    """
+    GET a page and archive it in the page store.
+
+    Raises:
+        requests.RequestException on network errors
+    """
+    response = requests.get(url, headers=headers, timeout=timeout)
+
+    if response.status_code == 200:
+        get_page_store().put(url, response.status_code, response.text)
+
+    return response.status_code, response.text
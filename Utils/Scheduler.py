@@ -0,0 +1,125 @@
+"""
+Spaced Repetition Scheduler
+
+SM-2 scheduling. Each word has an ease factor, an interval in days and a
+count of successful reviews in a row. A review is graded 0-5:
+
+- A good grade (3+) grows the interval: 1 day, then 6 days, then the
+  previous interval times the ease.
+- A failed grade resets the count and brings the word back after
+  LAPSE_INTERVAL_DAYS.
+
+Every review also nudges the ease up or down, never below MIN_EASE.
+
+With latency-aware grading (grade_answer), how long a correct answer
+took also counts. A fast answer is graded EASY and a slow one HARD, so
+words recalled slowly come back sooner.
+"""
+import math
+import time
+from typing import NamedTuple, Optional
+
+DAY_SECONDS = 24 * 60 * 60
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# A failed word comes back later the same day, not tomorrow
+LAPSE_INTERVAL_DAYS = 10 / (24 * 60)
+
+# Grades for the app's answers
+GRADE_AGAIN = 1  # Wrong / don't know
+GRADE_HARD = 3   # Guessed
+GRADE_GOOD = 4   # Correct
+GRADE_EASY = 5   # Know it
+
+# Latency-aware grading of correct answers (see grade_answer)
+LATENCY_AWARE_GRADING = True
+FAST_ANSWER_MS = 2500
+SLOW_ANSWER_MS = 8000
+
+# Question selection within a session (see question_weight)
+MIN_QUESTION_WEIGHT = 0.05
+RECENCY_SECONDS = DAY_SECONDS
+
+
+class ReviewState(NamedTuple):
+    ease: float = DEFAULT_EASE
+    interval_days: float = 0.0
+    repetitions: int = 0
+    due_at: Optional[float] = None  # Unix time; None = never reviewed
+
+
+def grade_answer(correct: bool, response_ms: Optional[int] = None,
+                 latency_aware: bool = LATENCY_AWARE_GRADING) -> int:
+    """
+    Grade a right/wrong answer, using the response time if there is one.
+
+    Args:
+        correct: Whether the answer was right
+        response_ms: Time from showing the question to answering
+        latency_aware: Weigh slow correct answers as weaker recall
+    """
+    if not correct:
+        return GRADE_AGAIN
+    if not latency_aware or response_ms is None:
+        return GRADE_GOOD
+
+    if response_ms <= FAST_ANSWER_MS:
+        return GRADE_EASY
+    if response_ms >= SLOW_ANSWER_MS:
+        return GRADE_HARD
+    return GRADE_GOOD
+
+
+def question_weight(attempts: int = 0, mistakes: int = 0,
+                    last_reviewed_at: Optional[float] = None, now: Optional[float] = None) -> float:
+    """
+    How strongly to favour a word when picking the next question.
+
+    Words with a higher error rate get a higher weight. Words never
+    answered count as a 50% error rate. A word answered in the last day
+    weighs up to half as much, so the session doesn't repeat it straight away.
+    """
+    error_rate = (mistakes + 1) / (attempts + 2)
+
+    staleness = 1.0
+    if last_reviewed_at is not None:
+        now = time.time() if now is None else now
+        staleness = 1 - math.exp(-max(0.0, now - last_reviewed_at) / RECENCY_SECONDS)
+
+    return MIN_QUESTION_WEIGHT + error_rate * (0.5 + 0.5 * staleness)
+
+
+def elapsed_ms(started_at: Optional[float]) -> Optional[int]:
+    """Milliseconds since a time.monotonic() timestamp (None if not started)."""
+    if started_at is None:
+        return None
+    return int((time.monotonic() - started_at) * 1000)
+
+
+def schedule(state: ReviewState, grade: int, now: Optional[float] = None) -> ReviewState:
+    """
+    Next review state after answering with `grade`.
+
+    Args:
+        state: The word's current state
+        grade: 0 (blackout) to 5 (perfect recall)
+        now: Review time (Unix seconds, default: now)
+    """
+    now = time.time() if now is None else now
+    grade = max(0, min(5, grade))
+
+    ease = max(MIN_EASE, state.ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+
+    if grade < 3:
+        repetitions = 0
+        interval_days = LAPSE_INTERVAL_DAYS
+    else:
+        repetitions = state.repetitions + 1
+        if repetitions == 1:
+            interval_days = 1.0
+        elif repetitions == 2:
+            interval_days = 6.0
+        else:
+            interval_days = state.interval_days * ease
+
+    return ReviewState(ease, interval_days, repetitions, now + interval_days * DAY_SECONDS)
@@ -0,0 +1,148 @@
+"""
+Search Index
+
+In-memory substring index over (english, hebrew, difficulty, group) rows,
+so the All Words search doesn't rescan the whole vocabulary on every
+keystroke.
+
+The searchable fields (English, Hebrew, group) are lowercased once, when a
+word is added. Queries of NGRAM or more characters are answered from an
+n-gram index. Shorter queries scan the prebuilt lowercase text. When a
+query extends the previous one, only the previous results are re-checked.
+Removed words leave an empty slot; once too many slots are empty the index
+is rebuilt from the remaining rows, so scans don't keep paying for them.
+"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+NGRAM = 3
+SEARCH_FIELDS = (0, 1, 3)  # english, hebrew, group
+
+# Rebuild once more than this share of the slots are empty (and at least COMPACT_MIN)
+COMPACT_RATIO = 0.25
+COMPACT_MIN = 64
+
+
+class SearchIndex:
+    def __init__(self, words: Iterable[Tuple] = ()):
+        # Row ids are positions in _rows; removed rows leave a None behind
+        self._rows: List[Optional[Tuple]] = []
+        self._texts: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}  # lowercase English word -> row id
+        self._grams: Dict[str, Set[int]] = {}
+        self._removed = 0  # Empty slots in _rows
+
+        # Results of the previous query, for incremental narrowing
+        self._last_query: Optional[str] = None
+        self._last_ids: List[int] = []
+
+        self.rebuild(words)
+
+    # ==================== Building ====================
+
+    def rebuild(self, words: Iterable[Tuple]) -> None:
+        self._rows.clear()
+        self._texts.clear()
+        self._ids.clear()
+        self._grams.clear()
+        self._removed = 0
+        self._last_query = None
+
+        for word in words:
+            self.add(word)
+
+    def add(self, word: Tuple) -> None:
+        """Add a word, or re-index it in place if it's already there."""
+        key = str(word[0]).lower()
+        text = self._searchable_text(word)
+
+        row_id = self._ids.get(key)
+        if row_id is None:
+            row_id = len(self._rows)
+            self._rows.append(None)
+            self._texts.append(None)
+            self._ids[key] = row_id
+        else:
+            self._unindex(row_id)
+
+        self._rows[row_id] = word
+        self._texts[row_id] = text
+        for gram in self._ngrams(text):
+            self._grams.setdefault(gram, set()).add(row_id)
+
+        self._last_query = None
+
+    def remove(self, english: str) -> None:
+        row_id = self._ids.pop(english.lower(), None)
+        if row_id is None:
+            return
+
+        self._unindex(row_id)
+        self._rows[row_id] = None
+        self._texts[row_id] = None
+        self._removed += 1
+        self._last_query = None
+
+        if self._removed >= COMPACT_MIN and self._removed > len(self._rows) * COMPACT_RATIO:
+            self.rebuild([row for row in self._rows if row is not None])
+
+    def _unindex(self, row_id: int) -> None:
+        for gram in self._ngrams(self._texts[row_id]):
+            bucket = self._grams.get(gram)
+            if bucket is not None:
+                bucket.discard(row_id)
+                if not bucket:
+                    del self._grams[gram]
+
+    @staticmethod
+    def _searchable_text(word: Tuple) -> str:
+        # Newline never appears in a query, so matches can't span two fields
+        return "\n".join(
+            str(word[i]).lower()
+            for i in SEARCH_FIELDS
+            if i < len(word) and word[i] is not None
+        )
+
+    @staticmethod
+    def _ngrams(text: str) -> Set[str]:
+        return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+    # ==================== Searching ====================
+
+    def search(self, query: str) -> List[Tuple]:
+        """Rows whose English, Hebrew or group contains `query`, in insertion order."""
+        query = query.lower()
+
+        if not query:
+            ids = [row_id for row_id, text in enumerate(self._texts) if text is not None]
+        else:
+            ids = [
+                row_id for row_id in self._candidates(query)
+                if self._texts[row_id] is not None and query in self._texts[row_id]
+            ]
+
+        self._last_query, self._last_ids = query, ids
+        return [self._rows[row_id] for row_id in ids]
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        # Extending the previous query can only remove matches
+        if self._last_query and self._last_query in query:
+            return self._last_ids
+
+        if len(query) < NGRAM:
+            return range(len(self._texts))
+
+        postings = []
+        for gram in self._ngrams(query):
+            bucket = self._grams.get(gram)
+            if not bucket:
+                return []
+            postings.append(bucket)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for bucket in postings[1:]:
+            candidates &= bucket
+            if not candidates:
+                return []
+
+        return sorted(candidates)
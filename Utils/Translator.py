@@ -1,53 +1,79 @@
 import requests
 from bs4 import BeautifulSoup
+from typing import NamedTuple, Optional
+from Utils.LookupCache import cached_lookup
+from Utils.PageStore import fetch_page
 
 
-def translate_to_heb(eng_word):
-    base_url = 'https://www.morfix.co.il/'
-    div_class = 'normal_translation_div'
-    url = f"{base_url}{eng_word}"
+class WordLookup(NamedTuple):
+    """Result of a morfix lookup."""
+    translation: Optional[str]
+    examples: Optional[str]
+    status: str  # "ok", "not_found" or "error"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Referer': 'https://www.google.com/'
-    }
-    response = requests.get(url, headers=headers)
 
-    if response.status_code == 200:
-        soup = BeautifulSoup(response.text, 'html.parser')
+MORFIX_URL = 'https://www.morfix.co.il/'
 
-        specific_div = soup.find('div', class_=div_class)
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Referer': 'https://www.google.com/'
+}
 
-        if specific_div:
-            return specific_div.text.strip()
-        else:
-            print(f"Error: The div with class '{div_class}' was not found on the page.")
-    else:
-        print(f"Error: Unable to fetch the page. Status code: {response.status_code}")
 
-def get_word_examples(eng_word):
-    base_url = 'https://www.morfix.co.il/'
+def morfix_url(eng_word) -> str:
+    # Lowercase so archived pages can be found again from the stored word
+    return f"{MORFIX_URL}{eng_word.lower()}"
+
+
+@cached_lookup("morfix",
+               is_negative=lambda result: result.status == "not_found",
+               is_cacheable=lambda result: result.status != "error",
+               decode=lambda value: WordLookup(*value))
+def lookup_word(eng_word) -> WordLookup:
+    """Fetch and parse the morfix page once, returning translation and examples."""
+    try:
+        status_code, html = fetch_page(morfix_url(eng_word), HEADERS)
+    except requests.RequestException as e:
+        print(f"Error: Unable to fetch the page for {eng_word}: {e}")
+        return WordLookup(None, None, "error")
+
+    if status_code != 200:
+        print(f"Error: Unable to fetch the page. Status code: {status_code}")
+        status = "not_found" if status_code == 404 else "error"
+        return WordLookup(None, None, status)
+
+    return parse_morfix_page(html, eng_word)
+
+
+def parse_morfix_page(html, eng_word) -> WordLookup:
+    """Extract translation and examples from a morfix page."""
+    div_class = 'normal_translation_div'
     span_class = 'Translation_ulFooter_enTohe'
-    url = f"{base_url}{eng_word}"
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Referer': 'https://www.google.com/'
-    }
-    response = requests.get(url, headers=headers)
-
-    if response.status_code == 200:
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        specific_ul = soup.find('ul', class_=span_class)
-
-        if specific_ul:
-            li_elements = specific_ul.find_all('li')
-            first_three_li = li_elements[:3]
-            return '\n'.join([li.get_text() for li in first_three_li])
-        else:
-            print(f"Error with {eng_word}: The div with class '{span_class}' was not found on the page.")
-            return None
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    translation = None
+    specific_div = soup.find('div', class_=div_class)
+    if specific_div:
+        translation = specific_div.text.strip()
+    else:
+        print(f"Error: The div with class '{div_class}' was not found on the page.")
+
+    examples = None
+    specific_ul = soup.find('ul', class_=span_class)
+    if specific_ul:
+        li_elements = specific_ul.find_all('li')
+        first_three_li = li_elements[:3]
+        examples = '\n'.join([li.get_text() for li in first_three_li])
     else:
-        print(f"Error: Unable to fetch the page. Status code: {response.status_code}")
-        return None
+        print(f"Error with {eng_word}: The div with class '{span_class}' was not found on the page.")
+
+    return WordLookup(translation, examples, "ok" if translation else "not_found")
+
+
+def translate_to_heb(eng_word):
+    return lookup_word(eng_word).translation
+
+
+def get_word_examples(eng_word):
+    return lookup_word(eng_word).examples
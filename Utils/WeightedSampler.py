@@ -0,0 +1,167 @@
+"""
+Weighted Sampler
+
+Picks items with probability proportional to a weight that can change
+while a session runs.
+
+The weights live in a Fenwick (binary indexed) tree, so one draw and one
+weight update are both O(log n). There is no rebuild between questions,
+whatever the vocabulary size.
+
+SessionPicker is what the quizzes use: a QuestionPicker weighted by each
+word's answer history (see Scheduler.question_weight), kept up to date as
+the session is answered.
+"""
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from Utils.Scheduler import question_weight
+
+# Due words considered per question asked - the session favours the weak ones
+CANDIDATE_POOL_FACTOR = 3
+
+
+class WeightedSampler:
+    """Fenwick tree over non-negative weights, indexed 0..n-1."""
+
+    def __init__(self, weights: Sequence[float]):
+        self._size = len(weights)
+        self._weights: List[float] = [max(0.0, weight) for weight in weights]
+        self._active = sum(1 for weight in self._weights if weight > 0)
+
+        # O(n) build: each node adds itself to its parent
+        self._tree: List[float] = [0.0] + self._weights
+        for i in range(1, self._size + 1):
+            parent = i + (i & -i)
+            if parent <= self._size:
+                self._tree[parent] += self._tree[i]
+
+    def __len__(self) -> int:
+        """Number of items that can still be drawn (weight > 0)."""
+        return self._active
+
+    def total(self) -> float:
+        return self._prefix_sum(self._size)
+
+    def weight(self, index: int) -> float:
+        return self._weights[index]
+
+    def update(self, index: int, weight: float) -> None:
+        weight = max(0.0, weight)
+        delta = weight - self._weights[index]
+        if not delta:
+            return
+
+        self._active += (weight > 0) - (self._weights[index] > 0)
+        self._weights[index] = weight
+
+        if not self._active:
+            # Nothing left - reset rather than keep accumulated rounding error
+            self._tree = [0.0] * (self._size + 1)
+            return
+
+        i = index + 1
+        while i <= self._size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def sample(self) -> Optional[int]:
+        """A random index, weighted. None if every weight is 0."""
+        if not self._active:
+            return None
+
+        target = random.random() * self.total()
+
+        # Walk down the tree to the first index whose prefix sum exceeds target
+        position = 0
+        step = 1 << self._size.bit_length()
+        while step:
+            child = position + step
+            if child <= self._size and self._tree[child] <= target:
+                position = child
+                target -= self._tree[child]
+            step >>= 1
+
+        # `position` items have a prefix sum <= target, so it's the one drawn -
+        # unless float rounding pushed past the end or onto an emptied slot
+        if position >= self._size or self._weights[position] <= 0:
+            position = next(i for i in range(self._size - 1, -1, -1) if self._weights[i] > 0)
+        return position
+
+    def pop(self) -> Optional[int]:
+        """Sample an index and set its weight to 0, so it's drawn only once."""
+        index = self.sample()
+        if index is not None:
+            self.update(index, 0.0)
+        return index
+
+    def _prefix_sum(self, count: int) -> float:
+        total = 0.0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+
+class QuestionPicker:
+    """Draws words for a session, weighted, without repeats unless requeued."""
+
+    def __init__(self, words: Sequence[str], weights: Sequence[float]):
+        self._words: List[str] = list(words)
+        self._positions: Dict[str, int] = {word.lower(): i for i, word in enumerate(self._words)}
+        self._sampler = WeightedSampler(weights)
+
+    def __len__(self) -> int:
+        return len(self._sampler)
+
+    def draw(self) -> Optional[str]:
+        """Next word (removed until requeued), or None when none are left."""
+        index = self._sampler.pop()
+        return self._words[index] if index is not None else None
+
+    def requeue(self, word: str, weight: float) -> None:
+        """Let a word be drawn again (e.g. after a wrong answer)."""
+        index = self._positions.get(word.lower())
+        if index is not None:
+            self._sampler.update(index, weight)
+
+    def discard(self, word: str) -> None:
+        self.requeue(word, 0.0)
+
+
+def candidate_limit(max_questions: Optional[int]) -> Optional[int]:
+    """How many due words to consider for a session of max_questions (None = all)."""
+    return max_questions * CANDIDATE_POOL_FACTOR if max_questions else None
+
+
+class SessionPicker(QuestionPicker):
+    """QuestionPicker weighted towards words often missed, updated as answers come in."""
+
+    def __init__(self, words: Sequence[str],
+                 review_summary: Dict[str, Tuple[int, int, Optional[float]]],
+                 now: Optional[float] = None):
+        """
+        Args:
+            words: The session's candidate words
+            review_summary: {lowercase word: (attempts, mistakes, last_reviewed_at)},
+                see DatabaseManager.get_review_summary
+            now: Reference time (Unix seconds, default: now)
+        """
+        now = time.time() if now is None else now
+        self.review_summary = review_summary
+        super().__init__(words, [question_weight(*review_summary.get(word.lower(), ()), now=now)
+                                 for word in words])
+
+    def record_answer(self, word: str, correct: bool, requeue: bool = True,
+                      now: Optional[float] = None) -> None:
+        """Count the answer; a missed word may be drawn again later in the session (if requeue)."""
+        now = time.time() if now is None else now
+        attempts, mistakes, _ = self.review_summary.get(word.lower(), (0, 0, None))
+        attempts, mistakes = attempts + 1, mistakes + (not correct)
+        self.review_summary[word.lower()] = (attempts, mistakes, now)
+
+        if not correct and requeue:
+            # Just answered, so the recency term lowers its weight below an unseen
+            # word's - the draws in between space it out
+            self.requeue(word, question_weight(attempts, mistakes, now, now))
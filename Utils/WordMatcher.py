@@ -0,0 +1,87 @@
+"""
+Word Matcher
+
+Fuzzy word matching for finding examples with word variations.
+
+Handles:
+- Regular suffixes (jump → jumping, jumped, jumps)
+- Double consonants (run → running, stop → stopping)
+- Y to IES (baby → babies)
+- E-dropping (make → making)
+- Irregular forms (run → ran, go → went, mouse → mice), from the
+  Lemmatizer's bundled inflection table
+
+A word's forms are built once and kept in a bounded LRU cache. For a
+plain word (letters/digits only), a match is a whole token of the text
+that is one of its forms, so the text is split into tokens with one
+shared regex and each token is looked up in the form set. Compiling a
+pattern per word took far longer than the search itself. Phrases and
+hyphenated words fall back to a compiled pattern, also cached.
+"""
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
+
+from Utils.Lemmatizer import inflections
+
+# Words whose forms / patterns are kept
+PATTERN_CACHE_SIZE = 4096
+
+TOKEN = re.compile(r'\w+')
+
+
+class WordMatcher:
+    @staticmethod
+    def get_possible_forms(word: str) -> List[str]:
+        """Generate all possible forms of a word."""
+        return list(_forms(word.lower()))
+
+    @staticmethod
+    def create_pattern(word: str, fuzzy: bool = True) -> str:
+        """Create regex pattern matching all word forms."""
+        return compiled_pattern(word, fuzzy).pattern
+
+    @staticmethod
+    def compiled_pattern(word: str, fuzzy: bool = True) -> re.Pattern:
+        """Case-insensitive compiled pattern matching all word forms (cached)."""
+        return compiled_pattern(word, fuzzy)
+
+    @staticmethod
+    def find(word: str, text: str, fuzzy: bool = True) -> Optional[re.Match]:
+        """First occurrence of the word (or any form) in text."""
+        forms = _token_forms(word, fuzzy)
+        if forms is None:
+            return compiled_pattern(word, fuzzy).search(text)
+
+        for token in TOKEN.finditer(text):
+            if token.group().lower() in forms:
+                return token
+        return None
+
+    @staticmethod
+    def word_matches(word: str, text: str, fuzzy: bool = True) -> bool:
+        """Check if word (or any form) appears in text."""
+        return WordMatcher.find(word, text, fuzzy) is not None
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _token_forms(word: str, fuzzy: bool = True) -> Optional[FrozenSet[str]]:
+    """The forms to look up token by token, or None if the word isn't a single token."""
+    if not TOKEN.fullmatch(word):
+        return None
+    return frozenset(_forms(word.lower())) if fuzzy else frozenset([word.lower()])
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compiled_pattern(word: str, fuzzy: bool = True) -> re.Pattern:
+    if not fuzzy:
+        return re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+
+    escaped = [re.escape(form) for form in _forms(word.lower())]
+    return re.compile(r'\b(?:' + '|'.join(escaped) + r')\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _forms(word: str) -> Tuple[str, ...]:
+    """Distinct forms of a lowercase word, longest first (so the regex prefers them)."""
+    return tuple(sorted(inflections(word), key=len, reverse=True))
@@ -1,8 +1,11 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Tuple, Optional, Callable
+from typing import Dict, List, Tuple, Optional, Callable
 import re
 
+from Utils.SearchIndex import SearchIndex
+from Utils.DiffucltyEnum import Difficulty
+
 # ==================== Natural Sorting Function ====================
 
 def natural_sort_key(text):
@@ -29,18 +32,36 @@ class AllWordsPage(ttk.Frame):
         "Group": {"width": 150, "anchor": "w"}
     }
 
+    # Virtualized table: only the rows in view (plus a small buffer) exist as items
+    VIEWPORT_BUFFER = 5
+    DEFAULT_ROW_HEIGHT = 20
+    WHEEL_STEP = 3
+
+    # Wait for a pause in typing before searching
+    SEARCH_DELAY_MS = 150
+
     def __init__(self, parent: tk.Widget) -> None:
         super().__init__(parent)
 
         # Data storage
         self.all_words_cache: List[Tuple] = []
         self._filtered_words: List[Tuple] = []
+        self._positions: Dict[str, int] = {}  # Lowercase English word -> index in _filtered_words
         self._sort_reverse: bool = False
         self._last_sort_column: Optional[str] = 'English'
+        self._sorted: bool = False  # A header was clicked - keep that order through searches
+
+        # Viewport state - _top is the index in _filtered_words of the first visible row
+        self._top: int = 0
+        self._visible_rows: int = 25
+        self._row_items: List[str] = []  # Reused tree item ids, top to bottom
+        self._selected_key: Optional[str] = None  # Lowercase English word of the selected row
 
         # Search state
         self.search_placeholder: str = "Search..."
         self._search_active: bool = False
+        self._search_index = SearchIndex()
+        self._search_job: Optional[str] = None
 
         # Configure layout
         self._setup_grid()
@@ -114,14 +135,13 @@ class AllWordsPage(ttk.Frame):
             config = self.COLUMN_CONFIG[col]
             self.tree.column(col, width=config["width"], anchor=config["anchor"])
 
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(
+        # Scrollbar maps onto the filtered list, not onto the Treeview items
+        self.scrollbar = ttk.Scrollbar(
             table_frame,
             orient="vertical",
-            command=self.tree.yview
+            command=self._on_scrollbar
         )
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
 
         # Place treeview
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -241,6 +261,19 @@ class AllWordsPage(ttk.Frame):
         self.search_entry.bind("<FocusIn>", self._clear_search_placeholder)
         self.search_entry.bind("<FocusOut>", self._restore_search_placeholder)
 
+        # Viewport scrolling
+        self.tree.bind("<Configure>", self._on_tree_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-self.WHEEL_STEP))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(self.WHEEL_STEP))
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self._visible_rows))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self._visible_rows))
+        self.tree.bind("<Home>", lambda e: self._move_selection(-len(self._filtered_words)))
+        self.tree.bind("<End>", lambda e: self._move_selection(len(self._filtered_words)))
+
     # ==================== Placeholder Management ====================
 
     def _set_search_placeholder(self) -> None:
@@ -267,25 +300,145 @@ class AllWordsPage(ttk.Frame):
     def show_words(self, word_list: List[Tuple]) -> None:
         """Display words in the table."""
         self.all_words_cache = list(word_list)
+        self._search_index.rebuild(self.all_words_cache)
         self._filtered_words = self.all_words_cache.copy()
+        if self._sorted:
+            self._apply_sort()
         self._populate_tree(self._filtered_words)
         self._update_statistics()
         self._update_word_count()
 
     def _populate_tree(self, words: List[Tuple]) -> None:
-        """Populate treeview with word data."""
-        self.clear_treeview()
+        """Show words from the top. Only the rows in view are materialized."""
+        self._filtered_words = words
+        self._reindex()
+        self._top = 0
+        self._render()
 
-        for idx, word_tuple in enumerate(words):
-            if len(word_tuple) >= 4:
-                eng, heb, diff, group = word_tuple[:4]
-                tag = "evenrow" if idx % 2 == 0 else "oddrow"
-                self.tree.insert("", "end", values=(eng, heb, diff, group), tags=(tag,))
+    def _reindex(self) -> None:
+        """Rebuild the word -> position map after _filtered_words was replaced or reordered."""
+        self._positions = {str(word[0]).lower(): index for index, word in enumerate(self._filtered_words)}
 
     def clear_treeview(self) -> None:
         """Remove all items from the treeview."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        if self._row_items:
+            self.tree.delete(*self._row_items)
+        self._row_items = []
+
+    # ==================== Virtual Viewport ====================
+
+    def _render(self) -> None:
+        """Fill the reused tree items with the words at the current scroll position."""
+        total = len(self._filtered_words)
+        self._top = max(0, min(self._top, total - self._visible_rows))
+
+        window = self._filtered_words[self._top:self._top + self._visible_rows + self.VIEWPORT_BUFFER]
+
+        # Grow or shrink the item pool to the window size
+        while len(self._row_items) < len(window):
+            self._row_items.append(self.tree.insert("", "end"))
+        if len(self._row_items) > len(window):
+            self.tree.delete(*self._row_items[len(window):])
+            del self._row_items[len(window):]
+
+        selected_item = None
+        for offset, (item, word) in enumerate(zip(self._row_items, window)):
+            tag = "evenrow" if (self._top + offset) % 2 == 0 else "oddrow"
+            self.tree.item(item, values=tuple(word[:4]), tags=(tag,))
+            if str(word[0]).lower() == self._selected_key:
+                selected_item = item
+
+        self.tree.selection_set(selected_item if selected_item else ())
+        self.tree.yview_moveto(0)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        total = len(self._filtered_words)
+        if total <= self._visible_rows:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self._top / total, (self._top + self._visible_rows) / total)
+
+    def _scroll_to(self, top: int) -> None:
+        top = max(0, min(top, len(self._filtered_words) - self._visible_rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _scroll_by(self, rows: int) -> str:
+        self._scroll_to(self._top + rows)
+        return "break"
+
+    def _ensure_visible(self, index: int) -> None:
+        """Move the viewport just enough for the row at `index` to be in view (caller renders)."""
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + self._visible_rows:
+            self._top = index - self._visible_rows + 1
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self._filtered_words)))
+        elif action == "scroll":
+            step = self._visible_rows if unit == "pages" else 1
+            self._scroll_to(self._top + int(amount) * step)
+
+    def _on_mouse_wheel(self, event: tk.Event) -> str:
+        return self._scroll_by(-self.WHEEL_STEP if event.delta > 0 else self.WHEEL_STEP)
+
+    def _on_tree_resize(self, event: tk.Event) -> None:
+        """Recompute how many rows fit; the heading takes about one row."""
+        try:
+            row_height = int(ttk.Style().lookup("Treeview", "rowheight") or self.DEFAULT_ROW_HEIGHT)
+        except (ValueError, tk.TclError):
+            row_height = self.DEFAULT_ROW_HEIGHT
+
+        visible_rows = max(1, event.height // row_height - 1)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._render()
+
+    def _on_tree_select(self, event: tk.Event) -> None:
+        """Remember the selected word, since its item is reused when scrolling."""
+        selection = self.tree.selection()
+        if not selection:
+            return
+
+        values = self.tree.item(selection[0], "values")
+        if not values:
+            return
+
+        # _render re-selects the remembered word (Tk reports that too, later) -
+        # only a newly selected word may move the viewport
+        key = str(values[0]).lower()
+        if key == self._selected_key:
+            return
+        self._selected_key = key
+
+        # Clicking a row in the buffer below the viewport scrolls it into view
+        if selection[0] in self._row_items:
+            top = self._top
+            self._ensure_visible(top + self._row_items.index(selection[0]))
+            if self._top != top:
+                self._render()
+
+    def _move_selection(self, delta: int) -> str:
+        """Keyboard navigation over the whole filtered list, not just the materialized rows."""
+        if not self._filtered_words:
+            return "break"
+
+        index = self._index_of(self._selected_key)
+        index = self._top if index is None else index + delta
+        index = max(0, min(index, len(self._filtered_words) - 1))
+
+        self._selected_key = str(self._filtered_words[index][0]).lower()
+        self._ensure_visible(index)
+        self._render()
+        return "break"
+
+    def _index_of(self, key: Optional[str]) -> Optional[int]:
+        """Position of a word in the filtered list."""
+        return self._positions.get(key) if key is not None else None
 
     def _update_word_count(self) -> None:
         """Update the word count display label."""
@@ -297,23 +450,91 @@ class AllWordsPage(ttk.Frame):
         else:
             self.count_label.config(text=f"Showing {displayed} of {total} words")
 
+    # ==================== Incremental Updates ====================
+
+    def upsert_word(self, word_tuple: Tuple) -> None:
+        """Add a word, or update its existing row in place."""
+        key = str(word_tuple[0]).lower()
+
+        if not self._replace_word(self.all_words_cache, key, word_tuple):
+            self.all_words_cache.append(word_tuple)
+        self._search_index.add(word_tuple)
+
+        index = self._positions.get(key)
+        if index is not None:
+            self._filtered_words[index] = word_tuple
+        elif self._matches_current_search(word_tuple):
+            self._positions[key] = len(self._filtered_words)
+            self._filtered_words.append(word_tuple)
+
+        self._render()
+        self._update_statistics()
+        self._update_word_count()
+
+    def remove_word(self, english: str) -> None:
+        """Remove a word's row, keeping the scroll position."""
+        key = english.lower()
+        self.all_words_cache = [w for w in self.all_words_cache if str(w[0]).lower() != key]
+        index = self._positions.get(key)
+        if index is not None:
+            del self._filtered_words[index]
+            self._reindex()
+        self._search_index.remove(english)
+
+        if self._selected_key == key:
+            self._selected_key = None
+
+        self._render()
+        self._update_statistics()
+        self._update_word_count()
+
+    def rename_group(self, old_name: str, new_name: str) -> None:
+        """Update the group column of every row in a renamed group."""
+        for words in (self.all_words_cache, self._filtered_words):
+            for idx, word in enumerate(words):
+                if len(word) >= 4 and word[3] == old_name:
+                    words[idx] = (word[0], word[1], word[2], new_name) + tuple(word[4:])
+
+        for word in self.all_words_cache:
+            if word[3] == new_name:
+                self._search_index.add(word)
+
+        self._render()
+
+    @staticmethod
+    def _replace_word(words: List[Tuple], key: str, word_tuple: Tuple) -> bool:
+        """Replace the entry for `key` in words; False if it isn't there."""
+        for idx, word in enumerate(words):
+            if str(word[0]).lower() == key:
+                words[idx] = word_tuple
+                return True
+        return False
+
+    def _matches_current_search(self, word: Tuple) -> bool:
+        query = self.search_var.get().strip().lower() if self._search_active else ""
+        return not query or self._matches_search(word, query)
+
     # ==================== Search ====================
 
     def on_search(self, event: Optional[tk.Event] = None) -> None:
-        """Filter words based on search query."""
+        """Schedule a search; while typing, only the last keystroke's search runs."""
         if not self._search_active:
             return
 
-        query = self.search_var.get().strip().lower()
-
-        if not query:
-            self._filtered_words = self.all_words_cache.copy()
-        else:
-            self._filtered_words = [
-                word for word in self.all_words_cache
-                if self._matches_search(word, query)
-            ]
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DELAY_MS, self._apply_search)
 
+    def _apply_search(self) -> None:
+        """Filter words based on search query."""
+        self._search_job = None
+        # The box may have gone back to the placeholder since the search was scheduled
+        query = self.search_var.get().strip().lower() if self._search_active else ""
+
+        # The index returns insertion order - keep the column sort the user chose
+        self._filtered_words = self._search_index.search(query)
+        if self._sorted:
+            self._apply_sort()
         self._populate_tree(self._filtered_words)
         self._update_word_count()
 
@@ -334,10 +555,7 @@ class AllWordsPage(ttk.Frame):
     # ==================== Sorting (WITH NATURAL SORT!) ====================
 
     def _sort_by_column(self, column: str) -> None:
-        # Determine column index
-        try:
-            col_index = self.COLUMNS.index(column)
-        except ValueError:
+        if column not in self.COLUMNS:
             return
 
         # Toggle sort direction if same column
@@ -347,6 +565,21 @@ class AllWordsPage(ttk.Frame):
             self._sort_reverse = False
             self._last_sort_column = column
 
+        if not self._apply_sort():
+            return
+        self._sorted = True
+
+        # Refresh display
+        self._populate_tree(self._filtered_words)
+
+        # Update header to show sort direction
+        self._update_sort_indicator(column)
+
+    def _apply_sort(self) -> bool:
+        """Sort the filtered words by the current column and direction. False on error."""
+        column = self._last_sort_column
+        col_index = self.COLUMNS.index(column)
+
         # Sort the filtered words
         try:
             if column == "Difficulty":
@@ -370,13 +603,9 @@ class AllWordsPage(ttk.Frame):
                 )
         except (IndexError, TypeError) as e:
             print(f"Sort error: {e}")
-            return
-
-        # Refresh display
-        self._populate_tree(self._filtered_words)
+            return False
 
-        # Update header to show sort direction
-        self._update_sort_indicator(column)
+        return True
 
     def _get_difficulty_value(self, difficulty: any) -> int:
         """Convert difficulty to numeric value for sorting."""
@@ -388,13 +617,8 @@ class AllWordsPage(ttk.Frame):
         except (ValueError, TypeError):
             pass
 
-        difficulty_map = {
-            "easy": 1,
-            "medium": 2,
-            "hard": 3
-        }
-
-        return difficulty_map.get(str(difficulty).lower(), 0)
+        level = Difficulty.from_name(difficulty)
+        return level.value if level else 0
 
     def _update_sort_indicator(self, column: str) -> None:
         """Update column header to show sort direction."""
@@ -416,6 +640,18 @@ class AllWordsPage(ttk.Frame):
         values = self.tree.item(selection[0], "values")
         return values if values else None
 
+    def select_word(self, english: str) -> bool:
+        """Select a word and scroll it into view. False if it isn't in the filtered list."""
+        key = str(english).lower()
+        index = self._index_of(key)
+        if index is None:
+            return False
+
+        self._selected_key = key
+        self._ensure_visible(index)
+        self._render()
+        return True
+
     def refresh_display(self) -> None:
         """Refresh the current display."""
         self._populate_tree(self._filtered_words)
@@ -176,6 +176,9 @@ class QuizSetupDialog(tk.Toplevel):
         # Organize groups into hierarchy
         hierarchy = self._organize_groups_hierarchy()
 
+        # Difficulty counts for every group in one (cached) query
+        self.group_stats = self._load_group_stats()
+
         # Storage for tree items
         self.tree_items = {}  # Maps group name to tree item id
         self.item_states = {}  # Maps item id to checkbox state (True/False)
@@ -219,6 +222,18 @@ class QuizSetupDialog(tk.Toplevel):
         Returns:
             Dict mapping book name to list of chapter names
         """
+        # Book/chapter structure is stored in the database
+        if self.db:
+            try:
+                hierarchy = self.db.get_group_hierarchy(self.available_groups)
+                grouped = {group for chapters in hierarchy.values() for group in chapters}
+                for group in self.available_groups:
+                    if group not in grouped:
+                        hierarchy[group] = [group]
+                return hierarchy
+            except Exception as e:
+                print(f"Error loading group hierarchy: {e}")
+
         hierarchy = {}
 
         for group in self.available_groups:
@@ -524,27 +539,22 @@ class QuizSetupDialog(tk.Toplevel):
 
         self.geometry(f"+{x}+{y}")
 
+    def _load_group_stats(self) -> Dict[str, dict]:
+        if not self.db:
+            return {}
+
+        return self.db.get_all_group_stats()
+
     def _get_group_difficulty_color(self, group_name: str) -> str:
         """Get color based on group's difficulty distribution."""
-        if not self.db:
+        stats = self.group_stats.get(group_name)
+        if not stats:
             return 'default_group'
 
         try:
-            query = """
-                SELECT difficulty, COUNT(*) as count
-                FROM vocabulary
-                WHERE group_name = ?
-                GROUP BY difficulty
-            """
-            self.db.cursor.execute(query, (group_name,))
-            results = self.db.cursor.fetchall()
-
-            if not results:
-                return 'default_group'
-
             # Count by difficulty
             counts = {'NEW_WORD': 0, 'EASY': 0, 'MEDIUM': 0, 'HARD': 0}
-            for difficulty, count in results:
+            for difficulty, count in stats['difficulty_breakdown'].items():
                 if difficulty in counts:
                     counts[difficulty] = count
 
@@ -0,0 +1,38 @@
+"""
+Build Cloze Items - Prepare fill-in-the-blank sentences
+
+New and edited words are prepared automatically. Run this to backfill
+every word pending (e.g. right after upgrading), or with --rebuild to
+redo all words after changing how sentences are matched.
+
+Usage:
+    python build_cloze_items.py            # only words still pending
+    python build_cloze_items.py --rebuild  # every word
+"""
+import sys
+
+from Database.DatabaseManager import DatabaseManager
+
+
+def build_cloze_items(db, rebuild=False):
+    """Build the cloze_items rows and print a summary."""
+    if rebuild:
+        db.cursor.execute("UPDATE vocabulary SET cloze_built = 0")
+        db.connection.commit()
+
+    built = db.build_cloze_items()
+
+    db.cursor.execute("SELECT COUNT(*), COUNT(DISTINCT word_id) FROM cloze_items")
+    sentences, words = db.cursor.fetchone()
+    db.cursor.execute("SELECT COUNT(*) FROM vocabulary WHERE examples IS NOT NULL AND examples != ''")
+    with_examples = db.cursor.fetchone()[0]
+
+    print(f"Built {built} words")
+    print(f"{sentences} sentences for {words} words "
+          f"({with_examples - words} words with examples have no usable sentence)")
+
+
+if __name__ == "__main__":
+    db = DatabaseManager()
+    build_cloze_items(db, rebuild="--rebuild" in sys.argv)
+    db.close_db_connection()
@@ -8,15 +8,20 @@ import sqlite3
 from collections import defaultdict
 import re
 
+from Utils.DiffucltyEnum import Difficulty
+from Utils.Lemmatizer import lemma
+
 
 def get_word_stem(word):
     """
     Get the base form (stem) of a word by removing common suffixes.
     
-    This is a simplified stemming - for better results, you could use
-    the nltk library's PorterStemmer or Snowball stemmer.
+    Irregular forms are mapped to their lemma first, from the Lemmatizer's
+    inflection table (ran -> run, mice -> mouse). The suffix removal is a
+    simplified stemming - for better results, you could use the nltk
+    library's PorterStemmer or Snowball stemmer.
     """
-    word = word.lower()
+    word = lemma(word.lower())
     
     # Common suffixes to try removing (in order of priority)
     suffixes = [
@@ -137,9 +142,10 @@ def find_word_families_advanced(db_path='vocabulary.db'):
     
     # Get all words with their details
     cursor.execute("""
-        SELECT engWord, hebWord, difficulty, group_name 
-        FROM vocabulary 
-        ORDER BY engWord
+        SELECT v.engWord, v.hebWord, v.difficulty, coalesce(g.name, '')
+        FROM vocabulary v
+        LEFT JOIN groups g ON g.id = v.group_id
+        ORDER BY v.engWord
     """)
     words_data = cursor.fetchall()
     conn.close()
@@ -156,7 +162,7 @@ def find_word_families_advanced(db_path='vocabulary.db'):
         families[stem].append({
             'english': eng,
             'hebrew': heb,
-            'difficulty': diff,
+            'difficulty': Difficulty(diff).name,
             'group': group
         })
     
@@ -8,6 +8,8 @@ import json
 from collections import defaultdict
 import time
 
+from Utils.DiffucltyEnum import Difficulty
+
 
 class WordFrequencyChecker:
     """Get real word frequency from multiple sources."""
@@ -142,7 +144,12 @@ def analyze_vocabulary(db_path='vocabulary.db'):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
-    cursor.execute("SELECT engWord, hebWord, difficulty, group_name FROM vocabulary ORDER BY engWord")
+    cursor.execute("""
+        SELECT v.engWord, v.hebWord, v.difficulty, coalesce(g.name, '')
+        FROM vocabulary v
+        LEFT JOIN groups g ON g.id = v.group_id
+        ORDER BY v.engWord
+    """)
     words_data = cursor.fetchall()
     conn.close()
     
@@ -171,7 +178,7 @@ def analyze_vocabulary(db_path='vocabulary.db'):
         results.append({
             'english': eng,
             'hebrew': heb,
-            'difficulty': diff,
+            'difficulty': Difficulty(diff).name,
             'group': group,
             'rank': rank,
             'category': category,
@@ -0,0 +1,80 @@
+"""
+Reparse Cached Pages - Re-run the current parsers over archived HTML
+
+Every page fetched from morfix / dictionary.com is archived in the page
+store. After fixing a parser for changed markup, run this to backfill
+hebWord / examples for all words without any network traffic. The lookup
+cache entries of the re-parsed words are dropped too, so later lookups
+don't keep returning the old parse (or a cached "not found").
+
+Usage:
+    python reparse_pages.py              # only fill missing fields
+    python reparse_pages.py --overwrite  # replace existing values too
+"""
+import sys
+
+from Database.DatabaseManager import DatabaseManager
+from Utils.LookupCache import get_lookup_cache
+from Utils.PageStore import get_page_store
+from Utils.Translator import morfix_url, parse_morfix_page
+from Utils.ExampleGenerator import dictionary_com_url, parse_dictionary_com_page
+
+
+def reparse_pages(db, overwrite=False):
+    """Backfill translations and examples from archived pages."""
+    store = get_page_store()
+
+    db.cursor.execute("SELECT id, engWord, hebWord, examples FROM vocabulary")
+    rows = db.cursor.fetchall()
+
+    updates = []
+    pages_parsed = 0
+    # Lookup cache source -> words whose archived page was re-parsed
+    reparsed = {"morfix": [], "dictionary.com": []}
+
+    for word_id, eng_word, heb_word, examples in rows:
+        new_heb_word, new_examples = heb_word, examples
+
+        html = store.get(morfix_url(eng_word))
+        if html is not None:
+            pages_parsed += 1
+            reparsed["morfix"].append(eng_word)
+            parsed = parse_morfix_page(html, eng_word)
+
+            if parsed.translation and (overwrite or not heb_word):
+                new_heb_word = parsed.translation
+            if parsed.examples and (overwrite or not examples):
+                new_examples = parsed.examples
+
+        if not new_examples:
+            html = store.get(dictionary_com_url(eng_word))
+            if html is not None:
+                pages_parsed += 1
+                reparsed["dictionary.com"].append(eng_word)
+                new_examples = parse_dictionary_com_page(html, eng_word) or new_examples
+
+        if (new_heb_word, new_examples) != (heb_word, examples):
+            updates.append((new_heb_word, new_examples, word_id))
+
+    # One transaction for the whole backfill
+    db.cursor.executemany("UPDATE vocabulary SET hebWord = ?, examples = ? WHERE id = ?", updates)
+    db.connection.commit()
+
+    cache = get_lookup_cache()
+    for source, words in reparsed.items():
+        cache.delete(source, words)
+
+    print()
+    print("=" * 70)
+    print(f"Words checked:  {len(rows)}")
+    print(f"Pages parsed:   {pages_parsed}")
+    print(f"Words updated:  {len(updates)}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    db = DatabaseManager()
+
+    reparse_pages(db, overwrite="--overwrite" in sys.argv)
+
+    db.close_db_connection()
@@ -0,0 +1,48 @@
+import random
+
+from Utils.DistractorPool import DistractorPool
+
+WORDS = [("one", "אחת"), ("two", "שתיים"), ("three", "שלוש"), ("four", "ארבע"), ("uno", "אחת")]
+
+
+def test_translations_are_distinct():
+    assert len(DistractorPool(WORDS)) == 4
+
+
+def test_sample_is_distinct_and_never_the_answer():
+    pool = DistractorPool(WORDS)
+    for _ in range(200):
+        picks = pool.sample(3, exclude="אחת")
+        assert len(picks) == len(set(picks)) == 3
+        assert "אחת" not in picks
+
+
+def test_sample_reaches_every_translation():
+    random.seed(1)
+    pool = DistractorPool(WORDS)
+    seen = set()
+    for _ in range(200):
+        seen.update(pool.sample(1, exclude="שתיים"))
+    assert seen == {"אחת", "שלוש", "ארבע"}
+
+
+def test_sample_returns_what_there_is():
+    assert sorted(DistractorPool(WORDS[:2]).sample(3, exclude="אחת")) == ["שתיים"]
+    assert DistractorPool().sample(3) == []
+
+
+def test_remove_keeps_shared_translations():
+    pool = DistractorPool(WORDS)
+
+    pool.remove("one")
+    assert len(pool) == 4  # "uno" still uses it
+    pool.remove("UNO")
+    assert len(pool) == 3
+    assert "אחת" not in pool.sample(3)
+
+
+def test_add_replaces_a_words_translation():
+    pool = DistractorPool(WORDS)
+
+    pool.add("four", "4")
+    assert sorted(pool.sample(10)) == sorted(["אחת", "שתיים", "שלוש", "4"])
@@ -0,0 +1,50 @@
+import pytest
+
+from Database.DatabaseManager import DatabaseManager
+from Utils.Scheduler import DAY_SECONDS, GRADE_GOOD
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseManager(str(tmp_path / "vocabulary.db"))
+    db.cursor.executemany(
+        "INSERT INTO vocabulary (engWord, hebWord, difficulty, due_at) VALUES (?, ?, 0, ?)",
+        [("overdue", "a", NOW - DAY_SECONDS),
+         ("new", "b", None),
+         ("later", "c", NOW + 5 * DAY_SECONDS),
+         ("soon", "d", NOW + 2 * DAY_SECONDS)]
+    )
+    db.connection.commit()
+    yield db
+    db.close_db_connection()
+
+
+def due(db, limit=None):
+    return [eng for eng, *_ in db.get_due_words(limit, now=NOW)]
+
+
+def test_due_words_come_first(db):
+    assert due(db, 2) == ["overdue", "new"]
+
+
+def test_words_not_yet_due_fill_the_rest(db):
+    assert due(db, 3) == ["overdue", "new", "soon"]
+    assert due(db) == ["overdue", "new", "soon", "later"]
+
+
+def test_record_review_reschedules(db):
+    state = db.record_review("new", GRADE_GOOD, now=NOW + 3 * DAY_SECONDS)
+
+    assert state.repetitions == 1
+    assert db.get_review_state("NEW") == state
+    # Due a day after the review: between "soon" and "later"
+    assert due(db) == ["overdue", "soon", "new", "later"]
+
+
+def test_direct_reads_see_queued_difficulty(db):
+    db.update_difficulty("new", "EASY")
+
+    assert db.get_word_details("new")[4] == "EASY"
+    assert ("new", "b", "EASY", "") in db.get_full_data().fetchall()
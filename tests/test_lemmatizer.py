@@ -0,0 +1,58 @@
+import pytest
+
+from Utils import Lemmatizer
+from Utils.Lemmatizer import inflections, lemma
+from Utils.WordMatcher import WordMatcher
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("ran", "run"),
+    ("Went", "go"),
+    ("mice", "mouse"),
+    ("children", "child"),
+    ("better", "good"),
+    ("lay", "lay"),        # A lemma itself, not only the past of lie
+    ("jumping", "jumping"),  # Regular forms are left to the rules
+])
+def test_lemma(word, expected):
+    assert lemma(word) == expected
+
+
+def test_inflections_include_irregular_and_regular_forms():
+    forms = inflections("run")
+    assert {"run", "runs", "running", "ran"} <= forms
+
+    # An irregular form keeps to itself, not its lemma's family
+    assert "ran" in inflections("ran")
+    assert not {"run", "runs", "running"} & inflections("ran")
+
+
+@pytest.mark.parametrize("word, sentence", [
+    ("bore", "Bears bear the cold."),
+    ("wound", "Wind the clock."),
+    ("more", "Many people came."),
+])
+def test_word_matcher_skips_lemma_of_irregular_form(word, sentence):
+    assert WordMatcher.find(word, sentence) is None
+
+
+@pytest.mark.parametrize("word, sentence, matched", [
+    ("run", "She ran home.", "ran"),
+    ("go", "They went away.", "went"),
+    ("mouse", "Two mice ran.", "mice"),
+    ("baby", "The babies slept.", "babies"),
+    ("make", "We are making tea.", "making"),
+])
+def test_word_matcher_finds_forms(word, sentence, matched):
+    assert WordMatcher.find(word, sentence).group() == matched
+
+
+def test_missing_data_file_falls_back_to_rules(monkeypatch, tmp_path):
+    monkeypatch.setattr(Lemmatizer, "DATA_FILE", str(tmp_path / "missing.txt"))
+    Lemmatizer._table.cache_clear()
+    try:
+        assert lemma("ran") == "ran"
+        assert "running" in inflections("run")
+    finally:
+        monkeypatch.undo()
+        Lemmatizer._table.cache_clear()
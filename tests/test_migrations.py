@@ -0,0 +1,83 @@
+import sqlite3
+
+import pytest
+
+from Database.Migrations import MIGRATIONS, run_migrations
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    """A database as created before migrations existed, with words differing only in case."""
+    connection = sqlite3.connect(str(tmp_path / "vocabulary.db"))
+    connection.execute('''CREATE TABLE vocabulary
+                       (id INTEGER PRIMARY KEY,
+                        engWord TEXT,
+                        hebWord TEXT,
+                        examples TEXT,
+                        difficulty TEXT,
+                        group_name TEXT)''')
+    connection.executemany("INSERT INTO vocabulary VALUES (?, ?, ?, ?, ?, ?)", [
+        (1, "run", "לרוץ", None, None, "Book 1"),
+        (2, "Run", "ריצה", "I run every day.", "HARD", None),
+        (3, "RUN", "לרוץ", "She ran home.", None, "Book 2"),
+        (4, "walk", "ללכת", "We walk to school.", "EASY", "Book 1"),
+    ])
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+def test_migrates_to_latest_version(baseline):
+    assert run_migrations(baseline) == MIGRATIONS[-1][0]
+    assert run_migrations(baseline) == MIGRATIONS[-1][0]  # Nothing left to apply
+
+
+def test_case_duplicates_are_merged_not_dropped(baseline, capsys):
+    run_migrations(baseline)
+
+    rows = baseline.execute("""
+        SELECT v.id, v.engWord, v.hebWord, v.examples, v.difficulty, g.name
+        FROM vocabulary v LEFT JOIN groups g ON g.id = v.group_id
+        ORDER BY v.id
+    """).fetchall()
+    assert rows == [
+        (1, "run", "לרוץ, ריצה", "I run every day.\nShe ran home.", 3, "Book 1"),
+        (4, "walk", "ללכת", "We walk to school.", 1, "Book 1"),
+    ]
+    assert "Merged duplicate words 'Run', 'RUN' into 'run' (id 1)" in capsys.readouterr().out
+
+
+def test_unique_word_index(baseline):
+    run_migrations(baseline)
+
+    with pytest.raises(sqlite3.IntegrityError):
+        baseline.execute("INSERT INTO vocabulary (engWord, difficulty) VALUES ('WALK', 0)")
+
+
+def test_group_stats_follow_changes(baseline):
+    run_migrations(baseline)
+
+    def stats():
+        return baseline.execute("""
+            SELECT g.name, s.difficulty, s.word_count, s.with_examples
+            FROM group_stats s JOIN groups g ON g.id = s.group_id
+            ORDER BY 1, 2
+        """).fetchall()
+
+    assert stats() == [("Book 1", 1, 1, 1), ("Book 1", 3, 1, 1)]
+
+    baseline.execute("UPDATE vocabulary SET difficulty = 1 WHERE id = 1")
+    baseline.execute("DELETE FROM vocabulary WHERE id = 4")
+    assert stats() == [("Book 1", 1, 1, 1)]
+
+
+def test_failed_migration_rolls_back(baseline, monkeypatch):
+    def broken(cursor):
+        cursor.execute("DELETE FROM vocabulary")
+        raise sqlite3.OperationalError("boom")
+
+    monkeypatch.setattr("Database.Migrations.MIGRATIONS", [(1, "broken", broken)])
+
+    with pytest.raises(sqlite3.OperationalError):
+        run_migrations(baseline)
+    assert baseline.execute("SELECT COUNT(*) FROM vocabulary").fetchone() == (4,)
@@ -0,0 +1,54 @@
+import sqlite3
+
+import pytest
+
+from Database import ReviewLog as review_log_module
+from Database.ReviewLog import FLUSH_INTERVAL, MODE_QUIZ, ReviewLog
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE vocabulary (id INTEGER PRIMARY KEY, engWord TEXT)")
+    connection.execute("""
+        CREATE TABLE reviews (word_id INTEGER, mode TEXT, correct INTEGER,
+                              answer TEXT, response_ms INTEGER, reviewed_at REAL)
+    """)
+    connection.execute("INSERT INTO vocabulary (engWord) VALUES ('Run')")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(review_log_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def count(connection):
+    return connection.execute("SELECT count(*) FROM reviews").fetchone()[0]
+
+
+def test_flush_if_due_writes_only_old_answers(connection, clock):
+    log = ReviewLog(connection)
+    log.add("run", MODE_QUIZ, True)
+
+    assert log.flush_if_due() == 0
+    assert count(connection) == 0
+
+    # No further answer comes in - the timer tick alone writes it
+    clock[0] += FLUSH_INTERVAL
+    assert log.flush_if_due() == 1
+    assert count(connection) == 1
+    assert len(log) == 0
+    assert log.flush_if_due() == 0
+
+
+def test_flush_keeps_answers_when_write_fails(connection, clock):
+    log = ReviewLog(connection)
+    log.add("run", MODE_QUIZ, False)
+    connection.execute("DROP TABLE reviews")
+
+    assert log.flush() == 0
+    assert len(log) == 1
@@ -0,0 +1,63 @@
+import pytest
+
+from Utils.Scheduler import (DAY_SECONDS, DEFAULT_EASE, GRADE_AGAIN, GRADE_EASY, GRADE_GOOD, GRADE_HARD,
+                             LAPSE_INTERVAL_DAYS, MIN_EASE, ReviewState, grade_answer, question_weight, schedule)
+
+NOW = 1_700_000_000.0
+
+
+def test_first_reviews_use_fixed_intervals():
+    state = schedule(ReviewState(), GRADE_GOOD, now=NOW)
+    assert (state.repetitions, state.interval_days) == (1, 1.0)
+    assert state.due_at == NOW + DAY_SECONDS
+
+    state = schedule(state, GRADE_GOOD, now=NOW)
+    assert (state.repetitions, state.interval_days) == (2, 6.0)
+
+
+def test_later_reviews_multiply_interval_by_ease():
+    state = ReviewState(ease=2.5, interval_days=6.0, repetitions=2, due_at=NOW)
+
+    after = schedule(state, GRADE_EASY, now=NOW)
+
+    assert after.ease == pytest.approx(2.6)
+    assert after.interval_days == pytest.approx(6.0 * 2.6)
+    assert after.due_at == pytest.approx(NOW + 6.0 * 2.6 * DAY_SECONDS)
+
+
+def test_ease_changes_with_grade():
+    assert schedule(ReviewState(), GRADE_EASY, now=NOW).ease == pytest.approx(DEFAULT_EASE + 0.1)
+    assert schedule(ReviewState(), GRADE_GOOD, now=NOW).ease == pytest.approx(DEFAULT_EASE)
+    assert schedule(ReviewState(), GRADE_HARD, now=NOW).ease == pytest.approx(DEFAULT_EASE - 0.14)
+
+
+def test_lapse_resets_repetitions():
+    state = ReviewState(ease=2.5, interval_days=30.0, repetitions=5, due_at=NOW)
+
+    after = schedule(state, GRADE_AGAIN, now=NOW)
+
+    assert after.repetitions == 0
+    assert after.interval_days == LAPSE_INTERVAL_DAYS
+    assert after.ease < state.ease
+
+
+def test_ease_never_drops_below_minimum():
+    state = ReviewState()
+    for _ in range(20):
+        state = schedule(state, GRADE_AGAIN, now=NOW)
+    assert state.ease == MIN_EASE
+
+
+def test_grade_answer_uses_response_time():
+    assert grade_answer(False, 100) == GRADE_AGAIN
+    assert grade_answer(True, 1000) == GRADE_EASY
+    assert grade_answer(True, 5000) == GRADE_GOOD
+    assert grade_answer(True, 9000) == GRADE_HARD
+    assert grade_answer(True, None) == GRADE_GOOD
+    assert grade_answer(True, 1000, latency_aware=False) == GRADE_GOOD
+
+
+def test_question_weight_favours_missed_and_stale_words():
+    assert question_weight(10, 8) > question_weight(10, 1)
+    assert question_weight(4, 2, last_reviewed_at=NOW - 10 * DAY_SECONDS, now=NOW) > \
+        question_weight(4, 2, last_reviewed_at=NOW, now=NOW)
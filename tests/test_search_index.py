@@ -0,0 +1,64 @@
+from Utils import SearchIndex as search_index
+from Utils.SearchIndex import SearchIndex
+
+WORDS = [
+    ("breed", "לגדל", "EASY", "Book 1"),
+    ("breeding", "גידול", "HARD", "Book 1"),
+    ("remorse", "חרטה", "MEDIUM", "Book 2"),
+    ("chore", "מטלה", "EASY", "Book 10"),
+]
+
+
+def english(rows):
+    return [row[0] for row in rows]
+
+
+def test_trigram_and_short_queries():
+    index = SearchIndex(WORDS)
+
+    assert english(index.search("reed")) == ["breed", "breeding"]
+    assert english(index.search("or")) == ["remorse", "chore"]
+    assert english(index.search("חרט")) == ["remorse"]
+    assert english(index.search("book 1")) == ["breed", "breeding", "chore"]
+    assert english(index.search("")) == english(WORDS)
+    assert index.search("xyz") == []
+
+
+def test_matches_dont_span_fields():
+    index = SearchIndex([("abc", "def", "EASY", "ghi")])
+    assert index.search("cde") == []
+
+
+def test_narrowing_query_rechecks_previous_results():
+    index = SearchIndex(WORDS)
+    index.search("bre")
+    assert english(index.search("breedi")) == ["breeding"]
+
+
+def test_add_and_remove():
+    index = SearchIndex(WORDS)
+    assert english(index.search("ore")) == ["chore"]
+
+    index.add(("more", "יותר", "NEW_WORD", ""))
+    assert english(index.search("ore")) == ["chore", "more"]
+    index.remove("Chore")
+    assert english(index.search("ore")) == ["more"]
+
+    # Re-adding re-indexes in place
+    index.add(("remorse", "חרטה", "MEDIUM", "Book 3"))
+    assert english(index.search("book 3")) == ["remorse"]
+    assert english(index.search("book 2")) == []
+
+
+def test_removed_slots_are_compacted(monkeypatch):
+    monkeypatch.setattr(search_index, "COMPACT_MIN", 4)
+    words = [(f"word{i}", "", "EASY", "") for i in range(10)]
+    index = SearchIndex(words)
+
+    for word in words[:4]:
+        index.remove(word[0])
+
+    assert len(index._rows) == 6
+    assert english(index.search("word")) == [f"word{i}" for i in range(4, 10)]
+    index.remove("word9")
+    assert english(index.search("wo")) == [f"word{i}" for i in range(4, 9)]
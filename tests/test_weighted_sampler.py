@@ -0,0 +1,91 @@
+import random
+from collections import Counter
+
+import pytest
+
+from Utils.Scheduler import question_weight
+from Utils.WeightedSampler import QuestionPicker, SessionPicker, WeightedSampler, candidate_limit
+
+
+def test_total_and_prefix_sums():
+    sampler = WeightedSampler([1.0, 2.0, 3.0, 4.0])
+
+    assert sampler.total() == pytest.approx(10.0)
+    sampler.update(2, 0.5)
+    assert sampler.total() == pytest.approx(7.5)
+    assert sampler.weight(2) == 0.5
+
+
+def test_samples_follow_weights():
+    random.seed(7)
+    sampler = WeightedSampler([1.0, 0.0, 3.0, 6.0])
+
+    counts = Counter(sampler.sample() for _ in range(20000))
+
+    assert 1 not in counts
+    assert counts[0] / 20000 == pytest.approx(0.1, abs=0.02)
+    assert counts[2] / 20000 == pytest.approx(0.3, abs=0.02)
+    assert counts[3] / 20000 == pytest.approx(0.6, abs=0.02)
+
+
+def test_pop_draws_each_item_once():
+    sampler = WeightedSampler([0.1, 5.0, 1.0, 0.0, 2.0])
+
+    drawn = [sampler.pop() for _ in range(4)]
+
+    assert sorted(drawn) == [0, 1, 2, 4]
+    assert len(sampler) == 0
+    assert sampler.pop() is None
+
+
+def test_update_after_removal():
+    sampler = WeightedSampler([1.0, 1.0])
+    sampler.update(0, 0.0)
+    assert {sampler.sample() for _ in range(50)} == {1}
+
+    sampler.update(0, 2.0)
+    assert len(sampler) == 2
+    assert sampler.total() == pytest.approx(3.0)
+
+
+def test_question_picker_requeue_and_discard():
+    picker = QuestionPicker(["Run", "walk", "go"], [1.0, 1.0, 1.0])
+    picker.discard("GO")
+
+    drawn = {picker.draw(), picker.draw()}
+    assert drawn == {"Run", "walk"}
+    assert picker.draw() is None
+
+    picker.requeue("run", 1.0)
+    assert picker.draw() == "Run"
+
+
+def test_session_picker_requeues_missed_word_below_unseen():
+    now = 1_000_000.0
+    picker = SessionPicker(["run", "walk"], {}, now=now)
+    assert picker.draw() in {"run", "walk"}
+    word = picker.draw()
+
+    picker.record_answer(word, False, now=now)
+
+    assert picker.review_summary[word] == (1, 1, now)
+    weight = picker._sampler.weight(picker._positions[word])
+    # Just missed: the recency term keeps it below a word never seen
+    assert weight == pytest.approx(question_weight(1, 1, now, now))
+    assert weight < question_weight(now=now)
+
+
+def test_session_picker_correct_or_not_requeued():
+    picker = SessionPicker(["run"], {"run": (2, 1, None)})
+    assert picker.draw() == "run"
+
+    picker.record_answer("run", True)
+    picker.record_answer("RUN", False, requeue=False)
+
+    assert picker.review_summary["run"][:2] == (4, 2)
+    assert picker.draw() is None
+
+
+def test_candidate_limit():
+    assert candidate_limit(10) == 30
+    assert candidate_limit(None) is None
@@ -0,0 +1,145 @@
+import sqlite3
+import threading
+
+import pytest
+
+from Database import WriteBehind
+from Database.WriteBehind import WriteBehindQueue
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "vocabulary.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE vocabulary (engWord TEXT, difficulty INTEGER, ease REAL)")
+    connection.executemany("INSERT INTO vocabulary VALUES (?, 0, 2.5)", [("run",), ("walk",)])
+    connection.commit()
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def failing_writes(monkeypatch):
+    """Make the next `count` writes fail (all of them if count is None)."""
+    monkeypatch.setattr(WriteBehind, "CLOSE_RETRY_DELAY", 0)
+    real_write = WriteBehindQueue.write
+    state = {"remaining": 0}
+
+    def write(connection, batch):
+        if state["remaining"] is None or state["remaining"] > 0:
+            if state["remaining"] is not None:
+                state["remaining"] -= 1
+            return False
+        return real_write(connection, batch)
+
+    monkeypatch.setattr(WriteBehindQueue, "write", staticmethod(write))
+
+    def fail(count=None):
+        state["remaining"] = count
+    return fail
+
+
+def stored(db_path, word):
+    connection = sqlite3.connect(db_path)
+    row = connection.execute("SELECT difficulty, ease FROM vocabulary WHERE engWord = ?", (word,)).fetchone()
+    connection.close()
+    return row
+
+
+def test_flush_commits_coalesced_updates(db_path):
+    queue = WriteBehindQueue(db_path, flush_interval=60)
+    queue.update("Run", difficulty=1)
+    queue.update("run", difficulty=3)
+    queue.update("run", ease=2.0)
+
+    assert queue.flush()
+    assert stored(db_path, "run") == (3, 2.0)
+    assert len(queue) == 0
+    queue.close()
+
+
+def test_failed_flush_keeps_updates_queued(db_path, failing_writes):
+    queue = WriteBehindQueue(db_path, flush_interval=60)
+    failing_writes(1)
+    queue.update("run", difficulty=3)
+
+    assert not queue.flush()
+    assert stored(db_path, "run") == (0, 2.5)
+    assert queue.pending("run") == {"difficulty": 3}
+
+    # Queued after the failure wins over the retried batch
+    queue.update("run", ease=1.5)
+    assert queue.flush()
+    assert stored(db_path, "run") == (3, 1.5)
+    queue.close()
+
+
+def test_close_retries_final_write(db_path, failing_writes):
+    queue = WriteBehindQueue(db_path, flush_interval=60)
+    failing_writes(WriteBehind.CLOSE_RETRIES - 1)
+    queue.update("walk", difficulty=2)
+
+    queue.close()
+
+    assert stored(db_path, "walk") == (2, 2.5)
+
+
+def test_close_raises_instead_of_dropping_updates(db_path, failing_writes):
+    queue = WriteBehindQueue(db_path, flush_interval=60)
+    failing_writes()
+    queue.update("walk", difficulty=2)
+
+    with pytest.raises(sqlite3.OperationalError):
+        queue.close()
+
+    assert queue.drain() == {"walk": {"difficulty": 2}}
+
+
+def test_batch_being_written_is_still_pending(db_path, monkeypatch):
+    real_write = WriteBehindQueue.write
+    started, release = threading.Event(), threading.Event()
+
+    def slow_write(connection, batch):
+        started.set()
+        release.wait(5)
+        return real_write(connection, batch)
+
+    monkeypatch.setattr(WriteBehindQueue, "write", staticmethod(slow_write))
+    queue = WriteBehindQueue(db_path, flush_interval=60)
+    queue.update("run", difficulty=3)
+
+    flusher = threading.Thread(target=queue.flush)
+    flusher.start()
+    assert started.wait(5)
+
+    # Taken by the writer, not committed yet - must still be visible
+    assert queue.pending("run") == {"difficulty": 3}
+    assert stored(db_path, "run") == (0, 2.5)
+
+    release.set()
+    flusher.join(5)
+    assert stored(db_path, "run") == (3, 2.5)
+    assert queue.pending("run") == {}
+    queue.close()
+
+
+def test_close_db_connection_writes_leftovers_itself(tmp_path, monkeypatch):
+    from Database.DatabaseManager import DatabaseManager
+
+    monkeypatch.setattr(WriteBehind, "CLOSE_RETRY_DELAY", 0)
+    db = DatabaseManager(str(tmp_path / "vocabulary.db"))
+    db.cursor.execute("INSERT INTO vocabulary (engWord, hebWord, difficulty) VALUES ('run', 'a', 0)")
+    db.connection.commit()
+
+    # Only the background connection fails
+    real_write = WriteBehindQueue.write
+    main_connection = db.connection
+    monkeypatch.setattr(WriteBehindQueue, "write", staticmethod(
+        lambda connection, batch: connection is main_connection and real_write(connection, batch)))
+
+    db.update_difficulty("run", "HARD")
+    db.close_db_connection()
+
+    connection = sqlite3.connect(str(tmp_path / "vocabulary.db"))
+    assert connection.execute("SELECT difficulty FROM vocabulary WHERE engWord = 'run'").fetchone() == (3,)
+    connection.close()